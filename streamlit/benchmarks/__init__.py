@@ -0,0 +1 @@
+from .synthetic import CorpusProfile, SyntheticCorpus
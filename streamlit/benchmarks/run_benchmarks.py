@@ -0,0 +1,253 @@
+"""
+Benchmark skala end-to-end pipeline deteksi pada korpus sintetis
+
+Contoh:
+    python -m benchmarks.run_benchmarks --sizes 10000 30000 100000
+    python -m benchmarks.run_benchmarks --compare benchmark_report_lama.json
+
+Author: PSD TUBES Team
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+import pandas as pd
+import sklearn
+from config import BENCHMARK_CONFIG
+from benchmarks.synthetic import SyntheticCorpus
+from services.pipeline import run_clean, run_detect, run_features, run_load, run_network
+
+
+def _environment() -> dict:
+    """Metadata lingkungan untuk membandingkan laporan antar versi."""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, timeout=5,
+            cwd=Path(__file__).resolve().parent
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        'git_commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'scikit_learn': sklearn.__version__,
+        'timestamp': datetime.now(timezone.utc).isoformat()
+    }
+
+
+def _skipped_network(features: dict) -> dict:
+    """Hasil network kosong saat tahap network dilewati (ukuran terlalu besar)."""
+    return {
+        'centrality_df': pd.DataFrame(columns=['author', 'degree_centrality']),
+        'network_stats': {},
+        'graph': None,
+        'rows': len(features['data']),
+        'timings': []
+    }
+
+
+def campaign_recall(user_activity: pd.DataFrame, labels: pd.DataFrame) -> dict:
+    """
+    Proporsi akun kampanye yang ditandai oleh rule-based / Isolation Forest.
+    
+    Args:
+        user_activity: Hasil deteksi
+        labels: Label author kampanye dari SyntheticCorpus
+        
+    Returns:
+        Dictionary recall rule-based (bukan Low Suspicion) dan ML
+    """
+    if labels.empty:
+        return {'rule_recall': None, 'ml_recall': None}
+    flagged = user_activity[user_activity['author'].isin(labels['author'])]
+    return {
+        'rule_recall': float((flagged['buzzer_category'] != 'Low Suspicion').sum() / len(labels)),
+        'ml_recall': float((flagged['ml_buzzer_label'] == 'Suspected Buzzer').sum() / len(labels))
+    }
+
+
+def benchmark_size(n_rows: int, seed: int, network_max_rows: int, workdir: Path) -> dict:
+    """
+    Jalankan semua tahap untuk satu ukuran korpus.
+    
+    Args:
+        n_rows: Jumlah komentar
+        seed: Seed generator
+        network_max_rows: Batas baris untuk tahap network
+        workdir: Direktori file CSV sementara
+        
+    Returns:
+        Dictionary hasil: record timing per (sub-)tahap dan metrik lain
+    """
+    generator = SyntheticCorpus(seed=seed)
+    start = time.perf_counter()
+    corpus = generator.generate(n_rows)
+    generate_seconds = time.perf_counter() - start
+    
+    path = workdir / f'synthetic_{n_rows}.csv'
+    corpus.to_csv(path, index=False)
+    
+    loaded = run_load([path])
+    cleaned = run_clean(loaded['data'])
+    features = run_features(cleaned)
+    network_skipped = len(features['data']) > network_max_rows
+    network = _skipped_network(features) if network_skipped else run_network(features)
+    detected = run_detect(features, network)
+    
+    timings = [
+        record for result in (loaded, cleaned, features, network, detected)
+        for record in result['timings']
+    ]
+    return {
+        'n_rows': n_rows,
+        'generate_seconds': generate_seconds,
+        'network_skipped': network_skipped,
+        'total_seconds': sum(r['seconds'] for r in timings if r['depth'] == 0),
+        'timings': timings,
+        'detection': campaign_recall(detected['user_activity'], generator.labels)
+    }
+
+
+def fit_scaling(results: List[dict]) -> Dict[str, dict]:
+    """
+    Fit eksponen skala seconds ~ c * rows^k per (sub-)tahap (log-log).
+    
+    Args:
+        results: Hasil benchmark_size untuk beberapa ukuran
+        
+    Returns:
+        Dictionary {stage/step: {exponent, r2, points}}
+    """
+    points: Dict[str, List] = {}
+    for result in results:
+        for record in result['timings']:
+            key = record['stage'] if record['depth'] == 0 else f"{record['stage']}/{record['step']}"
+            if record['rows'] and record['seconds'] > 0:
+                points.setdefault(key, []).append((record['rows'], record['seconds']))
+    
+    scaling = {}
+    for key, values in points.items():
+        if len({rows for rows, _ in values}) < 2:
+            continue
+        x = np.log([rows for rows, _ in values])
+        y = np.log([seconds for _, seconds in values])
+        exponent, intercept = np.polyfit(x, y, 1)
+        residual = y - (exponent * x + intercept)
+        total = ((y - y.mean()) ** 2).sum()
+        scaling[key] = {
+            'exponent': float(exponent),
+            'r2': float(1 - (residual ** 2).sum() / total) if total > 0 else 1.0,
+            'points': len(values)
+        }
+    return scaling
+
+
+def compare_reports(current: dict, baseline: dict) -> pd.DataFrame:
+    """
+    Bandingkan dua laporan: rasio waktu per tahap teratas untuk ukuran yang sama.
+    
+    Args:
+        current: Laporan baru
+        baseline: Laporan lama
+        
+    Returns:
+        DataFrame berisi n_rows, stage, seconds lama/baru, dan speedup
+    """
+    def stage_seconds(report):
+        return {
+            (result['n_rows'], record['stage']): record['seconds']
+            for result in report['results']
+            for record in result['timings'] if record['depth'] == 0
+        }
+    
+    old, new = stage_seconds(baseline), stage_seconds(current)
+    rows = [
+        {
+            'n_rows': key[0], 'stage': key[1],
+            'baseline_seconds': old[key], 'current_seconds': new[key],
+            'speedup': old[key] / new[key] if new[key] > 0 else None
+        }
+        for key in sorted(old.keys() & new.keys())
+    ]
+    return pd.DataFrame(rows)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse argumen command line."""
+    parser = argparse.ArgumentParser(description="Benchmark skala pipeline deteksi buzzer.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=BENCHMARK_CONFIG['sizes'],
+                        help="Jumlah komentar per run (default: %(default)s)")
+    parser.add_argument('--seed', type=int, default=BENCHMARK_CONFIG['seed'])
+    parser.add_argument('--network-max-rows', type=int,
+                        default=BENCHMARK_CONFIG['network_max_rows'],
+                        help="Lewati tahap network di atas ukuran ini (default: %(default)s)")
+    parser.add_argument('-o', '--output', default=BENCHMARK_CONFIG['report_path'],
+                        help="Path laporan JSON (default: %(default)s)")
+    parser.add_argument('--compare', help="Laporan JSON lama untuk dibandingkan")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Main function benchmark. Mengembalikan exit code."""
+    args = parse_args(argv)
+    network_sizes = [n for n in args.sizes if n <= args.network_max_rows]
+    if len(set(network_sizes)) < 2:
+        print(f"⚠️  Kurang dari dua ukuran <= {args.network_max_rows:,}: "
+              f"skala tahap network tidak bisa di-fit", file=sys.stderr)
+    
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for n_rows in sorted(args.sizes):
+            print(f"⏱️  {n_rows:,} komentar...", flush=True)
+            result = benchmark_size(n_rows, args.seed, args.network_max_rows, Path(workdir))
+            results.append(result)
+            stages = ', '.join(
+                f"{r['stage']} {r['seconds']:.2f}s"
+                for r in result['timings'] if r['depth'] == 0
+            )
+            skipped = ' (network dilewati)' if result['network_skipped'] else ''
+            print(f"   {stages}{skipped}")
+    
+    report = {
+        'environment': _environment(),
+        'parameters': {
+            'sizes': sorted(args.sizes),
+            'seed': args.seed,
+            'network_max_rows': args.network_max_rows,
+            'campaign': BENCHMARK_CONFIG['campaign']
+        },
+        'results': results,
+        'scaling': fit_scaling(results)
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, default=str)
+    print(f"📄 Laporan: {args.output}")
+    
+    for key, fit in sorted(report['scaling'].items()):
+        if '/' not in key:
+            print(f"   {key}: O(n^{fit['exponent']:.2f}) (r2={fit['r2']:.2f})")
+    
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            print(compare_reports(report, json.load(f)).to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
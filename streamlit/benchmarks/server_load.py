@@ -0,0 +1,112 @@
+"""
+Uji beban service scoring (server.py) lewat server loopback lokal
+
+Contoh:
+    python -m benchmarks.server_load --clients 16 --requests 20 --rows 40
+    python -m benchmarks.server_load --max-wait-ms 0   # tanpa micro-batching
+
+Author: PSD TUBES Team
+"""
+import argparse
+import http.client
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+from config import SCORING_CONFIG
+from benchmarks.synthetic import SyntheticCorpus
+from server import make_server
+from services.scoring import ScoringModel
+
+
+def client_worker(port: int, bodies: list, latencies: list, errors: list):
+    """Kirim body berurutan lewat satu koneksi keep-alive."""
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=60)
+    for body in bodies:
+        start = time.perf_counter()
+        connection.request(
+            'POST', '/score', body=body, headers={'Content-Type': 'text/csv'}
+        )
+        response = connection.getresponse()
+        payload = response.read()
+        if response.status != 200:
+            errors.append(json.loads(payload).get('error'))
+        latencies.append(time.perf_counter() - start)
+    connection.close()
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse argumen command line."""
+    parser = argparse.ArgumentParser(description="Uji beban service scoring lokal.")
+    parser.add_argument('--clients', type=int, default=16, help="Client paralel")
+    parser.add_argument('--requests', type=int, default=20, help="Request per client")
+    parser.add_argument('--rows', type=int, default=40, help="Komentar per request")
+    parser.add_argument('--reference-rows', type=int, default=5000,
+                        help="Ukuran korpus referensi sintetis")
+    parser.add_argument('--max-wait-ms', type=float, default=SCORING_CONFIG['max_wait_ms'])
+    parser.add_argument('--seed', type=int, default=42)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Main function uji beban. Mengembalikan exit code."""
+    args = parse_args(argv)
+    SCORING_CONFIG['max_wait_ms'] = args.max_wait_ms
+    
+    corpus = SyntheticCorpus(seed=args.seed)
+    reference = corpus.generate(args.reference_rows)
+    with tempfile.TemporaryDirectory() as workdir:
+        reference_path = Path(workdir) / 'reference.csv'
+        reference.to_csv(reference_path, index=False)
+        model = ScoringModel().fit([str(reference_path)])
+    
+    comments = corpus.generate(args.clients * args.requests * args.rows)
+    chunks = np.array_split(np.arange(len(comments)), args.clients * args.requests)
+    bodies = [comments.iloc[chunk].to_csv(index=False).encode('utf-8') for chunk in chunks]
+    
+    server, batcher = make_server(model, '127.0.0.1', 0)
+    port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    latencies, errors = [], []
+    threads = [
+        threading.Thread(
+            target=client_worker,
+            args=(port, bodies[i::args.clients], latencies, errors)
+        )
+        for i in range(args.clients)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    server.shutdown()
+    server.server_close()
+    batcher.stop()
+    
+    latencies_ms = np.array(latencies) * 1000
+    stats = batcher.stats
+    print(f"📨 {len(latencies)} request x {args.rows} komentar, {args.clients} client")
+    print(f"   {len(latencies) / seconds:,.0f} req/s, "
+          f"{len(latencies) * args.rows / seconds:,.0f} komentar/s")
+    print(f"   latency p50 {np.percentile(latencies_ms, 50):.0f} ms, "
+          f"p95 {np.percentile(latencies_ms, 95):.0f} ms")
+    print(f"   {stats['batches']} batch, rata-rata "
+          f"{stats['requests'] / max(stats['batches'], 1):.1f} request/batch "
+          f"(maks {stats['max_batch_requests']})")
+    if errors:
+        print(f"❌ {len(errors)} error, contoh: {errors[0]}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+"""
+Benchmark cold start: waktu import entry point di interpreter baru
+
+Gagal (exit code 1) jika median waktu import melewati budget atau jika
+dependency berat (STARTUP_CONFIG['forbidden_modules']) ikut ter-import.
+
+Contoh:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --module cli --budget 3
+
+Author: PSD TUBES Team
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from config import STARTUP_CONFIG
+
+APP_ROOT = Path(__file__).resolve().parents[1]
+
+# Dijalankan di interpreter baru; hanya statement import yang diukur
+CHILD_SCRIPT = '''
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{'seconds': seconds, 'modules': sorted(sys.modules)}}))
+'''
+
+
+def parse_importtime(stderr: str) -> Counter:
+    """
+    Jumlahkan waktu kumulatif `-X importtime` per package level atas.
+    
+    Setiap package dihitung pada import terluarnya (saat pertama kali masuk
+    dari package lain), sehingga pandas yang di-import dari main tetap
+    terlihat sebagai baris sendiri.
+    
+    Args:
+        stderr: Output stderr interpreter dengan -X importtime
+        
+    Returns:
+        Counter package -> detik
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if not cumulative.strip().isdigit():
+            continue
+        depth = len(name) - len(name.lstrip(' '))
+        entries.append((depth, name.strip().split('.')[0], int(cumulative) / 1e6))
+    
+    # importtime mencetak anak sebelum induknya; dibalik, induk muncul dulu
+    totals = Counter()
+    stack = []
+    for depth, package, seconds in reversed(entries):
+        while stack and stack[-1][0] >= depth:
+            stack.pop()
+        if not stack or stack[-1][1] != package:
+            totals[package] += seconds
+        stack.append((depth, package))
+    return totals
+
+
+def measure_once(module: str) -> Dict:
+    """
+    Import module sekali di interpreter baru.
+    
+    Args:
+        module: Nama module entry point (mis. 'main')
+        
+    Returns:
+        Dictionary berisi seconds, modules, dan importtime (Counter)
+        
+    Raises:
+        RuntimeError: Jika import gagal (mis. dependency belum terinstall)
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c',
+         CHILD_SCRIPT.format(root=str(APP_ROOT), module=module)],
+        capture_output=True, text=True, cwd=APP_ROOT
+    )
+    if result.returncode != 0:
+        errors = [
+            line for line in result.stderr.splitlines()
+            if not line.startswith('import time:')
+        ]
+        raise RuntimeError('\n'.join(errors[-5:]))
+    
+    measured = json.loads(result.stdout.strip().splitlines()[-1])
+    measured['importtime'] = parse_importtime(result.stderr)
+    return measured
+
+
+def forbidden_loaded(modules: List[str], forbidden: List[str]) -> List[str]:
+    """Package terlarang yang muncul di sys.modules."""
+    roots = {name.split('.')[0] for name in modules}
+    return sorted(roots & set(forbidden))
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse argumen command line."""
+    parser = argparse.ArgumentParser(
+        description="Ukur cold start import entry point aplikasi."
+    )
+    parser.add_argument('--module', default=STARTUP_CONFIG['module'],
+                        help="Module yang di-import (default: %(default)s)")
+    parser.add_argument('--budget', type=float,
+                        default=STARTUP_CONFIG['max_import_seconds'],
+                        help="Batas median waktu import dalam detik (default: %(default)s)")
+    parser.add_argument('--repeats', type=int, default=STARTUP_CONFIG['repeats'])
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Main function benchmark startup. Mengembalikan exit code."""
+    args = parse_args(argv)
+    
+    runs = []
+    for _ in range(args.repeats):
+        try:
+            runs.append(measure_once(args.module))
+        except RuntimeError as e:
+            print(f"❌ Import {args.module} gagal:\n{e}", file=sys.stderr)
+            return 2
+    
+    seconds = [run['seconds'] for run in runs]
+    median = statistics.median(seconds)
+    print(f"🚀 import {args.module}: median {median:.3f}s "
+          f"(min {min(seconds):.3f}s, maks {max(seconds):.3f}s, {args.repeats} run), "
+          f"budget {args.budget:.2f}s")
+    
+    # Rincian dari run median: package level atas paling lambat
+    median_run = sorted(runs, key=lambda run: run['seconds'])[len(runs) // 2]
+    print("   Import paling lambat (kumulatif):")
+    for name, package_seconds in median_run['importtime'].most_common(
+        STARTUP_CONFIG['top_imports']
+    ):
+        print(f"   {package_seconds:8.3f}s  {name}")
+    
+    failed = False
+    loaded = forbidden_loaded(median_run['modules'], STARTUP_CONFIG['forbidden_modules'])
+    if loaded:
+        print(f"❌ Dependency berat ikut ter-import saat startup: {', '.join(loaded)}",
+              file=sys.stderr)
+        failed = True
+    if median > args.budget:
+        print(f"❌ Cold start {median:.3f}s melewati budget {args.budget:.2f}s",
+              file=sys.stderr)
+        failed = True
+    
+    if failed:
+        return 1
+    print("✅ Cold start dalam budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
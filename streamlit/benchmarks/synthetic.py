@@ -0,0 +1,271 @@
+"""
+Generator korpus komentar sintetis (skema & distribusi mirip dataset asli)
+"""
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+from config import BENCHMARK_CONFIG, INDONESIAN_STOPWORDS, SLANG_NORMALIZATION
+
+DATASET_DIR = Path(__file__).resolve().parents[2] / 'dataset'
+
+FIRST_NAMES = [
+    'Adi', 'Agus', 'Ahmad', 'Ani', 'Budi', 'Dewi', 'Dian', 'Eka', 'Fajar',
+    'Fitri', 'Hendra', 'Indah', 'Joko', 'Lestari', 'Nur', 'Putri', 'Rina',
+    'Rizky', 'Sari', 'Siti', 'Tri', 'Wahyu', 'Yanti', 'Yuli'
+]
+LAST_NAMES = [
+    'Pratama', 'Saputra', 'Wijaya', 'Hidayat', 'Kusuma', 'Lestari',
+    'Nugroho', 'Permata', 'Ramadhan', 'Setiawan', 'Susanti', 'Wati'
+]
+EMOJIS = ['😂', '🤣', '😭', '😊', '🥰', '🔥', '👍', '🙏', '😅', '🤮']
+
+
+class CorpusProfile:
+    """
+    Distribusi empiris yang ditiru generator: frekuensi token (termasuk
+    emoji dan <br>), panjang komentar, likeCount, jam posting (WIB),
+    jumlah komentar per author, dan rasio teks duplikat.
+    """
+    
+    def __init__(self, tokens: np.ndarray, token_probs: np.ndarray,
+                 lengths: np.ndarray, likes: np.ndarray, hour_probs: np.ndarray,
+                 comments_per_author: np.ndarray, duplicate_rate: float,
+                 span_days: float):
+        self.tokens = tokens
+        self.token_probs = token_probs
+        self.lengths = lengths
+        self.likes = likes
+        self.hour_probs = hour_probs
+        self.comments_per_author = comments_per_author
+        self.duplicate_rate = duplicate_rate
+        self.span_days = span_days
+    
+    @classmethod
+    def from_files(cls, paths: Iterable) -> 'CorpusProfile':
+        """
+        Pelajari distribusi dari file CSV komentar.
+        
+        Args:
+            paths: Path CSV dengan skema REQUIRED_COLUMNS
+            
+        Returns:
+            CorpusProfile
+        """
+        data = pd.concat([pd.read_csv(p) for p in paths], ignore_index=True)
+        texts = data['textDisplay'].fillna('').astype(str)
+        
+        token_counts = texts.str.split().explode().dropna().value_counts()
+        published = pd.to_datetime(data['publishedAt'], utc=True, errors='coerce')
+        local_hours = ((published.dt.hour.dropna() + 7) % 24).astype(int)
+        hour_counts = np.bincount(local_hours, minlength=24).astype(np.float64)
+        
+        return cls(
+            tokens=token_counts.index.to_numpy(dtype=object),
+            token_probs=(token_counts / token_counts.sum()).to_numpy(),
+            lengths=texts.str.split().str.len().clip(lower=1).to_numpy(),
+            likes=data['likeCount'].fillna(0).astype(int).to_numpy(),
+            hour_probs=(hour_counts + 1) / (hour_counts + 1).sum(),
+            comments_per_author=data['authorDisplayName'].value_counts().to_numpy(),
+            duplicate_rate=float(texts.duplicated().mean()),
+            span_days=max(
+                1.0, (published.max() - published.min()).total_seconds() / 86400
+            )
+        )
+    
+    @classmethod
+    def default(cls) -> 'CorpusProfile':
+        """
+        Profil dari dataset bawaan, atau profil sederhana dari kamus
+        slang/stopwords jika folder dataset tidak ada.
+        
+        Returns:
+            CorpusProfile
+        """
+        paths = sorted(DATASET_DIR.glob('youtube-comments-*.csv'))
+        if paths:
+            return cls.from_files(paths)
+        
+        vocab = np.array(
+            list(INDONESIAN_STOPWORDS) + list(SLANG_NORMALIZATION) + EMOJIS,
+            dtype=object
+        )
+        ranks = np.arange(1, len(vocab) + 1, dtype=np.float64)
+        return cls(
+            tokens=vocab,
+            token_probs=(1 / ranks) / (1 / ranks).sum(),
+            lengths=np.array([1, 2, 3, 4, 4, 5, 6, 7, 9, 12, 20]),
+            likes=np.array([0] * 14 + [1]),
+            hour_probs=np.full(24, 1 / 24),
+            comments_per_author=np.array([1] * 18 + [2, 3]),
+            duplicate_rate=0.13,
+            span_days=49.0
+        )
+
+
+class SyntheticCorpus:
+    """
+    Generator korpus komentar deterministik dengan kampanye buzzer.
+    
+    Komentar organik mengikuti CorpusProfile. Kampanye buzzer adalah
+    sekelompok akun yang memposting template teks yang sama (persis atau
+    near-duplicate hasil edit token) dalam burst waktu singkat. Label author
+    kampanye tersedia di atribut labels setelah generate().
+    """
+    
+    def __init__(self, profile: Optional[CorpusProfile] = None, seed: int = None):
+        self.profile = profile or CorpusProfile.default()
+        self.seed = BENCHMARK_CONFIG['seed'] if seed is None else seed
+        self.labels = pd.DataFrame(columns=['author', 'campaign_id'])
+    
+    def _author_names(self, rng: np.random.Generator, n: int, prefix: str) -> np.ndarray:
+        """Nama akun bergaya handle YouTube, unik per indeks."""
+        first = rng.choice(FIRST_NAMES, n)
+        last = rng.choice(LAST_NAMES, n)
+        return np.array([
+            f"@{prefix}{f}{l}-{np.base_repr(i, 36).lower()}"
+            for i, (f, l) in enumerate(zip(first, last))
+        ], dtype=object)
+    
+    def _texts(self, rng: np.random.Generator, lengths: np.ndarray) -> List[str]:
+        """Teks dari token yang disampling sesuai frekuensi profil."""
+        token_ids = rng.choice(
+            len(self.profile.tokens), size=int(lengths.sum()), p=self.profile.token_probs
+        )
+        words = self.profile.tokens[token_ids]
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        return [' '.join(words[a:b]) for a, b in zip(offsets[:-1], offsets[1:])]
+    
+    def _timestamps(self, rng: np.random.Generator, n: int,
+                    start: pd.Timestamp) -> pd.DatetimeIndex:
+        """Waktu posting dengan pola jam harian (WIB) sesuai profil."""
+        days = rng.integers(0, int(np.ceil(self.profile.span_days)), n)
+        local_hours = rng.choice(24, size=n, p=self.profile.hour_probs)
+        seconds = rng.integers(0, 3600, n)
+        offsets = days * 86400 + ((local_hours - 7) % 24) * 3600 + seconds
+        return start + pd.to_timedelta(offsets, unit='s')
+    
+    def generate(self, n_rows: int, n_campaigns: int = None,
+                 campaign_share: float = None, near_duplicate_rate: float = None,
+                 burst_minutes: int = None) -> pd.DataFrame:
+        """
+        Buat korpus komentar sintetis.
+        
+        Args:
+            n_rows: Jumlah komentar total
+            n_campaigns: Jumlah kampanye buzzer
+            campaign_share: Proporsi komentar yang berasal dari kampanye
+            near_duplicate_rate: Proporsi komentar kampanye yang diedit
+                (sisanya duplikat persis template)
+            burst_minutes: Lebar jendela waktu setiap kampanye
+            
+        Returns:
+            DataFrame dengan kolom publishedAt, authorDisplayName,
+            textDisplay, likeCount (urut publishedAt menurun seperti export asli)
+        """
+        defaults = BENCHMARK_CONFIG['campaign']
+        n_campaigns = defaults['n_campaigns'] if n_campaigns is None else n_campaigns
+        campaign_share = (
+            defaults['campaign_share'] if campaign_share is None else campaign_share
+        )
+        near_duplicate_rate = (
+            defaults['near_duplicate_rate'] if near_duplicate_rate is None
+            else near_duplicate_rate
+        )
+        burst_minutes = burst_minutes or defaults['burst_minutes']
+        
+        rng = np.random.default_rng(self.seed)
+        start = pd.Timestamp('2025-09-21T00:00:00Z')
+        n_campaign_rows = int(n_rows * campaign_share) if n_campaigns else 0
+        n_organic = n_rows - n_campaign_rows
+        
+        organic = self._generate_organic(rng, n_organic, start)
+        campaigns = [
+            self._generate_campaign(
+                rng, campaign_id, size, near_duplicate_rate, burst_minutes, start
+            )
+            for campaign_id, size in enumerate(
+                np.array_split(np.arange(n_campaign_rows), max(n_campaigns, 1))
+            )
+            if len(size) > 0
+        ]
+        
+        frames = [organic] + [frame for frame, _ in campaigns]
+        self.labels = (
+            pd.concat([labels for _, labels in campaigns], ignore_index=True)
+            if campaigns else pd.DataFrame(columns=['author', 'campaign_id'])
+        )
+        
+        corpus = pd.concat(frames, ignore_index=True)
+        corpus = corpus.sort_values('publishedAt', ascending=False, kind='stable')
+        corpus['publishedAt'] = corpus['publishedAt'].dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+        return corpus.reset_index(drop=True)
+    
+    def _generate_organic(self, rng: np.random.Generator, n: int,
+                          start: pd.Timestamp) -> pd.DataFrame:
+        """Komentar organik sesuai distribusi profil."""
+        # Jumlah komentar per author dari distribusi empiris
+        counts = rng.choice(self.profile.comments_per_author, size=n)
+        n_authors = int(np.searchsorted(np.cumsum(counts), n) + 1)
+        author_ids = np.repeat(np.arange(n_authors), counts[:n_authors])[:n]
+        authors = self._author_names(rng, n_authors, '')[author_ids]
+        
+        lengths = rng.choice(self.profile.lengths, size=n)
+        texts = np.array(self._texts(rng, lengths), dtype=object)
+        
+        # Sebagian teks adalah duplikat persis teks lain (mis. "mbg", emoji)
+        duplicate = np.flatnonzero(rng.random(n) < self.profile.duplicate_rate)
+        if len(duplicate) and n > 1:
+            texts[duplicate] = texts[rng.integers(0, max(1, n // 50), len(duplicate))]
+        
+        return pd.DataFrame({
+            'publishedAt': self._timestamps(rng, n, start),
+            'authorDisplayName': authors,
+            'textDisplay': texts,
+            'likeCount': rng.choice(self.profile.likes, size=n)
+        })
+    
+    def _generate_campaign(self, rng: np.random.Generator, campaign_id: int,
+                           rows: np.ndarray, near_duplicate_rate: float,
+                           burst_minutes: int, start: pd.Timestamp):
+        """Satu kampanye buzzer: akun, template, dan burst posting."""
+        defaults = BENCHMARK_CONFIG['campaign']
+        n = len(rows)
+        n_accounts = max(2, n // defaults['comments_per_account'])
+        accounts = self._author_names(rng, n_accounts, f'c{campaign_id}')
+        
+        template_lengths = rng.integers(8, 20, defaults['n_templates'])
+        templates = self._texts(rng, template_lengths)
+        
+        texts = []
+        for template in rng.choice(templates, size=n):
+            if rng.random() < near_duplicate_rate:
+                words = template.split()
+                position = rng.integers(0, len(words))
+                edit = rng.integers(0, 3)
+                if edit == 0:
+                    words[position] = rng.choice(self.profile.tokens)
+                elif edit == 1 and len(words) > 1:
+                    del words[position]
+                else:
+                    words.insert(position, rng.choice(EMOJIS) * int(rng.integers(1, 4)))
+                template = ' '.join(words)
+            texts.append(template)
+        
+        burst_start = start + pd.Timedelta(
+            seconds=int(rng.integers(0, int(self.profile.span_days * 86400)))
+        )
+        published = burst_start + pd.to_timedelta(
+            np.sort(rng.integers(0, burst_minutes * 60, n)), unit='s'
+        )
+        authors = accounts[np.arange(n) % n_accounts]
+        
+        frame = pd.DataFrame({
+            'publishedAt': published,
+            'authorDisplayName': authors,
+            'textDisplay': texts,
+            'likeCount': rng.choice(self.profile.likes, size=n)
+        })
+        labels = pd.DataFrame({'author': accounts, 'campaign_id': campaign_id})
+        return frame, labels
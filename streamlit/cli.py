@@ -0,0 +1,239 @@
+"""
+Deteksi Buzzer - Command Line Batch Runner
+Menjalankan pipeline deteksi tanpa Streamlit untuk banyak file sekaligus
+
+Contoh:
+    python cli.py ../dataset --output-dir hasil --format parquet --workers 4
+    python cli.py "data/*.csv.gz" --merge --format csv
+
+Author: PSD TUBES Team
+"""
+import argparse
+import glob
+import hashlib
+import importlib.util
+import json
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Optional
+
+# Add current directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config import CLI_CONFIG, NETWORK_CONFIG, PROFILING_CONFIG
+from services.pipeline import run_pipeline
+
+SUMMARY_EXCLUDE = ['graph', 'author_index']
+
+
+def expand_inputs(patterns: List[str]) -> List[Path]:
+    """
+    Ubah glob / direktori / path file menjadi daftar file input.
+    
+    Args:
+        patterns: Path file, direktori, atau pola glob
+        
+    Returns:
+        Daftar file unik (urut sesuai input, lalu nama)
+    """
+    suffixes = tuple(CLI_CONFIG['input_suffixes'])
+    files = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            matches = sorted(
+                p for p in path.rglob('*')
+                if p.is_file() and p.name.lower().endswith(suffixes)
+            )
+        elif path.is_file():
+            matches = [path]
+        else:
+            matches = sorted(Path(p) for p in glob.glob(pattern, recursive=True))
+        files.extend(matches)
+    
+    # Buang duplikat tanpa mengubah urutan
+    return list(dict.fromkeys(files))
+
+
+def path_hash(files: List) -> str:
+    """Hash pendek path absolut file input (pembeda nama output)."""
+    joined = '\n'.join(str(Path(f).resolve()) for f in files)
+    return hashlib.sha1(joined.encode('utf-8')).hexdigest()[:8]
+
+
+def output_name(files: List) -> str:
+    """Nama dasar file output untuk satu job."""
+    if len(files) == 1:
+        name = Path(files[0]).name
+        for suffix in ('.gz', '.zst'):
+            name = name[:-len(suffix)] if name.endswith(suffix) else name
+        return Path(name).stem
+    # Job --merge dari input berbeda tidak saling menimpa
+    return f"merged-{path_hash(files)}"
+
+
+def output_names(jobs: List[List]) -> List[str]:
+    """
+    Nama dasar file output untuk semua job, dijamin unik.
+    
+    Job dengan nama dasar sama (stem sama di direktori berbeda, atau
+    suffix berbeda seperti a.csv dan a.jsonl) diberi akhiran hash path.
+    
+    Args:
+        jobs: List job (masing-masing list file input)
+        
+    Returns:
+        List nama dasar, urutan sama dengan jobs
+    """
+    names = [output_name(job) for job in jobs]
+    counts = Counter(names)
+    return [
+        f"{name}-{path_hash(job)}" if counts[name] > 1 else name
+        for name, job in zip(names, jobs)
+    ]
+
+
+def run_job(files: List[str], output_dir: str, fmt: str, threshold: float,
+            profile_memory: bool = False, name: Optional[str] = None) -> dict:
+    """
+    Jalankan pipeline untuk satu job dan tulis hasilnya.
+    
+    Args:
+        files: File input (satu video, atau beberapa jika --merge)
+        output_dir: Direktori output
+        fmt: 'parquet' atau 'csv'
+        threshold: Threshold similarity network
+        profile_memory: Aktifkan profiling memory tracemalloc per tahap
+        name: Nama dasar file output, default output_name(files)
+        
+    Returns:
+        Dictionary ringkasan job
+    """
+    # Di-set di dalam job karena worker bisa berupa proses baru (spawn)
+    PROFILING_CONFIG['memory'] = profile_memory
+    start = time.perf_counter()
+    paths = [Path(f) for f in files]
+    user_activity, summary = run_pipeline(paths, threshold=threshold)
+    
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    base = output_dir / (name or output_name(paths))
+    
+    if fmt == 'parquet':
+        result_path = base.with_suffix('.parquet')
+        user_activity.to_parquet(result_path, index=False)
+    else:
+        result_path = base.with_suffix('.csv')
+        user_activity.to_csv(result_path, index=False)
+    
+    job_summary = {
+        key: value for key, value in summary.items()
+        if key not in SUMMARY_EXCLUDE
+    }
+    job_summary['inputs'] = [str(p) for p in paths]
+    job_summary['output'] = str(result_path)
+    job_summary['seconds'] = round(time.perf_counter() - start, 3)
+    
+    with open(base.with_suffix('.summary.json'), 'w', encoding='utf-8') as f:
+        json.dump(job_summary, f, indent=2, ensure_ascii=False, default=str)
+    
+    return job_summary
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse argumen command line."""
+    parser = argparse.ArgumentParser(
+        description="Deteksi buzzer dari file komentar YouTube tanpa UI."
+    )
+    parser.add_argument(
+        'inputs', nargs='+',
+        help="File, direktori, atau pola glob (csv, csv.gz, csv.zst, jsonl)"
+    )
+    parser.add_argument(
+        '-o', '--output-dir', default=CLI_CONFIG['output_dir'],
+        help="Direktori output (default: %(default)s)"
+    )
+    parser.add_argument(
+        '-f', '--format', choices=['parquet', 'csv'], default=CLI_CONFIG['format'],
+        help="Format hasil (default: %(default)s, parquet butuh pyarrow)"
+    )
+    parser.add_argument(
+        '-w', '--workers', type=int, default=CLI_CONFIG['workers'],
+        help="Jumlah proses paralel (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--merge', action='store_true',
+        help="Gabungkan semua input menjadi satu analisis (seperti upload di UI)"
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=NETWORK_CONFIG['similarity_threshold'],
+        help="Threshold similarity network (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--profile-memory', action='store_true',
+        help="Catat peak memory tracemalloc & top alokasi per tahap (lebih lambat)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Main function untuk CLI. Mengembalikan exit code."""
+    args = parse_args(argv)
+    if args.format == 'parquet' and not any(
+        importlib.util.find_spec(engine) for engine in ('pyarrow', 'fastparquet')
+    ):
+        print("❌ Format parquet membutuhkan pyarrow (pip install pyarrow)", file=sys.stderr)
+        return 2
+    
+    files = expand_inputs(args.inputs)
+    if not files:
+        print("❌ Tidak ada file input yang cocok", file=sys.stderr)
+        return 2
+    
+    jobs = [files] if args.merge else [[f] for f in files]
+    jobs = [[str(f) for f in job] for job in jobs]
+    names = output_names(jobs)
+    print(f"📂 {len(files)} file, {len(jobs)} job, {args.workers} worker")
+    
+    failed = 0
+    job_args = (args.output_dir, args.format, args.threshold, args.profile_memory)
+    if args.workers <= 1 or len(jobs) == 1:
+        results = []
+        for job, name in zip(jobs, names):
+            try:
+                results.append((job, run_job(job, *job_args, name=name), None))
+            except Exception as e:
+                results.append((job, None, e))
+    else:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = {
+                executor.submit(run_job, job, *job_args, name=name): job
+                for job, name in zip(jobs, names)
+            }
+            results = []
+            for future in as_completed(futures):
+                try:
+                    results.append((futures[future], future.result(), None))
+                except Exception as e:
+                    results.append((futures[future], None, e))
+    
+    for job, summary, error in results:
+        label = ', '.join(Path(f).name for f in job)
+        if error is not None:
+            failed += 1
+            print(f"❌ {label}: {error}", file=sys.stderr)
+        else:
+            print(
+                f"✅ {label}: {summary['total_users']} user, "
+                f"{summary['high_suspicion']} high suspicion, "
+                f"{summary['seconds']:.1f}s -> {summary['output']}"
+            )
+    
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
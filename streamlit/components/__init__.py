@@ -1,3 +1,8 @@
-from .file_uploader import render_file_uploader
-from .results_display import render_results
-from .docs_page import render_docs
+from utils.lazy import lazy_exports
+
+# results_display memuat plotly/networkx; baru di-import saat hasil tampil
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'render_file_uploader': '.file_uploader',
+    'render_results': '.results_display',
+    'render_docs': '.docs_page',
+})
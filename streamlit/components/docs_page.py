@@ -63,7 +63,10 @@ def render_docs():
         |----------|-------|-----------|
         | Temporal | `posting_rate` | Jumlah komentar per jam |
         | | `time_span_hours` | Rentang waktu posting |
-        | Text | `avg_text_similarity` | Rata-rata cosine similarity antar komentar user |
+        | | `hour_entropy` | Sebaran jam posting (0 = selalu jam yang sama, 1 = merata) |
+        | | `night_ratio` | Proporsi komentar jam 00-05 WIB |
+        | | `shift_similarity` | Kemiripan jadwal posting dengan author lain (cosine histogram jam/hari) |
+        | Text | `avg_text_similarity` | Rata-rata cosine similarity (TF-IDF global) antar komentar user |
         | | `avg_text_length` | Rata-rata panjang teks |
         | | `std_text_length` | Standar deviasi panjang teks |
         | Behavioral | `comment_count` | Total komentar per user |
@@ -75,7 +78,9 @@ def render_docs():
         st.markdown("""
         **Membangun network berdasarkan text similarity:**
         
-        1. Hitung **TF-IDF** dari semua komentar
+        1. Hitung **TF-IDF** dari semua komentar (kata, atau char n-gram jika
+           `FEATURE_CONFIG['network_representation'] = 'char'` untuk
+           komentar dengan ejaan yang diplesetkan)
         2. Hitung **Cosine Similarity** antar komentar
         3. Buat **edge** jika similarity > threshold (0.3)
         4. Hitung **Degree Centrality** setiap user
@@ -111,6 +116,8 @@ def render_docs():
         | Degree Centrality | > Q75 | +1 |
         """)
     
+    st.markdown('<p style="color: #333;">Jika collapse near-duplicate aktif, kriteria tambahan <b>Avg Near-Duplicate Count &gt; 1</b> memberi +1 (dan <code>avg_near_dup_count</code> ikut menjadi fitur ML).</p>', unsafe_allow_html=True)
+    
     st.markdown('<p style="color: #333;"><b>Klasifikasi berdasarkan total skor:</b></p>', unsafe_allow_html=True)
     
     col1, col2, col3 = st.columns(3)
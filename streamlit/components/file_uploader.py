@@ -74,7 +74,7 @@ def render_file_uploader() -> Optional[List]:
             
             file = st.file_uploader(
                 f"Upload CSV Video {i + 1}",
-                type=['csv'],
+                type=['csv', 'gz', 'zst', 'jsonl'],
                 key=f"uploader_{i}",
                 label_visibility="collapsed"
             )
@@ -93,6 +93,9 @@ def render_file_uploader() -> Optional[List]:
             - `authorDisplayName` - Nama user
             - `textDisplay` - Isi komentar
             - `likeCount` - Jumlah like
+            
+            Didukung juga CSV terkompresi (`.csv.gz`, `.csv.zst`) dan
+            JSONL mentah `commentThreads` dari YouTube Data API.
             """)
     
     # Return files jika sudah sesuai jumlah
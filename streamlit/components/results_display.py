@@ -6,8 +6,9 @@ import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
+import time
 import networkx as nx
-from config import COLORS
+from config import AUTHOR_INDEX_CONFIG, COLORS, NETWORK_CONFIG
 from utils.helpers import calculate_percentage
 
 
@@ -300,7 +301,7 @@ def render_boxplot_analysis(user_activity: pd.DataFrame):
         st.plotly_chart(fig2)
 
 
-def render_top_buzzers(user_activity: pd.DataFrame):
+def render_top_buzzers(user_activity: pd.DataFrame, author_index=None):
     """Render tabel top suspected buzzers."""
     # Container dengan padding horizontal - Light Mode
     st.markdown("""
@@ -359,9 +360,56 @@ def render_top_buzzers(user_activity: pd.DataFrame):
         else:
             st.info("Tidak ada user dengan High Confidence")
     
+    if author_index is not None:
+        shown_authors = pd.concat([
+            top_rule['author'], ml_buzzers['author'], high_conf['author']
+        ]).drop_duplicates().tolist()
+        render_similar_authors(author_index, shown_authors)
+    
     st.markdown('</div>', unsafe_allow_html=True)
 
 
+def render_similar_authors(author_index, authors: list):
+    """
+    Render pencarian author dengan gaya tulisan mirip.
+    
+    Args:
+        author_index: AuthorIndex dari hasil deteksi
+        authors: Author yang bisa dipilih (baris tabel top buzzers)
+    """
+    if not authors:
+        return
+    
+    st.markdown('<h4 style="color: #333;">🔎 Cari Akun yang Mirip</h4>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        selected = st.selectbox("Pilih author dari tabel di atas", authors)
+    with col2:
+        k = st.number_input(
+            "Jumlah hasil", min_value=1, max_value=50,
+            value=AUTHOR_INDEX_CONFIG['k']
+        )
+    
+    start = time.perf_counter()
+    similar = author_index.query(selected, int(k))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    
+    if len(similar) > 0:
+        st.dataframe(
+            similar.style.background_gradient(
+                subset=['similarity'], cmap='Reds'
+            ).format({'similarity': '{:.3f}'}),
+            hide_index=True
+        )
+    else:
+        st.info("Author tidak ditemukan di index")
+    st.caption(
+        f"Cosine similarity vektor teks per author "
+        f"({len(author_index)} author, {elapsed_ms:.1f} ms)"
+    )
+
+
 def render_conclusion(user_activity: pd.DataFrame, summary: dict):
     """Render kesimpulan hasil deteksi."""
     st.markdown('<h3 style="color: #333;">📝 Kesimpulan</h3>', unsafe_allow_html=True)
@@ -438,14 +486,17 @@ def render_network_graph(user_activity: pd.DataFrame, graph: nx.Graph):
         st.info("Network graph tidak tersedia.")
         return
     
-    # Limit nodes untuk performa (max 100 nodes)
-    max_nodes = 100
+    # Limit nodes untuk performa; graph dari arsip run sudah hanya berisi
+    # nodes dengan degree tertinggi (jumlah asli di graph.graph['total_nodes'])
+    max_nodes = NETWORK_CONFIG['display_max_nodes']
+    total_nodes = graph.graph.get('total_nodes', graph.number_of_nodes())
     if graph.number_of_nodes() > max_nodes:
         # Ambil nodes dengan degree tertinggi
         degrees = dict(graph.degree())
         top_nodes = sorted(degrees.keys(), key=lambda x: degrees[x], reverse=True)[:max_nodes]
         graph = graph.subgraph(top_nodes).copy()
-        st.caption(f"⚠️ Menampilkan {max_nodes} nodes dengan koneksi tertinggi (dari {len(degrees)} total)")
+    if total_nodes > graph.number_of_nodes():
+        st.caption(f"⚠️ Menampilkan {graph.number_of_nodes()} nodes dengan koneksi tertinggi (dari {total_nodes} total)")
     
     # Get positions using spring layout
     pos = nx.spring_layout(graph, k=2, iterations=50, seed=42)
@@ -678,6 +729,6 @@ def render_results(user_activity: pd.DataFrame, summary: dict):
         render_network_graph(user_activity, graph)
         st.markdown("---")
     
-    render_top_buzzers(user_activity)
+    render_top_buzzers(user_activity, summary.get('author_index'))
     st.markdown("---")
     render_download_button(user_activity)
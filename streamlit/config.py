@@ -5,6 +5,33 @@ Konfigurasi dan konstanta untuk aplikasi Deteksi Buzzer
 # Kolom yang dibutuhkan dari CSV
 REQUIRED_COLUMNS = ['publishedAt', 'authorDisplayName', 'textDisplay', 'likeCount']
 
+# Cleaning paralel (multiprocess) untuk korpus besar
+# Worker juga mentokenisasi hasilnya (TokenCache per chunk). Hanya menguntungkan
+# jika ada core kosong: setiap worker menambah biaya start + pickling hasil,
+# dan pada mesin 1 core 2/4 worker lebih lambat dari 1 (belum diukur di
+# mesin multi-core)
+PARALLEL_CLEANING_CONFIG = {
+    'enabled': False,
+    'n_workers': None,           # None = jumlah CPU
+    'chunk_size': 50000,         # Jumlah teks unik per chunk
+    'min_texts': 100000,         # Di bawah ini tetap single-process
+    # Worker tidak di-fork dari proses Streamlit yang punya banyak thread
+    # (fork bisa mewarisi lock yang sedang dipegang thread lain)
+    'start_method': 'forkserver'     # 'forkserver' atau 'spawn'
+}
+
+# Near-duplicate collapse (SimHash 64-bit)
+NEAR_DUPLICATE_CONFIG = {
+    'enabled': False,
+    'max_distance': 6,           # Hamming distance maksimum (dari 64 bit)
+    'min_tokens': 3,             # Teks lebih pendek tidak ikut di-collapse
+    'max_bucket': 128            # Kandidat maksimum per bucket index
+}
+
+# Format publishedAt dari YouTube Data API (ISO-8601, mis. 2025-11-09T13:09:19Z)
+# %z menerima sufiks 'Z' dan tetap memakai parser ISO cepat milik pandas
+DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S%z'
+
 # Thresholds untuk rule-based detection
 THRESHOLDS = {
     'posting_rate': 2,           # Komentar per jam
@@ -12,9 +39,16 @@ THRESHOLDS = {
     'comment_count': 10,         # Jumlah komentar
     'std_text_length': 2,        # Standar deviasi panjang teks
     'duplicate_ratio': 0,        # Rasio duplikat
+    'near_dup_count': 1,         # Rata-rata ukuran grup near-duplicate
     'degree_centrality_quantile': 0.75  # Quantile untuk degree centrality
 }
 
+# Social Network Analysis
+NETWORK_CONFIG = {
+    'similarity_threshold': 0.3,     # Minimum cosine similarity untuk edge
+    'display_max_nodes': 100         # Node (degree tertinggi) di visualisasi network
+}
+
 # Skor untuk setiap kriteria
 SCORE_WEIGHTS = {
     'posting_rate': 1,
@@ -22,7 +56,8 @@ SCORE_WEIGHTS = {
     'comment_count': 1,
     'std_text_length': 1,
     'duplicate_ratio': 2,
-    'degree_centrality': 1
+    'degree_centrality': 1,
+    'near_dup_count': 1
 }
 
 # Kategori buzzer berdasarkan skor
@@ -38,6 +73,154 @@ ISOLATION_FOREST_CONFIG = {
     'n_estimators': 100
 }
 
+# Representasi teks untuk FeatureExtractor
+FEATURE_CONFIG = {
+    'mode': 'tfidf',                 # 'tfidf', 'hashing', atau 'persisted'
+    'hashing_n_features': 2 ** 18,   # Jumlah kolom hashing (memory tetap)
+    'streaming_idf': True,           # Estimasi IDF bertahap per batch
+    'char_ngram_range': (2, 4),      # Char n-gram (char_wb) untuk teks ter-obfuscate
+    'char_max_features': 20000,      # Batas kolom matrix char n-gram
+    'network_representation': 'word' # Matrix untuk SNA: 'word', 'char', atau 'embedding'
+}
+
+# Embedding dense (randomized TruncatedSVD dari TF-IDF)
+EMBEDDING_CONFIG = {
+    'enabled': False,                # Pakai embedding untuk similarity per author
+    'n_components': 64,
+    'n_iter': 5,
+    'random_state': 42
+}
+
+# State TF-IDF yang dipersist (FEATURE_CONFIG['mode'] = 'persisted')
+TFIDF_STATE_CONFIG = {
+    'path': 'models/tfidf_state.npz', # Relatif terhadap working directory
+    'ngram_range': (1, 2),
+    'max_terms': 500000,             # Term dengan DF terendah dibuang di atas ini
+    # Bloom filter baris yang sudah dihitung: 2^27 bit = 16 MB, false
+    # positive ~0.04% pada 5 juta komentar
+    'seen_filter_bits': 2 ** 27,
+    'seen_filter_hashes': 4,
+    'save': True                     # Simpan state setelah update
+}
+
+# Index pencarian author mirip (halaman hasil)
+AUTHOR_INDEX_CONFIG = {
+    'k': 10,                         # Jumlah author mirip yang ditampilkan
+    'block_size': 2048,              # Author maksimum per blok pencarian exact
+    'source': 'tfidf'                # 'tfidf' (pool per author) atau 'embedding'
+}
+
+# Fingerprint aktivitas per author (jam/hari posting)
+ACTIVITY_CONFIG = {
+    'timezone_offset_hours': 7,      # publishedAt UTC -> WIB
+    'night_hours': range(0, 5),      # Jam lokal yang dihitung sebagai "malam"
+    'min_comments': 3,               # Minimum komentar untuk pencocokan shift
+    'k': 5,                          # Jumlah author mirip per author
+    # Pencocokan shift hanya di dalam bucket jam puncak yang sama; bucket
+    # lebih besar dipecah sehingga biaya ~ n_author x max_candidates
+    'max_candidates': 2000
+}
+
+# Pencarian top-k cosine exact (utils.similarity.top_k_cosine)
+TOP_K_CONFIG = {
+    'max_block_mb': 64               # Batas memory satu blok skor (query x kandidat)
+}
+
+# Cache hasil per tahap di main.process_detection (st.cache_data/resource)
+STAGE_CACHE_CONFIG = {
+    'enabled': True,
+    'max_entries': 4,                # Entri per tahap (LRU), batasi memory server
+    'ttl_seconds': 3600              # Entri kedaluwarsa setelah 1 jam
+}
+
+# Batch runner command line (cli.py)
+CLI_CONFIG = {
+    'output_dir': 'hasil_deteksi',
+    'format': 'csv',                 # 'csv' atau 'parquet' (butuh pyarrow)
+    'workers': 1,
+    'input_suffixes': ['.csv', '.csv.gz', '.csv.zst', '.jsonl', '.ndjson',
+                       '.jsonl.gz', '.jsonl.zst']
+}
+
+# Profiling memory per tahap (tracemalloc), mahal jadi default mati
+PROFILING_CONFIG = {
+    'memory': False,                 # Aktifkan tracemalloc per tahap
+    'top_n': 10,                     # Jumlah lokasi alokasi teratas per tahap
+    'traceback_frames': 1,           # Kedalaman traceback yang disimpan
+    # Snapshot saat memory traced naik ke puncak baru (alokasi sementara
+    # yang sudah dibebaskan di akhir tahap tetap terlihat)
+    'peak_sample_ms': 20,            # Interval cek memory traced
+    'peak_snapshot_growth': 0.2      # Snapshot ulang jika puncak naik >20%
+}
+
+# Benchmark & korpus sintetis (benchmarks/)
+BENCHMARK_CONFIG = {
+    'seed': 42,
+    # Ukuran <= network_max_rows ikut mengukur (dan mem-fit) tahap network
+    'sizes': [1000, 2500, 5000, 10000, 30000, 100000],
+    'network_max_rows': 5000,        # Network O(n^2) dilewati di atas ukuran ini
+    'report_path': 'benchmark_report.json',
+    'campaign': {
+        'n_campaigns': 3,
+        'campaign_share': 0.05,      # Proporsi komentar dari kampanye buzzer
+        'comments_per_account': 8,
+        'n_templates': 5,
+        'near_duplicate_rate': 0.5,  # Sisanya duplikat persis template
+        'burst_minutes': 30
+    }
+}
+
+# Job deteksi di background (progress, ETA, pembatalan)
+PROGRESS_CONFIG = {
+    # Bobot relatif tahap untuk progress total (network dominan, O(n^2))
+    'stage_weights': {
+        'load': 5, 'clean': 10, 'features': 10,
+        'network': 50, 'detect': 20, 'index': 5
+    },
+    'similarity_tile_rows': 512,     # Baris per tile similarity network
+    'forest_chunk': 10,              # Pohon Isolation Forest per laporan progress
+    'poll_seconds': 0.5,             # Interval refresh progress di UI
+    'min_fraction_for_eta': 0.02     # ETA ditampilkan setelah progress ini
+}
+
+# Service HTTP scoring (server.py)
+SCORING_CONFIG = {
+    'host': '127.0.0.1',             # Hanya loopback secara default
+    'port': 8502,
+    'reference': ['../dataset'],     # Korpus referensi untuk state hangat
+    'max_batch_rows': 5000,          # Baris maksimum per micro-batch
+    'max_wait_ms': 10,               # Waktu tunggu mengumpulkan request
+    'max_body_mb': 20,               # Ukuran body request maksimum
+    'request_timeout_seconds': 60
+}
+
+# Budget cold start aplikasi (benchmarks/startup.py)
+STARTUP_CONFIG = {
+    'module': 'main',
+    'max_import_seconds': 2.0,       # Median waktu import di interpreter baru
+    'repeats': 5,
+    # Dependency berat yang tidak boleh ikut ter-import saat startup
+    'forbidden_modules': ['sklearn', 'scipy', 'networkx', 'plotly'],
+    'top_imports': 10
+}
+
+# Store hasil deteksi bersama antar sesi (services/result_store.py)
+RESULT_STORE_CONFIG = {
+    'max_memory_mb': 512,            # Di atas batas ini hasil LRU di-spill ke disk
+    'max_disk_mb': 4096,             # File spill tertua dihapus di atas batas ini
+    'spill_dir': None,               # None = direktori temporary
+    'graph_node_bytes': 250,         # Perkiraan memory per node/edge networkx
+    'graph_edge_bytes': 300
+}
+
+# Arsip hasil run yang bisa dimuat ulang (services/run_archive.py)
+RUN_ARCHIVE_CONFIG = {
+    'dir': 'runs',                   # Satu subdirektori per run id
+    'auto_save': True,               # Simpan setiap hasil deteksi baru dari UI
+    'max_runs': 50,                  # Run tertua dihapus di atas jumlah ini
+    'parquet_compression': 'zstd'
+}
+
 # Fitur untuk ML model
 ML_FEATURES = [
     'comment_count',
@@ -48,6 +231,9 @@ ML_FEATURES = [
     'degree_centrality'
 ]
 
+# Fitur ML tambahan saat collapse near-duplicate aktif
+NEAR_DUPLICATE_ML_FEATURES = ['avg_near_dup_count']
+
 # Custom stopwords Bahasa Indonesia
 INDONESIAN_STOPWORDS = [
     'dan', 'di', 'ke', 'dari', 'yang', 'ini', 'itu', 'untuk', 'dengan',
@@ -59,6 +245,60 @@ INDONESIAN_STOPWORDS = [
     'nggak', 'enggak', 'yg', 'yaa', 'yaaa', 'udah', 'udh', 'udahh'
 ]
 
+# Normalisasi slang Bahasa Indonesia (token -> bentuk baku)
+SLANG_NORMALIZATION = {
+    # Negasi
+    'gak': 'tidak', 'ga': 'tidak', 'gk': 'tidak', 'tdk': 'tidak',
+    'ngga': 'tidak', 'nggak': 'tidak', 'engga': 'tidak', 'enggak': 'tidak',
+    'bkn': 'bukan', 'blm': 'belum', 'belom': 'belum',
+    'jgn': 'jangan', 'jng': 'jangan',
+    # Kata ganti
+    'gw': 'saya', 'gue': 'saya', 'sy': 'saya', 'ane': 'saya', 'aq': 'aku',
+    'lu': 'kamu', 'lo': 'kamu', 'loe': 'kamu', 'elo': 'kamu',
+    'km': 'kamu', 'kmu': 'kamu', 'ente': 'kamu', 'kk': 'kakak',
+    # Kata sambung dan keterangan
+    'yg': 'yang', 'dgn': 'dengan', 'utk': 'untuk', 'krn': 'karena',
+    'karna': 'karena', 'tp': 'tapi', 'tpi': 'tapi', 'jd': 'jadi',
+    'jdi': 'jadi', 'klo': 'kalau', 'kalo': 'kalau', 'kl': 'kalau',
+    'ato': 'atau', 'atw': 'atau', 'pd': 'pada', 'dr': 'dari', 'dri': 'dari',
+    'dlm': 'dalam', 'sm': 'sama', 'ama': 'sama', 'jg': 'juga', 'jga': 'juga',
+    'aja': 'saja', 'aj': 'saja', 'sj': 'saja', 'doang': 'saja',
+    'cuma': 'hanya', 'cuman': 'hanya', 'cm': 'hanya', 'sbg': 'sebagai',
+    'spt': 'seperti', 'kyk': 'seperti', 'kayak': 'seperti', 'kek': 'seperti',
+    'ttg': 'tentang', 'tsb': 'tersebut', 'trs': 'terus', 'trus': 'terus',
+    'lg': 'lagi', 'lgi': 'lagi', 'lbh': 'lebih', 'msh': 'masih',
+    'masi': 'masih', 'bgt': 'banget', 'bngt': 'banget',
+    'bnyk': 'banyak', 'byk': 'banyak', 'emg': 'memang', 'emang': 'memang',
+    'gini': 'begini', 'gitu': 'begitu', 'gt': 'begitu', 'gtu': 'begitu',
+    'sampe': 'sampai', 'smpe': 'sampai', 'ampe': 'sampai',
+    # Waktu
+    'udah': 'sudah', 'udh': 'sudah', 'sdh': 'sudah', 'dah': 'sudah',
+    'skrg': 'sekarang', 'skrang': 'sekarang', 'ntar': 'nanti',
+    'entar': 'nanti', 'nnti': 'nanti', 'td': 'tadi', 'tdi': 'tadi',
+    'dl': 'dulu', 'dlu': 'dulu', 'kmrn': 'kemarin', 'kemaren': 'kemarin',
+    'bsk': 'besok', 'sblm': 'sebelum', 'stlh': 'setelah', 'thn': 'tahun',
+    # Kata kerja dan sifat
+    'dapet': 'dapat', 'tau': 'tahu', 'liat': 'lihat', 'lht': 'lihat',
+    'denger': 'dengar', 'pake': 'pakai', 'pakek': 'pakai', 'kasi': 'kasih',
+    'mo': 'mau', 'mao': 'mau', 'pengen': 'ingin', 'pgn': 'ingin',
+    'pingin': 'ingin', 'pengin': 'ingin', 'bs': 'bisa', 'bsa': 'bisa',
+    'hrs': 'harus', 'bener': 'benar', 'bnr': 'benar', 'mksd': 'maksud',
+    'gmn': 'bagaimana', 'gimana': 'bagaimana', 'gmna': 'bagaimana',
+    'knp': 'kenapa', 'napa': 'kenapa', 'org': 'orang', 'orng': 'orang',
+    'mantul': 'mantap', 'mantab': 'mantap', 'mantep': 'mantap',
+    'smg': 'semoga', 'smoga': 'semoga', 'aamiin': 'amin',
+    'makasih': 'terimakasih', 'mksh': 'terimakasih', 'thx': 'terimakasih'
+}
+
+# Path kamus slang tambahan (CSV "slang,baku" atau JSON), None = hanya bawaan
+SLANG_LEXICON_PATH = None
+
+# Cache hasil clean_text untuk teks yang berulang (spam)
+CLEAN_CACHE_CONFIG = {
+    'enabled': True,
+    'max_size': 200000           # Jumlah teks unik maksimum (LRU)
+}
+
 # Warna untuk visualisasi
 COLORS = {
     'high_suspicion': '#FF4B4B',
@@ -69,3 +309,9 @@ COLORS = {
     'background': '#0E1117',
     'card': '#1E1E1E'
 }
+
+# Streaming ingest (file besar / terkompresi)
+STREAM_CONFIG = {
+    'batch_size': 50000,         # Jumlah baris per batch
+    'include_replies': True      # Ikutkan balasan dari commentThreads JSONL
+}
@@ -5,20 +5,25 @@ Entry point untuk aplikasi deteksi buzzer YouTube comments
 Author: PSD TUBES Team
 """
 import streamlit as st
+import pandas as pd
 import sys
+import time
 from pathlib import Path
+from typing import Optional
 
 # Add current directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Hanya modul ringan di level atas: services.pipeline (sklearn, networkx)
+# dan components.results_display (plotly) di-import saat pertama dipakai,
+# sehingga cold start dan halaman Dokumentasi tidak membayar biayanya
+# (dijaga oleh benchmarks/startup.py)
 from components.file_uploader import render_file_uploader
-from components.results_display import render_results
 from components.docs_page import render_docs
-from services.data_loader import DataLoader
-from services.data_cleaner import DataCleaner
-from services.feature_extractor import FeatureExtractor
-from services.network_analyzer import NetworkAnalyzer
-from services.buzzer_detector import BuzzerDetector
+from config import NETWORK_CONFIG, PROGRESS_CONFIG, RUN_ARCHIVE_CONFIG, STAGE_CACHE_CONFIG
+from utils.helpers import format_duration
+from services.result_store import get_result_store
+from utils.progress import BackgroundJob
 
 
 def setup_page():
@@ -505,105 +510,384 @@ def render_main_header():
     """, unsafe_allow_html=True)
 
 
-def process_detection(files, progress_container):
+def _stage_cache(cache_func):
     """
-    Proses deteksi buzzer dari files yang diupload.
+    Decorator cache per tahap sesuai STAGE_CACHE_CONFIG.
+    
+    Argumen pertama fungsi tahap adalah kunci (hash isi upload + config);
+    argumen lain diawali underscore sehingga tidak ikut di-hash Streamlit.
+    """
+    def decorator(func):
+        if not STAGE_CACHE_CONFIG['enabled']:
+            return func
+        return cache_func(
+            max_entries=STAGE_CACHE_CONFIG['max_entries'],
+            ttl=STAGE_CACHE_CONFIG['ttl_seconds'],
+            show_spinner=False
+        )(func)
+    return decorator
+
+
+# DataFrame kecil/menengah: cache_data (disalin setiap diambil)
+@_stage_cache(st.cache_data)
+def cached_load(key: str, _files):
+    """Tahap load (cache per hash isi file)."""
+    from services.pipeline import run_load
+    return run_load(_files)
+
+
+@_stage_cache(st.cache_data)
+def cached_clean(key: str, _merged_data):
+    """Tahap cleaning (cache per kunci load + config cleaning)."""
+    from services.pipeline import run_clean
+    return run_clean(_merged_data)
+
+
+# Matrix, graph, dan index: cache_resource (dipakai bersama tanpa disalin,
+# service selalu menyalin input sehingga tidak ada yang mengubahnya)
+@_stage_cache(st.cache_resource)
+def cached_features(key: str, _cleaned):
+    """Tahap ekstraksi fitur (cache per kunci clean + FEATURE_CONFIG)."""
+    from services.pipeline import run_features
+    return run_features(_cleaned)
+
+
+@_stage_cache(st.cache_resource)
+def cached_network(key: str, _features, _threshold):
+    """Tahap SNA (cache per kunci fitur + threshold network)."""
+    from services.pipeline import run_network
+    return run_network(_features, _threshold)
+
+
+@_stage_cache(st.cache_data)
+def cached_detect(key: str, _features, _network):
+    """Tahap deteksi (cache per kunci network + THRESHOLDS/ISOLATION_FOREST_CONFIG)."""
+    from services.pipeline import run_detect
+    return run_detect(_features, _network)
+
+
+@_stage_cache(st.cache_resource)
+def cached_index(key: str, _features):
+    """Index author mirip (cache per kunci fitur)."""
+    from services.pipeline import run_index
+    return run_index(_features)
+
+
+STAGE_LABELS = {
+    'load': "📂 **Memuat data...**",
+    'clean': "🧹 **Membersihkan data...**",
+    'features': "⚙️ **Ekstraksi fitur...**",
+    'network': "🕸️ **Analisis jaringan...**",
+    'detect': "🔍 **Mendeteksi buzzer...**",
+    'index': "🧭 **Membangun index author...**",
+    'save': "💾 **Menyimpan run...**"
+}
+
+
+def save_run(result_id: str, user_activity, summary: dict, files) -> Optional[str]:
+    """
+    Simpan hasil deteksi ke arsip run (RUN_ARCHIVE_CONFIG).
+    
+    Kegagalan menyimpan (mis. pyarrow belum terinstall) tidak menggagalkan
+    deteksi; pesannya dicatat di summary['run_archive_error'].
     
     Args:
+        result_id: Kunci hasil
+        user_activity: DataFrame hasil per author
+        summary: Dictionary summary
         files: List file CSV yang diupload
-        progress_container: Container untuk progress UI
         
     Returns:
-        Tuple (user_activity DataFrame, summary dict)
+        Run id, atau None jika gagal disimpan
     """
+    from services.run_archive import RunArchive
+    
     try:
-        with progress_container:
-            # Progress UI - Light Mode
-            st.markdown("""
-            <div style="
-                background: #ffffff;
-                padding: 1.5rem;
-                border-radius: 15px;
-                border: 1px solid #e0e0e0;
-                max-width: 500px;
-                margin: 0 auto;
-                box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-            ">
-                <h4 style="color: #667eea; margin: 0 0 1rem 0; text-align: center;">
-                    ⏳ Memproses Data...
-                </h4>
-            """, unsafe_allow_html=True)
-            
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
-            st.markdown("</div>", unsafe_allow_html=True)
-            
-            # Step 1: Load data
-            status_text.markdown("📂 **Memuat data...**")
-            progress_bar.progress(10)
-            loader = DataLoader()
-            merged_data = loader.load_multiple_files(files)
-            load_stats = loader.get_stats()
-            
-            # Step 2: Clean data
-            status_text.markdown("🧹 **Membersihkan data...**")
-            progress_bar.progress(25)
-            cleaner = DataCleaner(merged_data)
-            cleaned_data = cleaner.process_all()
-            clean_stats = cleaner.get_cleaning_stats()
-            
-            # Step 3: Extract features
-            status_text.markdown("⚙️ **Ekstraksi fitur...**")
-            progress_bar.progress(40)
-            extractor = FeatureExtractor(cleaned_data)
-            featured_data = extractor.extract_all()
-            tfidf_matrix = extractor.get_tfidf_matrix()
-            
-            # Step 4: Network analysis
-            status_text.markdown("🕸️ **Analisis jaringan...**")
-            progress_bar.progress(55)
-            network = NetworkAnalyzer(featured_data, tfidf_matrix)
-            centrality_df = network.analyze(threshold=0.3)
-            network_stats = network.get_network_stats()
-            graph = network.get_graph()
-            
-            # Step 5: Detect buzzers
-            status_text.markdown("🔍 **Mendeteksi buzzer...**")
-            progress_bar.progress(75)
-            detector = BuzzerDetector(featured_data, centrality_df)
-            user_activity = detector.detect()
-            summary = detector.get_summary()
-            
-            # Add additional stats to summary
-            summary['load_stats'] = load_stats
-            summary['clean_stats'] = clean_stats
-            summary['network_stats'] = network_stats
-            summary['graph'] = graph
-            
-            # Done
-            status_text.markdown("✅ **Selesai!**")
-            progress_bar.progress(100)
+        return RunArchive().save(
+            result_id, user_activity, summary,
+            [getattr(f, 'name', str(f)) for f in files]
+        )
+    except (ImportError, OSError) as e:
+        summary['run_archive_error'] = str(e)
+        return None
+
+
+def detection_job(tracker, files, threshold: float):
+    """
+    Body job deteksi di thread background: tahap ber-cache berurutan.
+    
+    Hasil disimpan di result store bersama; jika sesi lain sudah menghitung
+    upload + config yang sama, tidak ada tahap yang dijalankan ulang. Loop
+    panjang di service (tile similarity, langkah fitur per author, pohon
+    Isolation Forest) melaporkan progress ke tracker dan berhenti dengan
+    JobCancelled saat job dibatalkan.
+    
+    Args:
+        tracker: ProgressTracker job
+        files: List file CSV yang diupload
+        threshold: Threshold similarity network
         
-        return user_activity, summary
+    Returns:
+        Result id di result store
+    """
+    from services.pipeline import build_summary, content_hash, stage_keys
+    
+    run_started = time.time()
+    keys = stage_keys(content_hash(files), threshold)
+    store = get_result_store()
+    if keys['result'] in store:
+        return keys['result']
+    
+    tracker.start_stage('load')
+    loaded = cached_load(keys['load'], files)
+    tracker.start_stage('clean')
+    cleaned = cached_clean(keys['clean'], loaded['data'])
+    tracker.start_stage('features')
+    features = cached_features(keys['features'], cleaned)
+    tracker.start_stage('network')
+    network = cached_network(keys['network'], features, threshold)
+    tracker.start_stage('detect')
+    detected = cached_detect(keys['detect'], features, network)
+    
+    # Index author mirip, dibangun ulang hanya jika fitur berubah
+    tracker.start_stage('index')
+    author_index = cached_index(keys['index'], features)
+    
+    summary = build_summary(
+        loaded, cleaned, features, network, detected, author_index, run_started
+    )
+    if RUN_ARCHIVE_CONFIG['auto_save']:
+        tracker.start_stage('save')
+        summary['run_id'] = save_run(
+            keys['result'], detected['user_activity'], summary, files
+        )
+    # Graph dan index dimiliki st.cache_resource (cached_network/cached_index):
+    # store hanya memegang weak reference, jadi tidak menahan objek yang
+    # sudah dibuang cache
+    return store.put(
+        keys['result'], detected['user_activity'], summary,
+        shared=('graph', 'author_index')
+    )
+
+
+def start_detection(files) -> BackgroundJob:
+    """
+    Mulai deteksi buzzer di background tanpa memblokir halaman.
+    
+    Args:
+        files: List file CSV yang diupload
         
-    except Exception as e:
-        st.error(f"❌ Error: {str(e)}")
-        return None, None
+    Returns:
+        BackgroundJob yang sedang berjalan
+    """
+    return BackgroundJob(
+        detection_job, files, NETWORK_CONFIG['similarity_threshold']
+    ).start()
+
+
+def render_job_progress(job: BackgroundJob):
+    """
+    Render progress job deteksi (progress nyata + ETA) dan tombol batal.
+    
+    Selama job berjalan, halaman di-refresh setiap
+    PROGRESS_CONFIG['poll_seconds']; setelah selesai, result id disimpan ke
+    session state.
+    
+    Args:
+        job: BackgroundJob deteksi
+    """
+    if not job.running:
+        st.session_state.detection_job = None
+        if job.status == 'done':
+            st.session_state.result_id = job.result
+            st.rerun()
+        elif job.status == 'cancelled':
+            st.warning("⛔ Deteksi dibatalkan.")
+        elif job.status == 'error':
+            st.error(f"❌ Error: {str(job.error)}")
+        return
+    
+    progress = job.progress()
+    
+    # Progress UI - Light Mode
+    st.markdown("""
+    <div style="
+        background: #ffffff;
+        padding: 1.5rem;
+        border-radius: 15px;
+        border: 1px solid #e0e0e0;
+        max-width: 500px;
+        margin: 0 auto;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+    ">
+        <h4 style="color: #667eea; margin: 0 0 1rem 0; text-align: center;">
+            ⏳ Memproses Data...
+        </h4>
+    """, unsafe_allow_html=True)
+    
+    st.progress(progress['fraction'])
+    
+    status = STAGE_LABELS.get(progress['stage'], "⏳ **Menyiapkan...**")
+    if progress['step']:
+        status += f" `{progress['step']}`"
+    st.markdown(status)
+    
+    eta = (
+        format_duration(progress['eta_seconds'])
+        if progress['eta_seconds'] is not None else '-'
+    )
+    st.caption(
+        f"{progress['fraction'] * 100:.0f}% · berjalan "
+        f"{format_duration(progress['elapsed_seconds'])} · perkiraan sisa {eta}"
+    )
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        if job.tracker.cancelled:
+            st.info("Membatalkan...")
+        elif st.button("⛔ Batalkan", use_container_width=True):
+            job.cancel()
+    
+    time.sleep(PROGRESS_CONFIG['poll_seconds'])
+    st.rerun()
+
+
+def load_run(archive, run_id: str):
+    """
+    Muat run dari arsip ke result store dan tampilkan di sesi ini.
+    
+    Args:
+        archive: RunArchive
+        run_id: Id run yang dipilih
+    """
+    started = time.perf_counter()
+    # Run dari arsip memuat graph terpotong (node yang ditampilkan saja),
+    # jadi disimpan dengan kunci sendiri, bukan result id hasil deteksi
+    # penuh yang dipakai detection_job
+    result_id = f"run-{run_id}"
+    try:
+        store = get_result_store()
+        if result_id not in store:
+            user_activity, summary = archive.load(run_id)
+            store.put(result_id, user_activity, summary)
+    except (ImportError, OSError, ValueError) as e:
+        st.error(f"❌ Gagal memuat run: {str(e)}")
+        return
+    
+    st.session_state.result_id = result_id
+    st.success(f"✅ Run {run_id} dimuat dalam {time.perf_counter() - started:.2f}s")
+
+
+def render_previous_runs():
+    """Render pilihan memuat hasil run sebelumnya tanpa menjalankan deteksi."""
+    from services.run_archive import RunArchive
+    
+    archive = RunArchive()
+    runs = archive.list_runs()
+    if not runs:
+        return
+    
+    with st.expander("📂 Muat Run Sebelumnya", expanded=False):
+        labels = {
+            run['run_id']: (
+                f"{time.strftime('%d-%m-%Y %H:%M', time.localtime(run['created_at']))}"
+                f" · {', '.join(run['sources']) or '-'} · {run['total_users']:,} user"
+            )
+            for run in runs
+        }
+        selected = st.selectbox("Run", options=list(labels), format_func=labels.get)
+        if st.button("📂 Muat Run", use_container_width=True):
+            load_run(archive, selected)
+
+
+def render_stage_timings(summary: dict):
+    """
+    Render tabel waktu, throughput, dan peak memory per tahap.
+    
+    Args:
+        summary: Dictionary ringkasan (berisi stage_timings)
+    """
+    timings = summary.get('stage_timings', [])
+    if not timings:
+        return
+    
+    cached = set(summary.get('cached_stages', []))
+    rows = []
+    for record in timings:
+        row = {
+            'Tahap': ('↳ ' if record['depth'] else '') + record['step'],
+            'Waktu (s)': round(record['seconds'], 3),
+            'Baris/detik': (
+                f"{record['rows_per_sec']:,.0f}" if record['rows_per_sec'] else '-'
+            ),
+            'RSS akhir (MB)': (
+                round(record['rss_mb'], 1)
+                if record.get('rss_mb') is not None else '-'
+            ),
+            'Kenaikan peak RSS (MB)': (
+                round(record['peak_growth_mb'], 1)
+                if record['peak_growth_mb'] is not None else '-'
+            ),
+            'Cache': '✅' if record['stage'] in cached else ''
+        }
+        if 'traced_peak_mb' in record:
+            row['Peak tracemalloc (MB)'] = round(record['traced_peak_mb'], 2)
+        rows.append(row)
+    
+    st.markdown("**Waktu per tahap:**")
+    st.dataframe(pd.DataFrame(rows), hide_index=True)
+    
+    allocations = [
+        {
+            'Tahap': record['stage'],
+            'Sub-tahap saat peak': record.get('peak_step', record['stage']),
+            'Lokasi': site['site'],
+            'Memory (MB)': round(site['size_mb'], 2),
+            'Jumlah blok': site['count']
+        }
+        for record in timings
+        for site in record.get('top_allocations', [])
+    ]
+    if allocations:
+        st.markdown("**Lokasi alokasi terbesar saat peak per tahap (tracemalloc):**")
+        st.dataframe(pd.DataFrame(allocations), hide_index=True)
+    
+    if any(record.get('memory_skipped') for record in timings):
+        st.caption(
+            "Profiling memory dilewati untuk sebagian tahap: tracemalloc "
+            "sedang dipakai sesi lain"
+        )
+    
+    st.caption(
+        "RSS akhir: memory proses saat tahap selesai. Kenaikan peak RSS: "
+        "seberapa jauh tahap menaikkan high-water mark proses (0 jika "
+        "tahap tidak melewati peak sebelumnya, termasuk dari sesi lain)"
+    )
+    
+    total = sum(r['seconds'] for r in timings if r['depth'] == 0)
+    st.caption(
+        f"Total {total:.2f} s (waktu saat tahap dihitung; tahap bertanda ✅ "
+        f"diambil dari cache pada run ini)"
+    )
 
 
 def render_main_feature():
     """Render halaman main feature (deteksi buzzer)."""
     render_main_header()
     
-    # Initialize session state
-    if 'results' not in st.session_state:
-        st.session_state.results = None
-    if 'summary' not in st.session_state:
-        st.session_state.summary = None
+    # Initialize session state: sesi hanya menyimpan result id, hasilnya
+    # dipakai bersama lewat result store
+    if 'result_id' not in st.session_state:
+        st.session_state.result_id = None
+    
+    # Hasil run sebelumnya dari arsip (tanpa menghitung ulang)
+    render_previous_runs()
     
     # File upload section
     uploaded_files = render_file_uploader()
+    job = st.session_state.get('detection_job')
     
     # Detection button
     st.markdown("<br>", unsafe_allow_html=True)
@@ -612,27 +896,27 @@ def render_main_feature():
     with col2:
         detect_button = st.button(
             "🚀 Deteksi Buzzer",
-            disabled=uploaded_files is None,
+            disabled=uploaded_files is None or (job is not None and job.running),
             use_container_width=True
         )
     
-    # Process detection
-    if detect_button and uploaded_files:
-        # Container untuk progress
-        progress_container = st.empty()
-        
-        results, summary = process_detection(uploaded_files, progress_container)
-        
-        # Clear progress setelah selesai
-        progress_container.empty()
-        
-        if results is not None:
-            st.session_state.results = results
-            st.session_state.summary = summary
-            st.rerun()
+    # Process detection di background; halaman tetap responsif
+    if detect_button and uploaded_files and (job is None or not job.running):
+        job = st.session_state.detection_job = start_detection(uploaded_files)
+    
+    if job is not None:
+        render_job_progress(job)
+    
+    stored = None
+    if st.session_state.result_id is not None:
+        stored = get_result_store().get(st.session_state.result_id)
+        if stored is None:
+            st.session_state.result_id = None
+            st.info("ℹ️ Hasil sebelumnya sudah tidak tersedia. Jalankan deteksi lagi.")
     
     # Display results
-    if st.session_state.results is not None:
+    if stored is not None:
+        user_activity, summary = stored
         st.markdown("---")
         st.markdown("<br>", unsafe_allow_html=True)
         
@@ -643,24 +927,59 @@ def render_main_feature():
             with col1:
                 st.metric(
                     "Total Komentar",
-                    st.session_state.summary['load_stats']['total_rows']
+                    summary['load_stats']['total_rows']
                 )
             with col2:
                 st.metric(
                     "Duplikat Dihapus",
-                    st.session_state.summary['clean_stats']['duplicates_removed']
+                    summary['clean_stats']['duplicates_removed']
                 )
             with col3:
                 st.metric(
                     "Network Edges",
-                    st.session_state.summary['network_stats'].get('edges', 0)
+                    summary['network_stats'].get('edges', 0)
+                )
+            
+            coerced = summary['clean_stats'].get('datetime_coerced', 0)
+            if coerced:
+                st.warning(
+                    f"⚠️ {coerced} baris memiliki publishedAt yang tidak valid "
+                    f"(NaT) dan tidak ikut dihitung pada posting rate."
+                )
+            
+            render_stage_timings(summary)
+            
+            store_info = get_result_store().get_info()
+            st.caption(
+                f"Result store bersama: {store_info['in_memory']} hasil di memory "
+                f"({store_info['memory_mb']:.1f} MB), {store_info['on_disk']} di disk "
+                f"({store_info['disk_mb']:.1f} MB)"
+            )
+            if summary.get('run_id'):
+                st.caption(f"💾 Tersimpan sebagai run `{summary['run_id']}`")
+            elif summary.get('run_archive_error'):
+                st.caption(f"⚠️ Run tidak disimpan: {summary['run_archive_error']}")
+            
+            feature_memory = summary.get('feature_memory', {})
+            if feature_memory:
+                st.markdown("**Memory representasi teks:**")
+                st.dataframe(
+                    pd.DataFrame([
+                        {
+                            'Representasi': name,
+                            'Shape': f"{info['shape'][0]} x {info['shape'][1]}",
+                            'Non-zero': info['nnz'],
+                            'Dtype': info['dtype'],
+                            'Memory (MB)': round(info['bytes'] / 1024 ** 2, 2)
+                        }
+                        for name, info in feature_memory.items()
+                    ]),
+                    hide_index=True
                 )
         
-        # Render main results
-        render_results(
-            st.session_state.results,
-            st.session_state.summary
-        )
+        # Render main results (plotly dimuat di sini, bukan saat startup)
+        from components.results_display import render_results
+        render_results(user_activity, summary)
 
 
 def main():
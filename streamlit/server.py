@@ -0,0 +1,227 @@
+"""
+Deteksi Buzzer - HTTP Scoring Service
+Endpoint lokal untuk scoring batch komentar tanpa UI Streamlit
+
+Contoh:
+    python server.py --reference ../dataset --port 8502
+    curl -X POST localhost:8502/score -H "Content-Type: text/csv" --data-binary @komentar.csv
+    curl -X POST localhost:8502/score -d '{"comments": [{"publishedAt": ..., ...}]}'
+
+Author: PSD TUBES Team
+"""
+import argparse
+import io
+import json
+import sys
+import time
+from concurrent.futures import TimeoutError as FutureTimeout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import List, Tuple
+
+# Add current directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+import numpy as np
+import pandas as pd
+from cli import expand_inputs
+from config import NETWORK_CONFIG, SCORING_CONFIG
+from services.scoring import MicroBatcher, ScoringModel
+
+
+class RequestError(Exception):
+    """Request tidak valid; status adalah kode HTTP yang dikirim."""
+    
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def _json_default(value):
+    """Konversi nilai numpy/pandas yang tidak dikenal json."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    return str(value)
+
+
+def parse_comments(body: bytes, content_type: str) -> pd.DataFrame:
+    """
+    Ubah body request (JSON atau CSV) menjadi DataFrame komentar.
+    
+    JSON boleh berupa list komentar atau object {"comments": [...]}.
+    
+    Args:
+        body: Body request mentah
+        content_type: Header Content-Type
+        
+    Returns:
+        DataFrame komentar
+        
+    Raises:
+        RequestError: Jika body tidak bisa dibaca
+    """
+    content_type = (content_type or '').split(';')[0].strip().lower()
+    try:
+        if content_type in ('text/csv', 'application/csv'):
+            return pd.read_csv(io.BytesIO(body))
+        payload = json.loads(body or b'null')
+    except (ValueError, pd.errors.ParserError) as e:
+        raise RequestError(400, f"Body tidak valid: {e}")
+    
+    if isinstance(payload, dict):
+        payload = payload.get('comments')
+    if not isinstance(payload, list) or not payload:
+        raise RequestError(400, "Body harus list komentar atau {\"comments\": [...]}")
+    return pd.DataFrame(payload)
+
+
+def make_handler(batcher: MicroBatcher, model: ScoringModel, verbose: bool = False):
+    """
+    Buat class handler HTTP yang terikat ke batcher dan model.
+    
+    Args:
+        batcher: MicroBatcher yang sudah berjalan
+        model: ScoringModel (untuk endpoint health)
+        verbose: Log setiap request ke stderr
+        
+    Returns:
+        Subclass BaseHTTPRequestHandler
+    """
+    max_body = SCORING_CONFIG['max_body_mb'] * 1024 ** 2
+    timeout = SCORING_CONFIG['request_timeout_seconds']
+    
+    class ScoringHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        
+        def _send_json(self, status: int, payload: dict):
+            body = json.dumps(payload, default=_json_default).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def do_GET(self):
+            if self.path != '/health':
+                self._send_json(404, {'error': 'Endpoint tidak ditemukan'})
+                return
+            self._send_json(200, {
+                'status': 'ok', 'model': model.get_info(), 'batching': batcher.stats
+            })
+        
+        def do_POST(self):
+            if self.path != '/score':
+                self._send_json(404, {'error': 'Endpoint tidak ditemukan'})
+                return
+            try:
+                # Tolak nilai negatif/bukan angka (int() menerima '-1')
+                length = (self.headers.get('Content-Length') or '0').strip()
+                if not length.isdigit():
+                    raise RequestError(400, "Content-Length tidak valid")
+                length = int(length)
+                if length > max_body:
+                    raise RequestError(413, "Body terlalu besar")
+                frame = parse_comments(
+                    self.rfile.read(length), self.headers.get('Content-Type')
+                )
+                try:
+                    model.validate(frame)
+                except ValueError as e:
+                    raise RequestError(400, str(e))
+                
+                start = time.perf_counter()
+                result = batcher.submit(frame).result(timeout=timeout)
+                result['seconds'] = time.perf_counter() - start
+                self._send_json(200, result)
+            except RequestError as e:
+                self._send_json(e.status, {'error': str(e)})
+            except FutureTimeout:
+                self._send_json(503, {'error': 'Timeout menunggu scoring'})
+            except Exception as e:
+                self._send_json(500, {'error': str(e)})
+        
+        def log_message(self, format, *args):
+            if verbose:
+                super().log_message(format, *args)
+    
+    return ScoringHandler
+
+
+def make_server(model: ScoringModel, host: str = None, port: int = None,
+                verbose: bool = False) -> Tuple[ThreadingHTTPServer, MicroBatcher]:
+    """
+    Siapkan server HTTP + micro-batcher untuk model yang sudah di-fit.
+    
+    Port 0 memilih port bebas (server.server_address), berguna untuk uji
+    lewat loopback.
+    
+    Args:
+        model: ScoringModel yang sudah di-fit
+        host: Alamat bind, default SCORING_CONFIG['host']
+        port: Port, default SCORING_CONFIG['port']
+        verbose: Log setiap request
+        
+    Returns:
+        Tuple (server, batcher); jalankan server.serve_forever()
+    """
+    batcher = MicroBatcher(model.score_batch).start()
+    server = ThreadingHTTPServer(
+        (host or SCORING_CONFIG['host'],
+         SCORING_CONFIG['port'] if port is None else port),
+        make_handler(batcher, model, verbose)
+    )
+    server.daemon_threads = True
+    return server, batcher
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse argumen command line."""
+    parser = argparse.ArgumentParser(
+        description="Service HTTP lokal untuk scoring komentar buzzer."
+    )
+    parser.add_argument(
+        '-r', '--reference', nargs='+', default=SCORING_CONFIG['reference'],
+        help="Korpus referensi untuk fit model (default: %(default)s)"
+    )
+    parser.add_argument('--host', default=SCORING_CONFIG['host'])
+    parser.add_argument('-p', '--port', type=int, default=SCORING_CONFIG['port'])
+    parser.add_argument(
+        '--threshold', type=float, default=NETWORK_CONFIG['similarity_threshold'],
+        help="Threshold similarity network (default: %(default)s)"
+    )
+    parser.add_argument('-v', '--verbose', action='store_true', help="Log setiap request")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    """Main function service. Mengembalikan exit code."""
+    args = parse_args(argv)
+    files: List[Path] = expand_inputs(args.reference)
+    if not files:
+        print("❌ Tidak ada file korpus referensi yang cocok", file=sys.stderr)
+        return 2
+    
+    start = time.perf_counter()
+    model = ScoringModel(args.threshold).fit([str(f) for f in files])
+    print(
+        f"🧠 Model di-fit dari {model.reference_rows:,} komentar "
+        f"({len(files)} file) dalam {time.perf_counter() - start:.1f}s"
+    )
+    
+    server, batcher = make_server(model, args.host, args.port, args.verbose)
+    host, port = server.server_address[:2]
+    print(f"🚀 Scoring service di http://{host}:{port} (POST /score, GET /health)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        batcher.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
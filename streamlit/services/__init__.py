@@ -1,5 +1,22 @@
-from .data_loader import DataLoader
-from .data_cleaner import DataCleaner
-from .feature_extractor import FeatureExtractor
-from .network_analyzer import NetworkAnalyzer
-from .buzzer_detector import BuzzerDetector
+from utils.lazy import lazy_exports
+
+# Submodule di-import saat nama pertama kali diakses, sehingga halaman yang
+# tidak menjalankan pipeline tidak memuat sklearn/networkx
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'DataLoader': '.data_loader',
+    'StreamReader': '.stream_reader',
+    'HashingFeatureModel': '.hashing_features',
+    'TfidfState': '.tfidf_state',
+    'AuthorEmbedder': '.embedding',
+    'AuthorIndex': '.author_index',
+    'ActivityProfiler': '.activity_profile',
+    'DataCleaner': '.data_cleaner',
+    'FeatureExtractor': '.feature_extractor',
+    'NetworkAnalyzer': '.network_analyzer',
+    'BuzzerDetector': '.buzzer_detector',
+    'MicroBatcher': '.scoring',
+    'ScoringModel': '.scoring',
+    'ResultStore': '.result_store',
+    'get_result_store': '.result_store',
+    'RunArchive': '.run_archive',
+})
@@ -0,0 +1,214 @@
+"""
+Service fingerprint aktivitas per author (jam & hari posting)
+"""
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import normalize
+from config import ACTIVITY_CONFIG
+from utils.similarity import top_k_cosine
+
+HOUR_BINS = 24
+WEEKDAY_BINS = 7
+N_BINS = HOUR_BINS + WEEKDAY_BINS
+
+
+class ActivityProfiler:
+    """
+    Histogram jam (24 bin) dan hari (7 bin) posting per author.
+    
+    Kedua histogram diisi dengan satu np.bincount atas kode gabungan
+    (author, bin), jadi biayanya linear terhadap jumlah komentar. Dari
+    histogram diturunkan entropy aktivitas, rasio posting malam, dan
+    pencocokan fingerprint antar author (akun yang "satu shift").
+    
+    Pencocokan fingerprint hanya membandingkan author dengan jam puncak
+    yang sama, dengan kandidat per bucket dibatasi
+    ACTIVITY_CONFIG['max_candidates'], sehingga biayanya linear terhadap
+    jumlah author (bukan kuadratik).
+    """
+    
+    def __init__(self, data: pd.DataFrame, authors: Optional[pd.Index] = None):
+        self.data = data
+        self.authors = (
+            pd.Index(authors) if authors is not None
+            else pd.Index(sorted(data['authorDisplayName'].unique()))
+        )
+        self.histograms = None
+    
+    def build_histograms(self) -> 'ActivityProfiler':
+        """
+        Hitung histogram jam dan hari per author (waktu lokal).
+        
+        Returns:
+            Self untuk method chaining
+        """
+        local_time = self.data['publishedAt'] + pd.Timedelta(
+            hours=ACTIVITY_CONFIG['timezone_offset_hours']
+        )
+        codes = self.authors.get_indexer(self.data['authorDisplayName'])
+        valid = (codes >= 0) & local_time.notna().to_numpy()
+        
+        codes = codes[valid].astype(np.int64)
+        hours = local_time.dt.hour.to_numpy()[valid].astype(np.int64)
+        weekdays = local_time.dt.dayofweek.to_numpy()[valid].astype(np.int64)
+        
+        # Satu bincount: bin 0-23 = jam, 24-30 = hari
+        combined = np.concatenate([
+            codes * N_BINS + hours,
+            codes * N_BINS + HOUR_BINS + weekdays
+        ])
+        counts = np.bincount(combined, minlength=len(self.authors) * N_BINS)
+        self.histograms = counts.reshape(len(self.authors), N_BINS)
+        return self
+    
+    def hour_histograms(self) -> np.ndarray:
+        """Histogram jam posting (n_author x 24)."""
+        return self.histograms[:, :HOUR_BINS]
+    
+    def weekday_histograms(self) -> np.ndarray:
+        """Histogram hari posting (n_author x 7, 0 = Senin)."""
+        return self.histograms[:, HOUR_BINS:]
+    
+    def calculate_features(self) -> pd.DataFrame:
+        """
+        Fitur aktivitas per author dari histogram.
+        
+        - hour_entropy: entropy distribusi jam, dinormalisasi ke [0, 1]
+          (0 = selalu di jam yang sama, 1 = merata 24 jam)
+        - night_ratio: proporsi komentar pada ACTIVITY_CONFIG['night_hours']
+        - peak_hour: jam lokal dengan komentar terbanyak
+        
+        Returns:
+            DataFrame berisi author dan fitur aktivitas
+        """
+        if self.histograms is None:
+            self.build_histograms()
+        
+        hours = self.hour_histograms().astype(np.float64)
+        totals = hours.sum(axis=1)
+        safe_totals = np.where(totals > 0, totals, 1)
+        probs = hours / safe_totals[:, None]
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            log_probs = np.where(probs > 0, np.log2(probs), 0.0)
+        entropy = np.clip(
+            -(probs * log_probs).sum(axis=1) / np.log2(HOUR_BINS), 0.0, 1.0
+        )
+        
+        night_hours = list(ACTIVITY_CONFIG['night_hours'])
+        night_ratio = hours[:, night_hours].sum(axis=1) / safe_totals
+        
+        return pd.DataFrame({
+            'author': self.authors,
+            'hour_entropy': entropy,
+            'night_ratio': night_ratio,
+            'peak_hour': hours.argmax(axis=1)
+        })
+    
+    def get_fingerprints(self) -> np.ndarray:
+        """
+        Fingerprint ter-normalisasi: blok jam dan blok hari masing-masing
+        dinormalisasi l2 lalu diberi bobot sama.
+        
+        Returns:
+            Array float32 (n_author x 31)
+        """
+        if self.histograms is None:
+            self.build_histograms()
+        
+        hours = normalize(self.hour_histograms().astype(np.float32))
+        weekdays = normalize(self.weekday_histograms().astype(np.float32))
+        return normalize(np.hstack([hours, weekdays]))
+    
+    def candidate_buckets(self, members: np.ndarray,
+                          max_candidates: int = None) -> List[np.ndarray]:
+        """
+        Bagi author menjadi bucket kandidat pencocokan shift.
+        
+        Author di-bucket menurut jam puncak; bucket yang lebih besar dari
+        max_candidates diurutkan menurut hari puncak lalu dipecah menjadi
+        potongan yang hampir sama besar.
+        
+        Args:
+            members: Indeks author (baris histogram)
+            max_candidates: Ukuran bucket maksimum, default ACTIVITY_CONFIG
+            
+        Returns:
+            List array indeks author per bucket
+        """
+        max_candidates = max_candidates or ACTIVITY_CONFIG['max_candidates']
+        peak_hours = self.hour_histograms()[members].argmax(axis=1)
+        peak_days = self.weekday_histograms()[members].argmax(axis=1)
+        order = np.lexsort((peak_days, peak_hours))
+        members, peak_hours = members[order], peak_hours[order]
+        
+        buckets = []
+        bounds = np.flatnonzero(np.diff(peak_hours)) + 1
+        for bucket in np.split(members, bounds):
+            n_parts = -(-len(bucket) // max_candidates)
+            buckets.extend(np.array_split(bucket, n_parts))
+        return buckets
+    
+    def find_shift_matches(self, k: int = None, min_comments: int = None,
+                           groups: Optional[np.ndarray] = None,
+                           max_candidates: int = None) -> pd.DataFrame:
+        """
+        Top-k author dengan fingerprint jadwal paling mirip (cosine).
+        
+        Hanya author dengan minimal min_comments komentar yang dibandingkan,
+        karena author dengan 1-2 komentar selalu terlihat "identik".
+        Pasangan dicari di dalam bucket jam puncak (candidate_buckets).
+        
+        Args:
+            k: Jumlah pasangan per author, default ACTIVITY_CONFIG['k']
+            min_comments: Minimum komentar, default ACTIVITY_CONFIG
+            groups: Grup per author (sejajar self.authors); pasangan hanya
+                dicari di dalam grup yang sama
+            max_candidates: Ukuran bucket maksimum, default ACTIVITY_CONFIG
+            
+        Returns:
+            DataFrame berisi author, match_author, dan shift_similarity
+        """
+        k = k or ACTIVITY_CONFIG['k']
+        if min_comments is None:
+            min_comments = ACTIVITY_CONFIG['min_comments']
+        
+        fingerprints = self.get_fingerprints()
+        active = np.flatnonzero(self.hour_histograms().sum(axis=1) >= min_comments)
+        if groups is None:
+            partitions = [active]
+        else:
+            active_groups = np.asarray(groups)[active]
+            partitions = [active[active_groups == g] for g in pd.unique(active_groups)]
+        
+        matches = []
+        for members in (
+            bucket for partition in partitions
+            for bucket in self.candidate_buckets(partition, max_candidates)
+        ):
+            if len(members) < 2:
+                continue
+            member_fingerprints = fingerprints[members]
+            indices, scores = top_k_cosine(
+                member_fingerprints, member_fingerprints, k,
+                exclude=np.arange(len(members))
+            )
+            
+            valid = np.isfinite(scores)
+            query_rows = np.repeat(members, indices.shape[1]).reshape(indices.shape)
+            matches.append(pd.DataFrame({
+                'author': self.authors[query_rows[valid]],
+                'match_author': self.authors[members[indices[valid]]],
+                'shift_similarity': scores[valid]
+            }))
+        
+        if not matches:
+            # Dtype eksplisit supaya shift_similarity tetap float setelah merge
+            return pd.DataFrame({
+                'author': pd.Series(dtype=object),
+                'match_author': pd.Series(dtype=object),
+                'shift_similarity': pd.Series(dtype=np.float64)
+            })
+        return pd.concat(matches, ignore_index=True)
@@ -0,0 +1,159 @@
+"""
+Service index nearest-neighbour author ("cari akun yang mirip")
+"""
+from pathlib import Path
+from typing import List, Union
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix, issparse
+from config import AUTHOR_INDEX_CONFIG
+from utils.similarity import group_indicator, top_k_cosine
+
+
+class AuthorIndex:
+    """
+    Index pencarian author dengan gaya tulisan mirip.
+    
+    Setiap author direpresentasikan satu vektor ter-normalisasi (TF-IDF
+    komentar yang di-pool, atau embedding author). Pencarian exact dengan
+    dot product per blok, cukup cepat untuk ribuan author tanpa struktur
+    index tambahan. Index dibangun sekali per hasil deteksi.
+    """
+    
+    def __init__(self, authors: List[str], vectors, normalized: bool = False):
+        self.authors = list(authors)
+        self.author_index = {author: i for i, author in enumerate(self.authors)}
+        if not normalized:
+            # sklearn baru dimuat di sini, bukan saat index dimuat dari file
+            from sklearn.preprocessing import normalize
+            vectors = normalize(vectors)
+        self.vectors = vectors
+    
+    @classmethod
+    def from_features(cls, data: pd.DataFrame, matrix) -> 'AuthorIndex':
+        """
+        Bangun index dari matrix fitur per komentar (di-pool per author).
+        
+        Args:
+            data: DataFrame komentar (baris sejajar dengan matrix)
+            matrix: Matrix fitur per komentar (TF-IDF atau embedding)
+            
+        Returns:
+            AuthorIndex
+        """
+        authors = pd.Categorical(data['authorDisplayName'])
+        indicator = group_indicator(authors.codes, len(authors.categories))
+        return cls(authors.categories, indicator.astype(matrix.dtype) @ matrix)
+    
+    @classmethod
+    def build(cls, data: pd.DataFrame, tfidf_matrix,
+              author_embeddings: np.ndarray = None) -> 'AuthorIndex':
+        """
+        Bangun index sesuai AUTHOR_INDEX_CONFIG['source'].
+        
+        Args:
+            data: DataFrame komentar
+            tfidf_matrix: Matrix TF-IDF per komentar
+            author_embeddings: Vektor per author urut author_label (opsional)
+            
+        Returns:
+            AuthorIndex
+        """
+        if AUTHOR_INDEX_CONFIG['source'] == 'embedding' and author_embeddings is not None:
+            authors = pd.Categorical(data['authorDisplayName']).categories
+            return cls(authors, author_embeddings)
+        return cls.from_features(data, tfidf_matrix)
+    
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'AuthorIndex':
+        """
+        Load index dari file .npz hasil save() tanpa menghitung ulang.
+        
+        Args:
+            path: Path file index
+            
+        Returns:
+            AuthorIndex
+        """
+        with np.load(path, allow_pickle=False) as stored:
+            authors = stored['authors'].tolist()
+            if 'indptr' in stored:
+                vectors = csr_matrix(
+                    (stored['data'], stored['indices'], stored['indptr']),
+                    shape=tuple(stored['shape'])
+                )
+            else:
+                vectors = stored['vectors']
+        return cls(authors, vectors, normalized=True)
+    
+    def save(self, path: Union[str, Path]) -> 'AuthorIndex':
+        """
+        Simpan author dan vektor ter-normalisasi ke file .npz.
+        
+        Args:
+            path: Path file index
+            
+        Returns:
+            Self untuk method chaining
+        """
+        arrays = {'authors': np.array([str(a) for a in self.authors])}
+        if issparse(self.vectors):
+            vectors = csr_matrix(self.vectors)
+            arrays.update(
+                data=vectors.data, indices=vectors.indices, indptr=vectors.indptr,
+                shape=np.asarray(vectors.shape, dtype=np.int64)
+            )
+        else:
+            arrays['vectors'] = np.asarray(self.vectors)
+        with open(path, 'wb') as f:
+            np.savez_compressed(f, **arrays)
+        return self
+    
+    def __len__(self) -> int:
+        return len(self.authors)
+    
+    def query(self, author: str, k: int = None) -> pd.DataFrame:
+        """
+        Cari k author paling mirip dengan author tertentu.
+        
+        Args:
+            author: Nama author
+            k: Jumlah hasil, default AUTHOR_INDEX_CONFIG['k']
+            
+        Returns:
+            DataFrame berisi author dan similarity (kosong jika author
+            tidak ada di index)
+        """
+        k = k or AUTHOR_INDEX_CONFIG['k']
+        row = self.author_index.get(author)
+        if row is None:
+            return pd.DataFrame(columns=['author', 'similarity'])
+        
+        indices, scores = top_k_cosine(
+            self.vectors[row:row + 1], self.vectors, k,
+            exclude=np.array([row])
+        )
+        valid = np.isfinite(scores[0])
+        return pd.DataFrame({
+            'author': [self.authors[i] for i in indices[0][valid]],
+            'similarity': scores[0][valid]
+        })
+    
+    def top_k_all(self, k: int = None, block_size: int = None):
+        """
+        Top-k author paling mirip untuk semua author sekaligus.
+        
+        Args:
+            k: Jumlah tetangga, default AUTHOR_INDEX_CONFIG['k']
+            block_size: Jumlah author per blok, default AUTHOR_INDEX_CONFIG
+            
+        Returns:
+            Tuple (indeks n_author x k, skor n_author x k)
+        """
+        return top_k_cosine(
+            self.vectors, self.vectors,
+            k or AUTHOR_INDEX_CONFIG['k'],
+            block_size=block_size or AUTHOR_INDEX_CONFIG['block_size'],
+            exclude=np.arange(len(self.authors))
+        )
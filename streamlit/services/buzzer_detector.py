@@ -5,23 +5,39 @@ import pandas as pd
 import numpy as np
 from sklearn.ensemble import IsolationForest
 from sklearn.preprocessing import StandardScaler
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 from config import (
     THRESHOLDS, SCORE_WEIGHTS, BUZZER_CATEGORIES,
-    ISOLATION_FOREST_CONFIG, ML_FEATURES
+    ISOLATION_FOREST_CONFIG, ML_FEATURES, NEAR_DUPLICATE_ML_FEATURES,
+    PROGRESS_CONFIG
 )
+from services.activity_profile import ActivityProfiler
+from services.feature_extractor import FeatureExtractor
+from utils.profiling import timed
+from utils.progress import progress_span, report_progress
+from utils.similarity import group_mean_pairwise_cosine
 
 
 class BuzzerDetector:
     """Handler untuk deteksi buzzer."""
     
-    def __init__(self, data: pd.DataFrame, centrality_df: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, centrality_df: pd.DataFrame,
+                 tfidf_matrix=None, scaler: StandardScaler = None,
+                 iso_forest: IsolationForest = None, group_column: str = None):
         self.data = data.copy()
+        # Kolom partisi (mis. request di service scoring): perbandingan antar
+        # author (jadwal mirip, quantile centrality) hanya di dalam grup
+        self.group_column = group_column
         self.centrality_df = centrality_df
+        self.tfidf_matrix = tfidf_matrix
         self.user_activity = None
-        self.scaler = StandardScaler()
+        self.shift_matches = None
+        # Scaler + Isolation Forest yang sudah di-fit dipakai apa adanya
+        # (scoring tanpa training ulang)
+        self.pretrained = iso_forest is not None
+        self.scaler = scaler if scaler is not None else StandardScaler()
+        self.iso_forest = iso_forest
     
+    @timed()
     def aggregate_user_activity(self) -> 'BuzzerDetector':
         """
         Agregasi aktivitas per user.
@@ -51,39 +67,53 @@ class BuzzerDetector:
             (self.user_activity['time_span_hours'] + 1)
         )
         
+        # Fitur near-duplicate (hanya ada jika collapse SimHash diaktifkan)
+        if 'near_dup_count' in self.data.columns:
+            near_dup = self.data.groupby('authorDisplayName')['near_dup_count'].mean()
+            self.user_activity['avg_near_dup_count'] = (
+                self.user_activity['author'].map(near_dup)
+            )
+        
+        if self.group_column is not None:
+            author_groups = self.data.drop_duplicates('authorDisplayName').set_index(
+                'authorDisplayName'
+            )[self.group_column]
+            self.user_activity[self.group_column] = (
+                self.user_activity['author'].map(author_groups)
+            )
+        
         return self
     
+    @timed()
     def calculate_text_similarity(self) -> 'BuzzerDetector':
         """
         Hitung rata-rata text similarity per user.
         
+        Memakai TF-IDF global dari FeatureExtractor (baris per komentar),
+        sehingga similarity konsisten dengan network analysis dan tidak ada
+        vectorizer yang di-fit per author.
+        
         Returns:
             Self untuk method chaining
         """
-        similarities = []
-        
-        for author in self.user_activity['author']:
-            user_comments = self.data[
-                self.data['authorDisplayName'] == author
-            ]['textDisplay'].values
-            
-            if len(user_comments) < 2:
-                similarities.append(0.0)
-                continue
-            
-            try:
-                vectorizer = TfidfVectorizer()
-                X = vectorizer.fit_transform(user_comments)
-                sim_matrix = cosine_similarity(X)
-                mask = ~np.eye(sim_matrix.shape[0], dtype=bool)
-                avg_sim = sim_matrix[mask].mean()
-                similarities.append(float(avg_sim))
-            except Exception:
-                similarities.append(0.0)
+        if self.tfidf_matrix is None or self.tfidf_matrix.shape[0] != len(self.data):
+            self.tfidf_matrix = (
+                FeatureExtractor(self.data).create_tfidf_matrix().get_tfidf_matrix()
+            )
+        
+        # Mapping author -> kode baris sesuai urutan user_activity
+        author_codes = pd.Categorical(
+            self.data['authorDisplayName'],
+            categories=self.user_activity['author']
+        ).codes
+        similarities = group_mean_pairwise_cosine(
+            self.tfidf_matrix, author_codes, len(self.user_activity)
+        )
         
         self.user_activity['avg_text_similarity'] = similarities
         return self
     
+    @timed()
     def calculate_text_stats(self) -> 'BuzzerDetector':
         """
         Hitung statistik panjang teks per user.
@@ -109,6 +139,7 @@ class BuzzerDetector:
         
         return self
     
+    @timed()
     def calculate_duplicate_ratio(self) -> 'BuzzerDetector':
         """
         Hitung rasio komentar duplikat per user.
@@ -116,10 +147,10 @@ class BuzzerDetector:
         Returns:
             Self untuk method chaining
         """
-        dup_ratio = self.data.groupby('authorDisplayName').apply(
-            lambda x: x.duplicated(subset=['textDisplay']).sum() / len(x),
-            include_groups=False
-        ).reset_index()
+        # Duplikat teks di dalam grup author = duplikat pasangan
+        # (author, teks), jadi cukup satu duplicated() untuk semua author
+        duplicated = self.data.duplicated(subset=['authorDisplayName', 'textDisplay'])
+        dup_ratio = duplicated.groupby(self.data['authorDisplayName']).mean().reset_index()
         
         dup_ratio.columns = ['author', 'duplicate_ratio']
         
@@ -129,6 +160,38 @@ class BuzzerDetector:
         
         return self
     
+    @timed()
+    def calculate_activity_profile(self) -> 'BuzzerDetector':
+        """
+        Hitung fitur jadwal posting per user (entropy jam, rasio malam,
+        jam puncak) dan author dengan jadwal paling mirip.
+        
+        Returns:
+            Self untuk method chaining
+        """
+        profiler = ActivityProfiler(self.data, authors=self.user_activity['author'])
+        features = profiler.calculate_features()
+        self.shift_matches = profiler.find_shift_matches(
+            groups=(
+                self.user_activity[self.group_column].to_numpy()
+                if self.group_column is not None else None
+            )
+        )
+        
+        best_match = self.shift_matches.drop_duplicates('author')
+        self.user_activity = self.user_activity.merge(
+            features, on='author', how='left'
+        ).merge(
+            best_match.rename(columns={'match_author': 'shift_match_author'}),
+            on='author', how='left'
+        )
+        self.user_activity['shift_similarity'] = (
+            self.user_activity['shift_similarity'].fillna(0)
+        )
+        
+        return self
+    
+    @timed()
     def merge_centrality(self) -> 'BuzzerDetector':
         """
         Merge degree centrality ke user activity.
@@ -149,6 +212,7 @@ class BuzzerDetector:
         
         return self
     
+    @timed()
     def apply_rule_based_detection(self) -> 'BuzzerDetector':
         """
         Terapkan rule-based detection dengan scoring system.
@@ -179,12 +243,23 @@ class BuzzerDetector:
         self.user_activity.loc[mask, 'buzzer_score'] += SCORE_WEIGHTS['duplicate_ratio']
         
         # Kriteria 6: Degree centrality tinggi
-        quantile = self.user_activity['degree_centrality'].quantile(
-            THRESHOLDS['degree_centrality_quantile']
-        )
+        if self.group_column is None:
+            quantile = self.user_activity['degree_centrality'].quantile(
+                THRESHOLDS['degree_centrality_quantile']
+            )
+        else:
+            quantile = self.user_activity.groupby(self.group_column)[
+                'degree_centrality'
+            ].transform('quantile', THRESHOLDS['degree_centrality_quantile'])
         mask = self.user_activity['degree_centrality'] > quantile
         self.user_activity.loc[mask, 'buzzer_score'] += SCORE_WEIGHTS['degree_centrality']
         
+        # Kriteria 7: Sering mengulang komentar near-duplicate
+        # (hanya jika collapse near-duplicate aktif)
+        if 'avg_near_dup_count' in self.user_activity.columns:
+            mask = self.user_activity['avg_near_dup_count'] > THRESHOLDS['near_dup_count']
+            self.user_activity.loc[mask, 'buzzer_score'] += SCORE_WEIGHTS['near_dup_count']
+        
         # Kategorisasi
         self.user_activity['buzzer_category'] = pd.cut(
             self.user_activity['buzzer_score'],
@@ -194,27 +269,69 @@ class BuzzerDetector:
         
         return self
     
-    def apply_ml_detection(self) -> 'BuzzerDetector':
+    def train_isolation_forest(self, X_scaled: np.ndarray) -> IsolationForest:
         """
-        Terapkan Isolation Forest untuk anomaly detection.
+        Train Isolation Forest bertahap (warm_start) agar progress per
+        kelompok pohon bisa dilaporkan; seed tiap pohon sama dengan fit
+        sekali jalan. Offset contamination cukup dihitung di fit terakhir.
         
+        Args:
+            X_scaled: Fitur ML yang sudah di-scale
+            
         Returns:
-            Self untuk method chaining
+            IsolationForest yang sudah di-fit
         """
-        # Siapkan fitur
-        X = self.user_activity[ML_FEATURES].fillna(0)
-        X_scaled = self.scaler.fit_transform(X)
-        
-        # Train Isolation Forest
+        n_estimators = ISOLATION_FOREST_CONFIG['n_estimators']
+        chunk = PROGRESS_CONFIG['forest_chunk']
         iso_forest = IsolationForest(
-            contamination=ISOLATION_FOREST_CONFIG['contamination'],
+            contamination='auto',
             random_state=ISOLATION_FOREST_CONFIG['random_state'],
-            n_estimators=ISOLATION_FOREST_CONFIG['n_estimators']
+            n_estimators=min(chunk, n_estimators),
+            warm_start=True
         )
+        for trees in range(chunk, n_estimators + chunk, chunk):
+            trees = min(trees, n_estimators)
+            if trees == n_estimators:
+                iso_forest.set_params(
+                    contamination=ISOLATION_FOREST_CONFIG['contamination']
+                )
+            iso_forest.set_params(n_estimators=trees).fit(X_scaled)
+            report_progress(trees, n_estimators, 'isolation_forest')
+        return iso_forest
+    
+    def ml_features(self) -> list:
+        """
+        Kolom fitur ML: ML_FEATURES, ditambah fitur near-duplicate jika
+        collapse near-duplicate aktif.
         
-        # Predict
-        predictions = iso_forest.fit_predict(X_scaled)
-        scores = iso_forest.score_samples(X_scaled)
+        Returns:
+            List nama kolom fitur
+        """
+        features = list(ML_FEATURES)
+        if 'avg_near_dup_count' in self.user_activity.columns:
+            features += NEAR_DUPLICATE_ML_FEATURES
+        return features
+    
+    @timed()
+    def apply_ml_detection(self) -> 'BuzzerDetector':
+        """
+        Terapkan Isolation Forest untuk anomaly detection.
+        
+        Returns:
+            Self untuk method chaining
+        """
+        # Siapkan fitur
+        X = self.user_activity[self.ml_features()].fillna(0)
+        if self.pretrained:
+            X_scaled = self.scaler.transform(X)
+        else:
+            X_scaled = self.scaler.fit_transform(X)
+            self.iso_forest = self.train_isolation_forest(X_scaled)
+        
+        # Predict: label dari skor yang sama (setara predict(), satu kali
+        # lewat semua pohon)
+        scores = self.iso_forest.score_samples(X_scaled)
+        predictions = np.where(scores - self.iso_forest.offset_ < 0, -1, 1)
         
         self.user_activity['isolation_forest_prediction'] = predictions
         self.user_activity['isolation_forest_score'] = scores
@@ -234,15 +351,32 @@ class BuzzerDetector:
         Returns:
             DataFrame dengan hasil deteksi
         """
-        return (self
-                .aggregate_user_activity()
-                .calculate_text_similarity()
-                .calculate_text_stats()
-                .calculate_duplicate_ratio()
-                .merge_centrality()
-                .apply_rule_based_detection()
-                .apply_ml_detection()
-                .user_activity)
+        steps = [
+            self.aggregate_user_activity,
+            self.calculate_text_similarity,
+            self.calculate_text_stats,
+            self.calculate_duplicate_ratio,
+            self.calculate_activity_profile,
+            self.merge_centrality,
+            self.apply_rule_based_detection,
+            self.apply_ml_detection
+        ]
+        # Progress per langkah fitur per author (loop di dalam langkah,
+        # mis. pohon Isolation Forest, mengisi potongan langkahnya sendiri)
+        for index, step in enumerate(steps):
+            with progress_span(index, len(steps)):
+                step()
+            report_progress(index + 1, len(steps), step.__name__)
+        return self.user_activity
+    
+    def get_shift_matches(self) -> pd.DataFrame:
+        """
+        Mendapatkan pasangan author dengan jadwal posting mirip.
+        
+        Returns:
+            DataFrame berisi author, match_author, dan shift_similarity
+        """
+        return self.shift_matches
     
     def get_summary(self) -> dict:
         """
@@ -3,17 +3,47 @@ Service untuk membersihkan dan preprocessing data
 """
 import pandas as pd
 import numpy as np
-from utils.helpers import clean_text
+from functools import partial
+from typing import List
+from config import (
+    CLEAN_CACHE_CONFIG, DATETIME_FORMAT, NEAR_DUPLICATE_CONFIG,
+    PARALLEL_CLEANING_CONFIG
+)
+from utils.helpers import clean_text_batch
+from utils.parallel import clean_text_parallel
+from utils.profiling import timed
+from utils.simhash import near_duplicate_groups, simhash_fingerprints
+from utils.text_cache import get_text_cache
+from utils.token_cache import TokenCache
 
 
 class DataCleaner:
     """Handler untuk data cleaning dan preprocessing."""
     
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, use_cache: bool = None,
+                 parallel: bool = None, n_workers: int = None,
+                 chunk_size: int = None):
         self.data = data.copy()
         self.duplicates_removed = 0
         self.missing_filled = 0
+        self.unique_texts = 0
+        self.datetime_fallback = 0
+        self.datetime_coerced = 0
+        self.near_duplicates_removed = 0
+        self.token_cache = None
+        # Token teks unik dari worker paralel + kode teks unik per baris
+        self._unique_tokens = None
+        self._text_codes = None
+        self.use_cache = (
+            CLEAN_CACHE_CONFIG['enabled'] if use_cache is None else use_cache
+        )
+        self.parallel = (
+            PARALLEL_CLEANING_CONFIG['enabled'] if parallel is None else parallel
+        )
+        self.n_workers = n_workers
+        self.chunk_size = chunk_size
     
+    @timed()
     def remove_duplicates(self) -> 'DataCleaner':
         """
         Hapus baris duplikat berdasarkan authorDisplayName dan textDisplay.
@@ -29,6 +59,7 @@ class DataCleaner:
         self.duplicates_removed = original_len - len(self.data)
         return self
     
+    @timed()
     def handle_missing_values(self) -> 'DataCleaner':
         """
         Handle missing values pada data.
@@ -47,55 +78,220 @@ class DataCleaner:
         
         return self
     
+    @timed()
     def convert_datetime(self) -> 'DataCleaner':
         """
-        Konversi kolom publishedAt ke datetime.
+        Konversi kolom publishedAt ke datetime UTC.
+        
+        Fast path memakai format eksplisit DATETIME_FORMAT; hanya baris yang
+        gagal yang di-parse ulang dengan inferensi format (per baris) dan
+        offset timezone dinormalisasi ke UTC.
         
         Returns:
             Self untuk method chaining
         """
-        self.data['publishedAt'] = pd.to_datetime(
-            self.data['publishedAt'],
-            errors='coerce'
-        )
+        raw = self.data['publishedAt']
+        
+        if pd.api.types.is_datetime64_any_dtype(raw):
+            parsed = pd.to_datetime(raw, utc=True)
+        else:
+            parsed = pd.to_datetime(
+                raw, format=DATETIME_FORMAT, errors='coerce', utc=True
+            )
+            failed = parsed.isna() & raw.notna()
+            self.datetime_fallback = int(failed.sum())
+            
+            if self.datetime_fallback:
+                parsed[failed] = pd.to_datetime(
+                    raw[failed].astype(str), format='mixed',
+                    errors='coerce', utc=True
+                )
+        
+        self.datetime_coerced = int(parsed.isna().sum())
+        self.data['publishedAt'] = parsed.dt.as_unit('ns')
         return self
     
+    @timed()
     def clean_text_column(self) -> 'DataCleaner':
         """
-        Bersihkan kolom textDisplay.
+        Bersihkan kolom textDisplay sekaligus satu kolom (batch).
+        
+        Teks dikelompokkan dulu sehingga hanya teks unik yang dibersihkan,
+        lalu hasilnya disebar kembali lewat codes. Pada mode paralel, teks
+        unik dibagi per chunk ke process pool dan worker sekaligus
+        mentokenisasi hasilnya (dipakai add_text_length).
+        
+        Returns:
+            Self untuk method chaining
+        """
+        # dict, bukan pd.factorize: hash string kolom object pandas berhenti
+        # di \x00, sehingga teks yang hanya berbeda setelah \x00 tergabung
+        unique_index = {}
+        codes = np.fromiter(
+            (unique_index.setdefault(t, len(unique_index))
+             for t in self.data['textDisplay']),
+            dtype=np.int64, count=len(self.data)
+        )
+        uniques = list(unique_index)
+        self.unique_texts = len(uniques)
+        
+        if self.parallel and len(uniques) >= PARALLEL_CLEANING_CONFIG['min_texts']:
+            cleaned = self._clean_parallel([str(t) for t in uniques])
+            self._text_codes = codes
+        elif self.use_cache:
+            cleaned = get_text_cache().clean_many(uniques)
+        else:
+            cleaned = clean_text_batch(uniques)
+        
+        self.data['textDisplay'] = np.asarray(cleaned, dtype=object)[codes]
+        return self
+    
+    def _clean_parallel(self, texts: List[str]) -> List[str]:
+        """
+        Cleaning + tokenisasi teks unik di process pool.
+        
+        Teks yang sudah ada di cache tidak dikirim ke worker dan hanya
+        ditokenisasi di proses ini; hasilnya disimpan di _unique_tokens
+        (sejajar texts).
+        """
+        clean_func = partial(
+            clean_text_parallel,
+            n_workers=self.n_workers,
+            chunk_size=self.chunk_size,
+            tokenize=True
+        )
+        if not self.use_cache:
+            cleaned, self._unique_tokens = clean_func(texts)
+            return cleaned
+        
+        worker_results = []
+        
+        def clean_missing(missing: List[str]) -> List[str]:
+            missing_cleaned, tokens = clean_func(missing)
+            worker_results.append((missing, tokens))
+            return missing_cleaned
+        
+        cleaned = get_text_cache().clean_many(texts, clean_missing)
+        missing, missing_tokens = worker_results[0] if worker_results else ([], None)
+        
+        # Urutan dokumen: teks dari worker dulu, lalu teks dari cache
+        position = dict(zip(missing, range(len(missing))))
+        order = np.fromiter(
+            (position.get(t, -1) for t in texts), dtype=np.int64, count=len(texts)
+        )
+        cached = np.flatnonzero(order < 0)
+        order[cached] = len(missing) + np.arange(len(cached))
+        
+        parts = [TokenCache.build(cleaned[i] for i in cached)]
+        if missing_tokens is not None:
+            parts.insert(0, missing_tokens)
+        self._unique_tokens = TokenCache.concat(parts).take(order)
+        return cleaned
+    
+    @timed()
+    def collapse_near_duplicates(self, max_distance: int = None,
+                                 min_tokens: int = None) -> 'DataCleaner':
+        """
+        Gabungkan komentar near-duplicate (SimHash) dari author yang sama
+        menjadi satu baris.
         
+        Grup dibatasi per author: komentar mirip dari akun berbeda (pola
+        kampanye) tetap dipertahankan sebagai baris terpisah. Komentar
+        pertama di setiap grup dipertahankan dengan kolom near_dup_count
+        berisi jumlah anggota grup. Dijalankan setelah clean_text_column
+        supaya variasi emoji/tanda baca sudah hilang.
+        
+        Args:
+            max_distance: Hamming distance maksimum antar fingerprint
+            min_tokens: Jumlah token minimum agar teks ikut di-collapse
+            
         Returns:
             Self untuk method chaining
         """
-        self.data['textDisplay'] = self.data['textDisplay'].apply(clean_text)
+        if max_distance is None:
+            max_distance = NEAR_DUPLICATE_CONFIG['max_distance']
+        if min_tokens is None:
+            min_tokens = NEAR_DUPLICATE_CONFIG['min_tokens']
+        
+        original_len = len(self.data)
+        texts = self.data['textDisplay'].fillna('').astype(str)
+        eligible = (
+            texts.str.split().str.len() >= max(min_tokens, 1)
+        ).to_numpy()
+        
+        # Teks pendek/kosong jadi grup sendiri (label negatif unik)
+        groups = -np.arange(1, original_len + 1, dtype=np.int64)
+        if eligible.any():
+            fingerprints = simhash_fingerprints(texts[eligible])
+            groups[eligible] = near_duplicate_groups(
+                fingerprints,
+                max_distance=max_distance,
+                max_bucket=NEAR_DUPLICATE_CONFIG['max_bucket']
+            )
+        
+        # Kunci grup = pasangan (author, grup SimHash)
+        keys = pd.DataFrame({
+            'author': self.data['authorDisplayName'].to_numpy(),
+            'group': groups
+        }, index=self.data.index)
+        self.data['near_dup_count'] = (
+            keys.groupby(['author', 'group'], sort=False, dropna=False)['group']
+            .transform('size').astype(int)
+        )
+        keep = ~keys.duplicated(keep='first').to_numpy()
+        self.data = self.data[keep]
+        if self._text_codes is not None:
+            self._text_codes = self._text_codes[keep]
+        self.near_duplicates_removed = original_len - len(self.data)
         return self
     
+    @timed()
     def add_text_length(self) -> 'DataCleaner':
         """
         Tambahkan kolom panjang teks (jumlah kata).
         
+        Tokenisasi dilakukan sekali di sini (atau dipakai dari worker
+        cleaning paralel) dan disimpan sebagai TokenCache untuk dipakai
+        ulang oleh FeatureExtractor dan BuzzerDetector.
+        
         Returns:
             Self untuk method chaining
         """
-        self.data['textLength'] = self.data['textDisplay'].apply(
-            lambda x: len(str(x).split())
-        )
+        if self._unique_tokens is not None:
+            self.token_cache = self._unique_tokens.take(self._text_codes)
+        else:
+            self.token_cache = TokenCache.build(self.data['textDisplay'])
+        self.data['textLength'] = self.token_cache.lengths()
         return self
     
-    def process_all(self) -> pd.DataFrame:
+    def get_token_cache(self) -> TokenCache:
+        """Mendapatkan TokenCache (sejajar dengan baris data hasil cleaning)."""
+        return self.token_cache
+    
+    def process_all(self, near_duplicates: bool = None) -> pd.DataFrame:
         """
         Jalankan semua proses cleaning.
         
+        Args:
+            near_duplicates: Aktifkan collapse near-duplicate
+                (default: NEAR_DUPLICATE_CONFIG['enabled'])
+                
         Returns:
             DataFrame yang sudah dibersihkan
         """
-        return (self
-                .remove_duplicates()
-                .handle_missing_values()
-                .convert_datetime()
-                .clean_text_column()
-                .add_text_length()
-                .data)
+        if near_duplicates is None:
+            near_duplicates = NEAR_DUPLICATE_CONFIG['enabled']
+        
+        (self
+         .remove_duplicates()
+         .handle_missing_values()
+         .convert_datetime()
+         .clean_text_column())
+        
+        if near_duplicates:
+            self.collapse_near_duplicates()
+        
+        return self.add_text_length().data
     
     def get_cleaning_stats(self) -> dict:
         """
@@ -107,5 +303,9 @@ class DataCleaner:
         return {
             'duplicates_removed': self.duplicates_removed,
             'missing_filled': self.missing_filled,
+            'unique_texts': self.unique_texts,
+            'datetime_fallback': self.datetime_fallback,
+            'datetime_coerced': self.datetime_coerced,
+            'near_duplicates_removed': self.near_duplicates_removed,
             'final_rows': len(self.data)
         }
@@ -2,8 +2,10 @@
 Service untuk load dan merge data CSV
 """
 import pandas as pd
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from config import REQUIRED_COLUMNS
+from services.stream_reader import StreamReader
+from utils.profiling import timed
 
 
 class DataLoader:
@@ -12,22 +14,49 @@ class DataLoader:
     def __init__(self):
         self.dataframes: List[pd.DataFrame] = []
         self.merged_data: Optional[pd.DataFrame] = None
+        self.stream_reader = StreamReader()
     
     def load_csv(self, uploaded_file, video_id: str) -> pd.DataFrame:
         """
-        Load single CSV file dan tambahkan video_id.
+        Load single file komentar dan tambahkan video_id.
+        
+        CSV biasa dibaca langsung, sedangkan file gzip/zstd dan JSONL
+        YouTube API dibaca bertahap lewat StreamReader.
         
         Args:
-            uploaded_file: File yang diupload dari Streamlit
+            uploaded_file: File yang diupload dari Streamlit (atau path)
             video_id: ID untuk identifikasi video
             
         Returns:
             DataFrame yang sudah ditambahkan video_id
         """
-        df = pd.read_csv(uploaded_file)
+        if self.stream_reader.is_plain_csv(uploaded_file):
+            df = pd.read_csv(uploaded_file)
+        else:
+            df = self.stream_reader.read_all(uploaded_file)
         df['video_id'] = video_id
         return df
     
+    def iter_batches(self, source, video_id: str) -> Iterator[pd.DataFrame]:
+        """
+        Baca file per batch tanpa memuat seluruh isi file ke memory.
+        
+        Args:
+            source: Path file atau objek file (CSV/JSONL, plain/gzip/zstd)
+            video_id: ID untuk identifikasi video
+            
+        Yields:
+            DataFrame per batch yang sudah ditambahkan video_id
+        """
+        for batch in self.stream_reader.iter_batches(source):
+            if not self.validate_columns(batch):
+                raise ValueError(
+                    f"File {StreamReader.source_name(source)} tidak memiliki "
+                    f"kolom yang dibutuhkan. Kolom wajib: {REQUIRED_COLUMNS}"
+                )
+            batch['video_id'] = video_id
+            yield batch
+    
     def validate_columns(self, df: pd.DataFrame) -> bool:
         """
         Validasi apakah CSV memiliki kolom yang dibutuhkan.
@@ -40,6 +69,7 @@ class DataLoader:
         """
         return all(col in df.columns for col in REQUIRED_COLUMNS)
     
+    @timed(rows_attr='merged_data')
     def load_multiple_files(self, files: List) -> pd.DataFrame:
         """
         Load multiple CSV files dan merge jadi satu DataFrame.
@@ -58,7 +88,7 @@ class DataLoader:
             
             if not self.validate_columns(df):
                 raise ValueError(
-                    f"File {file.name} tidak memiliki kolom yang dibutuhkan. "
+                    f"File {getattr(file, 'name', file)} tidak memiliki kolom yang dibutuhkan. "
                     f"Kolom wajib: {REQUIRED_COLUMNS}"
                 )
             
@@ -0,0 +1,170 @@
+"""
+Service embedding dense (TruncatedSVD) untuk komentar dan author
+"""
+import time
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+from sklearn.decomposition import TruncatedSVD
+from sklearn.preprocessing import normalize
+from config import EMBEDDING_CONFIG
+from utils.similarity import group_indicator, group_mean_pairwise_cosine
+
+
+class AuthorEmbedder:
+    """
+    Proyeksi TF-IDF sparse ke ruang dense float32 berdimensi rendah.
+    
+    Embedding komentar di-normalisasi l2 sehingga dot product = cosine,
+    lalu di-pool (dijumlah dan dinormalisasi) per author. Similarity
+    berikutnya cukup perkalian matrix dense kecil (BLAS).
+    """
+    
+    def __init__(self, n_components: int = None, n_iter: int = None,
+                 random_state: int = None):
+        self.n_components = n_components or EMBEDDING_CONFIG['n_components']
+        self.n_iter = n_iter or EMBEDDING_CONFIG['n_iter']
+        self.random_state = (
+            EMBEDDING_CONFIG['random_state'] if random_state is None
+            else random_state
+        )
+        self.svd = None
+    
+    def fit_transform(self, tfidf_matrix) -> np.ndarray:
+        """
+        Fit randomized TruncatedSVD dan proyeksikan komentar.
+        
+        Args:
+            tfidf_matrix: Matrix TF-IDF (komentar x fitur)
+            
+        Returns:
+            Embedding komentar float32 ter-normalisasi (komentar x komponen)
+        """
+        n_components = max(1, min(self.n_components, tfidf_matrix.shape[1] - 1))
+        self.svd = TruncatedSVD(
+            n_components=n_components,
+            algorithm='randomized',
+            n_iter=self.n_iter,
+            random_state=self.random_state
+        )
+        embeddings = self.svd.fit_transform(tfidf_matrix)
+        return normalize(embeddings.astype(np.float32, copy=False))
+    
+    def transform(self, tfidf_matrix) -> np.ndarray:
+        """
+        Proyeksikan komentar baru dengan SVD yang sudah di-fit.
+        
+        Args:
+            tfidf_matrix: Matrix TF-IDF dengan kolom yang sama seperti saat fit
+            
+        Returns:
+            Embedding komentar float32 ter-normalisasi
+        """
+        if self.svd is None:
+            raise ValueError("AuthorEmbedder belum di-fit")
+        return normalize(
+            self.svd.transform(tfidf_matrix).astype(np.float32, copy=False)
+        )
+    
+    @staticmethod
+    def pool_authors(embeddings: np.ndarray, author_codes: np.ndarray,
+                     n_authors: int) -> np.ndarray:
+        """
+        Pool embedding komentar menjadi satu vektor per author.
+        
+        Args:
+            embeddings: Embedding komentar ter-normalisasi
+            author_codes: Kode author per komentar (0..n_authors-1)
+            n_authors: Jumlah author
+            
+        Returns:
+            Vektor author float32 ter-normalisasi (n_authors x komponen)
+        """
+        indicator = group_indicator(author_codes, n_authors).astype(np.float32)
+        return normalize(np.asarray(indicator @ embeddings, dtype=np.float32))
+
+
+def _pair_similarities(matrix, threshold: float):
+    """Pasangan komentar (i < j) dengan cosine > threshold."""
+    sim = matrix @ matrix.T
+    if hasattr(sim, 'tocoo'):
+        sim = sim.tocoo()
+        rows, cols, values = sim.row, sim.col, sim.data
+    else:
+        rows, cols = np.nonzero(sim > threshold)
+        values = sim[rows, cols]
+    keep = (rows < cols) & (values > threshold)
+    return set(zip(rows[keep].tolist(), cols[keep].tolist()))
+
+
+def compare_with_sparse(tfidf_matrix, author_codes: np.ndarray, n_authors: int,
+                        n_components_list: Iterable[int] = (16, 32, 64, 128),
+                        threshold: float = 0.3) -> pd.DataFrame:
+    """
+    Ukur akurasi dan kecepatan embedding terhadap jalur TF-IDF sparse.
+    
+    Untuk setiap jumlah komponen dibandingkan: similarity per author
+    (korelasi dan MAE terhadap sparse) serta edge komentar > threshold
+    (precision/recall terhadap edge sparse).
+    
+    Args:
+        tfidf_matrix: Matrix TF-IDF ter-normalisasi (komentar x fitur)
+        author_codes: Kode author per komentar
+        n_authors: Jumlah author
+        n_components_list: Jumlah komponen yang diuji
+        threshold: Threshold similarity untuk edge
+        
+    Returns:
+        DataFrame laporan per representasi
+    """
+    start = time.perf_counter()
+    base_similarity = group_mean_pairwise_cosine(tfidf_matrix, author_codes, n_authors)
+    base_edges = _pair_similarities(tfidf_matrix, threshold)
+    base_seconds = time.perf_counter() - start
+    
+    report = [{
+        'representation': 'sparse_tfidf',
+        'n_components': tfidf_matrix.shape[1],
+        'fit_seconds': 0.0,
+        'similarity_seconds': base_seconds,
+        'memory_bytes': (
+            tfidf_matrix.data.nbytes + tfidf_matrix.indices.nbytes
+            + tfidf_matrix.indptr.nbytes
+        ),
+        'author_sim_corr': 1.0,
+        'author_sim_mae': 0.0,
+        'edge_precision': 1.0,
+        'edge_recall': 1.0
+    }]
+    
+    for n_components in n_components_list:
+        embedder = AuthorEmbedder(n_components=n_components)
+        start = time.perf_counter()
+        embeddings = embedder.fit_transform(tfidf_matrix)
+        fit_seconds = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        similarity = group_mean_pairwise_cosine(embeddings, author_codes, n_authors)
+        edges = _pair_similarities(embeddings, threshold)
+        similarity_seconds = time.perf_counter() - start
+        
+        hits = len(edges & base_edges)
+        has_pairs = np.bincount(author_codes, minlength=n_authors) > 1
+        report.append({
+            'representation': 'svd_embedding',
+            'n_components': embeddings.shape[1],
+            'fit_seconds': fit_seconds,
+            'similarity_seconds': similarity_seconds,
+            'memory_bytes': embeddings.nbytes,
+            'author_sim_corr': float(np.corrcoef(
+                base_similarity[has_pairs], similarity[has_pairs]
+            )[0, 1]) if has_pairs.sum() > 1 else np.nan,
+            'author_sim_mae': float(np.abs(
+                base_similarity[has_pairs] - similarity[has_pairs]
+            ).mean()) if has_pairs.any() else 0.0,
+            'edge_precision': hits / len(edges) if edges else 1.0,
+            'edge_recall': hits / len(base_edges) if base_edges else 1.0
+        })
+    
+    return pd.DataFrame(report)
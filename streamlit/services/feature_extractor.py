@@ -3,19 +3,55 @@ Service untuk ekstraksi fitur dari data
 """
 import pandas as pd
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from config import INDONESIAN_STOPWORDS
+from sklearn.feature_extraction.text import (
+    CountVectorizer, TfidfTransformer, TfidfVectorizer
+)
+from config import EMBEDDING_CONFIG, FEATURE_CONFIG, TFIDF_STATE_CONFIG
+from services.embedding import AuthorEmbedder
+from services.hashing_features import HashingFeatureModel
+from services.tfidf_state import TfidfState
+from utils.helpers import matrix_memory
+from utils.lexicon import get_lexicon
+from utils.profiling import timed
+from utils.similarity import group_mean_pairwise_cosine
+from utils.token_cache import TokenCache
 
 
 class FeatureExtractor:
     """Handler untuk ekstraksi fitur dari data komentar."""
     
-    def __init__(self, data: pd.DataFrame):
+    def __init__(self, data: pd.DataFrame, token_cache: TokenCache = None,
+                 hashing_model: HashingFeatureModel = None,
+                 tfidf_state: TfidfState = None):
         self.data = data.copy()
         self.tfidf_matrix = None
         self.vectorizer = None
+        self.feature_names = []
+        self.token_cache = token_cache
+        self.hashing_model = hashing_model
+        self.tfidf_state = tfidf_state
+        self.char_matrix = None
+        self.char_vectorizer = None
+        self.embedder = None
+        self.comment_embeddings = None
+        self.author_embeddings = None
+        self.author_rows = None
     
+    def get_token_cache(self) -> TokenCache:
+        """
+        Mendapatkan TokenCache, dibangun dari textDisplay jika belum ada
+        atau tidak sejajar dengan data.
+        
+        Returns:
+            TokenCache untuk data ini
+        """
+        if self.token_cache is None or self.token_cache.n_docs != len(self.data):
+            self.token_cache = TokenCache.build(
+                self.data['textDisplay'].fillna('').astype(str)
+            )
+        return self.token_cache
+    
+    @timed()
     def extract_time_features(self) -> 'FeatureExtractor':
         """
         Ekstrak fitur waktu dari publishedAt.
@@ -30,6 +66,7 @@ class FeatureExtractor:
         self.data['hour'] = self.data['publishedAt'].dt.hour
         return self
     
+    @timed()
     def extract_text_features(self) -> 'FeatureExtractor':
         """
         Ekstrak fitur dari teks komentar.
@@ -42,6 +79,7 @@ class FeatureExtractor:
         )
         return self
     
+    @timed()
     def create_author_labels(self) -> 'FeatureExtractor':
         """
         Buat label numerik untuk setiap author.
@@ -54,72 +92,334 @@ class FeatureExtractor:
         ).cat.codes
         return self
     
-    def create_tfidf_matrix(self) -> 'FeatureExtractor':
+    @timed()
+    def create_tfidf_matrix(self, max_features: int = 1000,
+                            ngram_range: tuple = (1, 2)) -> 'FeatureExtractor':
         """
-        Buat TF-IDF matrix dari teks komentar.
+        Buat TF-IDF matrix (float32) dari teks komentar.
+        
+        Count n-gram dibangun langsung dari TokenCache (tanpa tokenisasi
+        ulang), lalu dipangkas ke max_features dengan aturan yang sama seperti
+        TfidfVectorizer. Hasilnya setara TfidfVectorizer(stop_words,
+        max_features, ngram_range, dtype=float32).fit_transform(teks).
         
+        Args:
+            max_features: Jumlah fitur maksimum (berdasarkan frekuensi)
+            ngram_range: Rentang n-gram
+            
         Returns:
             Self untuk method chaining
         """
+        stop_words = get_lexicon().stop_words()
+        counts, names = self.get_token_cache().ngram_counts(
+            ngram_range, stop_words=stop_words
+        )
+        
+        if max_features is not None and len(names) > max_features:
+            term_freq = np.asarray(counts.sum(axis=0)).ravel()
+            keep = np.zeros(len(names), dtype=bool)
+            keep[(-term_freq).argsort()[:max_features]] = True
+            kept_indices = np.where(keep)[0]
+            counts = counts[:, kept_indices]
+            names = [names[i] for i in kept_indices]
+        
+        transformer = TfidfTransformer()
+        self.tfidf_matrix = transformer.fit_transform(counts.astype(np.float32))
+        self.feature_names = names
+        
+        # Vectorizer siap pakai (transform) untuk komentar baru
         self.vectorizer = TfidfVectorizer(
-            stop_words=INDONESIAN_STOPWORDS,
-            max_features=1000,
-            ngram_range=(1, 2)
+            stop_words=stop_words,
+            ngram_range=ngram_range,
+            vocabulary={name: i for i, name in enumerate(names)},
+            dtype=np.float32
         )
+        self.vectorizer.idf_ = transformer.idf_
         
-        # Filter teks yang tidak kosong
-        valid_texts = self.data['textDisplay'].fillna('').astype(str)
-        self.tfidf_matrix = self.vectorizer.fit_transform(valid_texts)
+        return self
+    
+    @timed()
+    def create_hashing_matrix(self, update_idf: bool = True) -> 'FeatureExtractor':
+        """
+        Buat matrix fitur teks mode hashing (float32, tanpa vocabulary).
+        
+        Count n-gram tetap dibangun dari TokenCache lalu di-hash ke kolom
+        tetap. Hasil disimpan di tfidf_matrix supaya tahap network dan
+        detector tidak perlu tahu mode mana yang dipakai.
+        
+        Args:
+            update_idf: Update IDF model hashing dengan data ini
+            
+        Returns:
+            Self untuk method chaining
+        """
+        if self.hashing_model is None:
+            self.hashing_model = HashingFeatureModel()
+        
+        counts, names = self.get_token_cache().ngram_counts(
+            self.hashing_model.ngram_range,
+            stop_words=get_lexicon().stop_words()
+        )
+        hashed = self.hashing_model.hash_counts(counts, names)
+        self.tfidf_matrix = self.hashing_model.weight(hashed, update_idf=update_idf)
+        self.vectorizer = self.hashing_model
+        self.feature_names = []
         
         return self
     
+    @timed()
+    def create_persisted_matrix(self, update: bool = True,
+                                save: bool = None) -> 'FeatureExtractor':
+        """
+        Buat TF-IDF matrix berdasarkan state yang dipersist (tanpa refit).
+        
+        State di-load dari TFIDF_STATE_CONFIG['path'] (atau dibuat baru),
+        di-update hanya dengan komentar yang belum pernah dihitung, lalu
+        seluruh data di-transform dengan IDF dari state tersebut.
+        
+        Args:
+            update: Update vocabulary dan DF dengan komentar baru
+            save: Simpan state setelah update, default TFIDF_STATE_CONFIG['save']
+            
+        Returns:
+            Self untuk method chaining
+        """
+        if self.tfidf_state is None:
+            self.tfidf_state = TfidfState.load_or_create()
+        if save is None:
+            save = TFIDF_STATE_CONFIG['save']
+        
+        counts, names = self.tfidf_state.count_texts(self.get_token_cache())
+        if update:
+            self.tfidf_state.update(
+                counts, names, keys=TfidfState.row_keys(self.data)
+            )
+            if save and TFIDF_STATE_CONFIG['path']:
+                self.tfidf_state.save()
+        
+        self.tfidf_matrix = self.tfidf_state.transform(counts, names)
+        self.vectorizer = self.tfidf_state
+        self.feature_names = self.tfidf_state.terms
+        
+        return self
+    
+    @timed()
+    def transform_text_matrix(self, vectorizer) -> 'FeatureExtractor':
+        """
+        Buat matrix fitur teks dengan vectorizer yang sudah di-fit (tanpa
+        refit), mis. state hangat milik service scoring.
+        
+        Args:
+            vectorizer: Hasil get_vectorizer() dari ekstraksi sebelumnya
+                (TfidfVectorizer, HashingFeatureModel, atau TfidfState)
+            
+        Returns:
+            Self untuk method chaining
+        """
+        if isinstance(vectorizer, HashingFeatureModel):
+            counts, names = self.get_token_cache().ngram_counts(
+                vectorizer.ngram_range, stop_words=get_lexicon().stop_words()
+            )
+            self.tfidf_matrix = vectorizer.weight(
+                vectorizer.hash_counts(counts, names), update_idf=False
+            )
+        elif isinstance(vectorizer, TfidfState):
+            self.tfidf_matrix = vectorizer.transform_texts(self.get_token_cache())
+        else:
+            self.tfidf_matrix = vectorizer.transform(self.data['textDisplay'])
+        self.vectorizer = vectorizer
+        return self
+    
+    @timed()
+    def create_char_matrix(self, ngram_range: tuple = None,
+                           max_features: int = None) -> 'FeatureExtractor':
+        """
+        Buat TF-IDF char n-gram (char_wb, float32) dari teks komentar.
+        
+        Char n-gram tetap mirip untuk varian ejaan / typo yang dipakai untuk
+        menghindari kecocokan kata (mis. 'bagusss' vs 'bagus'). Setiap teks
+        unik hanya dianalisis sekali lalu disebar ke barisnya, dan jumlah kolom
+        dibatasi max_features.
+        
+        Args:
+            ngram_range: Rentang panjang char n-gram,
+                default FEATURE_CONFIG['char_ngram_range']
+            max_features: Jumlah fitur maksimum,
+                default FEATURE_CONFIG['char_max_features']
+            
+        Returns:
+            Self untuk method chaining
+        """
+        ngram_range = ngram_range or FEATURE_CONFIG['char_ngram_range']
+        if max_features is None:
+            max_features = FEATURE_CONFIG['char_max_features']
+        
+        codes, uniques = pd.factorize(self.data['textDisplay'].fillna('').astype(str))
+        counter = CountVectorizer(
+            analyzer='char_wb', ngram_range=ngram_range, dtype=np.float32
+        )
+        counts = counter.fit_transform(uniques)[codes]
+        names = counter.get_feature_names_out()
+        
+        if max_features is not None and len(names) > max_features:
+            term_freq = np.asarray(counts.sum(axis=0)).ravel()
+            kept_indices = np.sort((-term_freq).argsort(kind='stable')[:max_features])
+            counts = counts[:, kept_indices]
+            names = names[kept_indices]
+        
+        transformer = TfidfTransformer()
+        self.char_matrix = transformer.fit_transform(counts)
+        
+        self.char_vectorizer = TfidfVectorizer(
+            analyzer='char_wb',
+            ngram_range=ngram_range,
+            vocabulary={name: i for i, name in enumerate(names)},
+            dtype=np.float32
+        )
+        self.char_vectorizer.idf_ = transformer.idf_
+        
+        return self
+    
+    @timed()
+    def create_embeddings(self, n_components: int = None) -> 'FeatureExtractor':
+        """
+        Proyeksikan TF-IDF ke embedding dense float32 (TruncatedSVD).
+        
+        Menghasilkan embedding per komentar dan vektor per author (urut
+        sesuai author_label). Harus dipanggil setelah matrix teks dibuat.
+        
+        Args:
+            n_components: Dimensi embedding, default EMBEDDING_CONFIG
+            
+        Returns:
+            Self untuk method chaining
+        """
+        if self.tfidf_matrix is None:
+            self.create_text_matrix()
+        if 'author_label' not in self.data.columns:
+            self.create_author_labels()
+        
+        self.embedder = AuthorEmbedder(n_components=n_components)
+        self.comment_embeddings = self.embedder.fit_transform(self.tfidf_matrix)
+        
+        author_codes = self.data['author_label'].to_numpy()
+        self.author_embeddings = AuthorEmbedder.pool_authors(
+            self.comment_embeddings, author_codes, int(author_codes.max()) + 1
+        )
+        return self
+    
+    def create_text_matrix(self, mode: str = None) -> 'FeatureExtractor':
+        """
+        Buat matrix fitur teks sesuai mode (FEATURE_CONFIG['mode']).
+        
+        Args:
+            mode: 'tfidf', 'hashing', atau 'persisted'
+            
+        Returns:
+            Self untuk method chaining
+        """
+        mode = mode or FEATURE_CONFIG['mode']
+        if mode == 'hashing':
+            return self.create_hashing_matrix()
+        if mode == 'persisted':
+            return self.create_persisted_matrix()
+        if mode == 'tfidf':
+            return self.create_tfidf_matrix()
+        raise ValueError(f"Mode fitur tidak dikenal: {mode}")
+    
     def calculate_user_text_similarity(self, author_name: str) -> float:
         """
         Hitung rata-rata similarity teks untuk satu user.
         
+        Memakai baris TF-IDF global milik author tersebut (harus memanggil
+        create_tfidf_matrix terlebih dahulu).
+        
         Args:
             author_name: Nama author
             
         Returns:
             Rata-rata cosine similarity
         """
-        user_comments = self.data[
-            self.data['authorDisplayName'] == author_name
-        ]['textDisplay'].values
-        
-        if len(user_comments) < 2:
+        rows = self.get_author_rows().get(author_name)
+        if rows is None or len(rows) < 2 or self.tfidf_matrix is None:
             return 0.0
         
-        try:
-            vectorizer_temp = TfidfVectorizer()
-            X_temp = vectorizer_temp.fit_transform(user_comments)
-            similarity = cosine_similarity(X_temp)
-            
-            # Ambil rata-rata similarity (exclude diagonal)
-            mask = ~np.eye(similarity.shape[0], dtype=bool)
-            avg_similarity = similarity[mask].mean()
-            return float(avg_similarity)
-        except Exception:
-            return 0.0
+        similarity = group_mean_pairwise_cosine(
+            self.tfidf_matrix[rows], np.zeros(len(rows), dtype=np.int64), 1
+        )
+        return float(similarity[0])
+    
+    def get_author_rows(self) -> dict:
+        """
+        Mapping author -> indeks baris (posisi) pada TF-IDF matrix.
+        
+        Returns:
+            Dictionary {author: array indeks baris}
+        """
+        if self.author_rows is None:
+            self.author_rows = self.data.groupby('authorDisplayName').indices
+        return self.author_rows
     
-    def extract_all(self) -> pd.DataFrame:
+    def extract_all(self, mode: str = None, char_ngrams: bool = None) -> pd.DataFrame:
         """
         Jalankan semua proses ekstraksi fitur.
         
+        Args:
+            mode: Mode matrix teks ('tfidf', 'hashing', atau 'persisted'),
+                default FEATURE_CONFIG['mode']
+            char_ngrams: Buat juga matrix char n-gram, default aktif jika
+                FEATURE_CONFIG['network_representation'] == 'char'
+            
         Returns:
             DataFrame dengan fitur lengkap
         """
-        return (self
-                .extract_time_features()
-                .extract_text_features()
-                .create_author_labels()
-                .create_tfidf_matrix()
-                .data)
+        representation = FEATURE_CONFIG['network_representation']
+        if char_ngrams is None:
+            char_ngrams = representation == 'char'
+        
+        self.extract_time_features().extract_text_features().create_author_labels()
+        self.create_text_matrix(mode)
+        if char_ngrams:
+            self.create_char_matrix()
+        if EMBEDDING_CONFIG['enabled'] or representation == 'embedding':
+            self.create_embeddings()
+        return self.data
     
     def get_tfidf_matrix(self):
         """Mendapatkan TF-IDF matrix."""
         return self.tfidf_matrix
     
+    def get_char_matrix(self):
+        """Mendapatkan matrix char n-gram (None jika belum dibuat)."""
+        return self.char_matrix
+    
+    def get_comment_embeddings(self):
+        """Mendapatkan embedding per komentar (None jika belum dibuat)."""
+        return self.comment_embeddings
+    
+    def get_author_embeddings(self):
+        """Mendapatkan vektor embedding per author (urut author_label)."""
+        return self.author_embeddings
+    
+    def get_memory_report(self) -> dict:
+        """
+        Ukuran memory setiap representasi teks yang sudah dibuat.
+        
+        Returns:
+            Dictionary {nama representasi: info matrix_memory}
+        """
+        matrices = {
+            'word': self.tfidf_matrix,
+            'char': self.char_matrix,
+            'embedding': self.comment_embeddings,
+            'author_embedding': self.author_embeddings
+        }
+        return {
+            name: matrix_memory(matrix)
+            for name, matrix in matrices.items()
+            if matrix is not None
+        }
+    
     def get_vectorizer(self):
-        """Mendapatkan TF-IDF vectorizer."""
+        """Mendapatkan vectorizer (TfidfVectorizer, HashingFeatureModel, atau TfidfState)."""
         return self.vectorizer
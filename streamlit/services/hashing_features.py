@@ -0,0 +1,138 @@
+"""
+Service fitur teks berbasis hashing (tanpa vocabulary, memory tetap)
+"""
+from typing import Iterable, List, Optional
+
+import numpy as np
+from scipy.sparse import csr_matrix, diags
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+from config import FEATURE_CONFIG
+from utils.lexicon import get_lexicon
+
+
+class HashingFeatureModel:
+    """
+    Vectorizer hashing float32 dengan estimasi IDF bertahap (streaming).
+    
+    Kolom ditentukan oleh hash n-gram sehingga tidak perlu vocabulary:
+    komentar bisa diproses per batch dengan memory tetap dan vektor dari run
+    atau video berbeda tetap sebanding. Satu-satunya state adalah jumlah
+    dokumen dan document frequency per kolom.
+    
+    transform()/weight() tidak mengubah state secara default; DF hanya
+    di-update lewat partial_fit() atau update_idf=True yang eksplisit.
+    """
+    
+    def __init__(self, n_features: Optional[int] = None,
+                 ngram_range: tuple = (1, 2),
+                 streaming_idf: Optional[bool] = None):
+        self.n_features = n_features or FEATURE_CONFIG['hashing_n_features']
+        self.ngram_range = ngram_range
+        self.streaming_idf = (
+            FEATURE_CONFIG['streaming_idf'] if streaming_idf is None
+            else streaming_idf
+        )
+        self.vectorizer = HashingVectorizer(
+            n_features=self.n_features,
+            ngram_range=ngram_range,
+            stop_words=get_lexicon().stop_words(),
+            alternate_sign=False,
+            norm=None,
+            dtype=np.float32
+        )
+        self.doc_count = 0
+        self.doc_freq = np.zeros(self.n_features, dtype=np.int64)
+    
+    def hash_texts(self, texts: Iterable[str]) -> csr_matrix:
+        """
+        Hash teks mentah menjadi matrix count (dokumen x n_features).
+        
+        Args:
+            texts: Teks yang sudah dibersihkan
+            
+        Returns:
+            CSR matrix count float32
+        """
+        return self.vectorizer.transform(texts)
+    
+    def hash_counts(self, counts: csr_matrix, feature_names: List[str]) -> csr_matrix:
+        """
+        Hash matrix count n-gram (mis. dari TokenCache) tanpa tokenisasi ulang.
+        
+        Setiap nama fitur di-hash sekali dengan fungsi hash yang sama seperti
+        hash_texts, jadi hasilnya identik dengan hash_texts pada teks aslinya.
+        
+        Args:
+            counts: Matrix count (dokumen x fitur lokal)
+            feature_names: Nama fitur (n-gram dipisah spasi)
+            
+        Returns:
+            CSR matrix count float32 (dokumen x n_features)
+        """
+        projection = HashingVectorizer(
+            n_features=self.n_features,
+            analyzer=lambda name: [name],
+            alternate_sign=False,
+            norm=None,
+            dtype=np.float32
+        ).transform(feature_names)
+        return csr_matrix(counts.astype(np.float32) @ projection)
+    
+    def partial_fit(self, hashed_counts: csr_matrix) -> 'HashingFeatureModel':
+        """
+        Update document frequency dari satu batch.
+        
+        Args:
+            hashed_counts: Matrix count hasil hash_texts / hash_counts
+            
+        Returns:
+            Self untuk method chaining
+        """
+        hashed_counts = csr_matrix(hashed_counts)
+        hashed_counts.sum_duplicates()
+        self.doc_count += hashed_counts.shape[0]
+        self.doc_freq += np.bincount(
+            hashed_counts.indices, minlength=self.n_features
+        )
+        return self
+    
+    def idf(self) -> np.ndarray:
+        """
+        IDF (smooth) dari document frequency yang sudah terkumpul.
+        
+        Returns:
+            Array IDF float32 per kolom
+        """
+        idf = np.log((1 + self.doc_count) / (1 + self.doc_freq)) + 1
+        return idf.astype(np.float32)
+    
+    def weight(self, hashed_counts: csr_matrix, update_idf: bool = False) -> csr_matrix:
+        """
+        Terapkan IDF (jika streaming_idf aktif) dan normalisasi l2.
+        
+        Args:
+            hashed_counts: Matrix count hasil hashing
+            update_idf: Update document frequency dengan batch ini dulu
+            
+        Returns:
+            CSR matrix float32 ter-normalisasi
+        """
+        if self.streaming_idf:
+            if update_idf:
+                self.partial_fit(hashed_counts)
+            hashed_counts = hashed_counts @ diags(self.idf())
+        return normalize(csr_matrix(hashed_counts, dtype=np.float32))
+    
+    def transform(self, texts: Iterable[str], update_idf: bool = False) -> csr_matrix:
+        """
+        Vectorisasi satu batch teks (hash -> IDF -> normalisasi).
+        
+        Args:
+            texts: Teks yang sudah dibersihkan
+            update_idf: Update document frequency dengan batch ini dulu
+            
+        Returns:
+            CSR matrix float32 (dokumen x n_features)
+        """
+        return self.weight(self.hash_texts(texts), update_idf=update_idf)
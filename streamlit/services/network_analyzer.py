@@ -4,18 +4,59 @@ Service untuk analisis Social Network Analysis (SNA)
 import pandas as pd
 import numpy as np
 import networkx as nx
-from sklearn.metrics.pairwise import cosine_similarity
+from scipy.sparse import issparse
+from sklearn.preprocessing import normalize
+from config import FEATURE_CONFIG, PROGRESS_CONFIG
+from utils.profiling import timed
+from utils.progress import report_progress
 
 
 class NetworkAnalyzer:
     """Handler untuk Social Network Analysis."""
     
-    def __init__(self, data: pd.DataFrame, tfidf_matrix):
+    def __init__(self, data: pd.DataFrame, tfidf_matrix, char_matrix=None,
+                 representation: str = None, embedding_matrix=None,
+                 group_column: str = None):
         self.data = data.copy()
+        # Kolom partisi (mis. request di service scoring): edge hanya dibuat
+        # di dalam grup yang sama dan centrality dinormalisasi per grup
+        self.group_column = group_column
         self.tfidf_matrix = tfidf_matrix
+        self.char_matrix = char_matrix
+        self.embedding_matrix = embedding_matrix
+        self.representation = (
+            representation or FEATURE_CONFIG['network_representation']
+        )
         self.graph = None
         self.degree_centrality = {}
     
+    def get_feature_matrix(self):
+        """
+        Matrix fitur yang dipakai untuk similarity sesuai representation.
+        
+        Returns:
+            Matrix char n-gram ('char'), embedding dense ('embedding'),
+            atau TF-IDF kata ('word')
+        """
+        if self.representation == 'embedding':
+            if self.embedding_matrix is None:
+                raise ValueError(
+                    "Representation 'embedding' membutuhkan embedding_matrix dari "
+                    "FeatureExtractor.create_embeddings()"
+                )
+            return self.embedding_matrix
+        if self.representation == 'char':
+            if self.char_matrix is None:
+                raise ValueError(
+                    "Representation 'char' membutuhkan char_matrix dari "
+                    "FeatureExtractor.create_char_matrix()"
+                )
+            return self.char_matrix
+        if self.representation != 'word':
+            raise ValueError(f"Representation tidak dikenal: {self.representation}")
+        return self.tfidf_matrix
+    
+    @timed()
     def build_similarity_network(self, threshold: float = 0.3) -> 'NetworkAnalyzer':
         """
         Bangun network berdasarkan text similarity.
@@ -29,31 +70,56 @@ class NetworkAnalyzer:
         self.graph = nx.Graph()
         
         # Tambah nodes (authors)
-        authors = self.data['authorDisplayName'].unique()
+        author_codes, authors = pd.factorize(self.data['authorDisplayName'])
         self.graph.add_nodes_from(authors)
         
-        # Hitung similarity matrix
-        if self.tfidf_matrix is not None:
-            sim_matrix = cosine_similarity(self.tfidf_matrix)
+        # Similarity dihitung per tile baris sehingga memory tetap
+        # (tile x n_baris) dan progress bisa dilaporkan per tile
+        feature_matrix = self.get_feature_matrix()
+        if feature_matrix is not None:
+            normalized = normalize(feature_matrix)
+            n_rows = normalized.shape[0]
+            tile_rows = PROGRESS_CONFIG['similarity_tile_rows']
+            done = 0
             
-            # Tambah edges berdasarkan similarity
-            for i in range(len(self.data)):
-                for j in range(i + 1, len(self.data)):
-                    if sim_matrix[i, j] > threshold:
-                        author_i = self.data.iloc[i]['authorDisplayName']
-                        author_j = self.data.iloc[j]['authorDisplayName']
-                        
-                        if author_i != author_j:
-                            if self.graph.has_edge(author_i, author_j):
-                                self.graph[author_i][author_j]['weight'] += sim_matrix[i, j]
-                            else:
-                                self.graph.add_edge(
-                                    author_i, author_j,
-                                    weight=sim_matrix[i, j]
-                                )
+            for partition in self._partitions():
+                part = normalized[partition]
+                part_t = part.T.tocsr() if issparse(part) else part.T
+                for start in range(0, len(partition), tile_rows):
+                    end = min(start + tile_rows, len(partition))
+                    tile = part[start:end] @ part_t
+                    if issparse(tile):
+                        tile = tile.tocoo()
+                        rows, cols, values = tile.row + start, tile.col, tile.data
+                    else:
+                        rows, cols = np.nonzero(tile > threshold)
+                        values = tile[rows, cols]
+                        rows = rows + start
+                    
+                    # Pasangan i < j di atas threshold dari author berbeda
+                    rows, cols = partition[rows], partition[cols]
+                    keep = (
+                        (cols > rows) & (values > threshold)
+                        & (author_codes[rows] != author_codes[cols])
+                    )
+                    rows, cols, values = rows[keep], cols[keep], values[keep]
+                    order = np.lexsort((cols, rows))
+                    
+                    # Tambah edges berdasarkan similarity (urutan baris seperti loop i, j)
+                    for i, j, similarity in zip(rows[order], cols[order], values[order]):
+                        author_i = authors[author_codes[i]]
+                        author_j = authors[author_codes[j]]
+                        if self.graph.has_edge(author_i, author_j):
+                            self.graph[author_i][author_j]['weight'] += similarity
+                        else:
+                            self.graph.add_edge(author_i, author_j, weight=similarity)
+                    
+                    done += end - start
+                    report_progress(done, n_rows, 'similarity')
         
         return self
     
+    @timed()
     def calculate_centrality(self) -> 'NetworkAnalyzer':
         """
         Hitung degree centrality untuk setiap node.
@@ -61,10 +127,30 @@ class NetworkAnalyzer:
         Returns:
             Self untuk method chaining
         """
-        if self.graph is not None:
+        if self.graph is None:
+            return self
+        if self.group_column is None:
             self.degree_centrality = nx.degree_centrality(self.graph)
+            return self
+        
+        # Sama seperti nx.degree_centrality, tetapi n = jumlah node di grup
+        node_groups = self.data.drop_duplicates('authorDisplayName').set_index(
+            'authorDisplayName'
+        )[self.group_column]
+        nodes, degrees = zip(*self.graph.degree()) if len(self.graph) else ((), ())
+        sizes = node_groups.map(node_groups.value_counts()).reindex(list(nodes)).to_numpy(float)
+        centrality = np.where(
+            sizes > 1, np.asarray(degrees) * (1.0 / np.maximum(sizes - 1.0, 1.0)), 1.0
+        )
+        self.degree_centrality = dict(zip(nodes, centrality))
         return self
     
+    def _partitions(self) -> list:
+        """Indeks baris per grup (satu partisi berisi semua baris tanpa grup)."""
+        if self.group_column is None:
+            return [np.arange(len(self.data))]
+        return list(self.data.groupby(self.group_column, sort=False).indices.values())
+    
     def get_centrality_df(self) -> pd.DataFrame:
         """
         Mendapatkan degree centrality sebagai DataFrame.
@@ -107,7 +193,8 @@ class NetworkAnalyzer:
             'edges': self.graph.number_of_edges(),
             'density': nx.density(self.graph) if self.graph.number_of_nodes() > 1 else 0,
             'avg_degree': sum(dict(self.graph.degree()).values()) / self.graph.number_of_nodes()
-            if self.graph.number_of_nodes() > 0 else 0
+            if self.graph.number_of_nodes() > 0 else 0,
+            'representation': self.representation
         }
     
     def get_graph(self) -> nx.Graph:
@@ -0,0 +1,298 @@
+"""
+Pipeline deteksi per tahap (tanpa Streamlit), dipakai UI dan CLI
+"""
+import time
+from functools import wraps
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+from config import (
+    ACTIVITY_CONFIG, AUTHOR_INDEX_CONFIG, BUZZER_CATEGORIES, DATETIME_FORMAT,
+    EMBEDDING_CONFIG, FEATURE_CONFIG, ISOLATION_FOREST_CONFIG, ML_FEATURES,
+    NEAR_DUPLICATE_CONFIG, NEAR_DUPLICATE_ML_FEATURES, NETWORK_CONFIG,
+    REQUIRED_COLUMNS, SCORE_WEIGHTS, STREAM_CONFIG, TFIDF_STATE_CONFIG,
+    THRESHOLDS
+)
+from services.author_index import AuthorIndex
+from services.buzzer_detector import BuzzerDetector
+from services.data_cleaner import DataCleaner
+from services.data_loader import DataLoader
+from services.feature_extractor import FeatureExtractor
+from services.network_analyzer import NetworkAnalyzer
+from services.tfidf_state import TfidfState
+from utils.cache_keys import config_key, content_hash, lexicon_key
+from utils.profiling import StageTimer
+
+STAGES = ['load', 'clean', 'features', 'network', 'detect', 'index']
+
+
+def stage_keys(content_key: str, network_threshold: Optional[float] = None) -> Dict[str, str]:
+    """
+    Kunci cache per tahap: kunci tahap sebelumnya + potongan config yang
+    dipakai tahap tersebut, sehingga hanya tahap yang input-nya berubah
+    yang perlu dihitung ulang.
+    
+    Args:
+        content_key: Hash isi file upload (content_hash)
+        network_threshold: Threshold similarity network
+        
+    Returns:
+        Dictionary {nama tahap: kunci}
+    """
+    if network_threshold is None:
+        network_threshold = NETWORK_CONFIG['similarity_threshold']
+    
+    keys = {}
+    keys['load'] = config_key(content_key, STREAM_CONFIG, REQUIRED_COLUMNS)
+    keys['clean'] = config_key(
+        keys['load'], DATETIME_FORMAT, NEAR_DUPLICATE_CONFIG, lexicon_key()
+    )
+    
+    feature_parts = [keys['clean'], FEATURE_CONFIG, EMBEDDING_CONFIG]
+    if FEATURE_CONFIG['mode'] == 'persisted':
+        # Versi state (naik setiap save yang menambah DF, termasuk dari
+        # worker lain), sehingga IDF basi tidak dipakai dari cache. Upload
+        # yang sama tidak menaikkan versi lagi setelah run pertamanya.
+        feature_parts += [TFIDF_STATE_CONFIG, TfidfState.read_version()]
+    keys['features'] = config_key(*feature_parts)
+    
+    keys['network'] = config_key(keys['features'], network_threshold)
+    keys['detect'] = config_key(
+        keys['network'], THRESHOLDS, SCORE_WEIGHTS, BUZZER_CATEGORIES,
+        ISOLATION_FOREST_CONFIG, ML_FEATURES, NEAR_DUPLICATE_ML_FEATURES,
+        ACTIVITY_CONFIG
+    )
+    keys['index'] = config_key(keys['features'], AUTHOR_INDEX_CONFIG)
+    # Id hasil akhir (user_activity + summary) untuk ResultStore
+    keys['result'] = config_key(keys['detect'], keys['index'])
+    return keys
+
+
+def _timed_stage(name: str):
+    """
+    Decorator tahap: catat waktu tahap dan sub-tahap (method service @timed).
+    
+    Hasil tahap ditambah 'timings' (record StageTimer) dan 'computed_at',
+    sehingga timing ikut tersimpan di cache dan cache hit bisa dikenali.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            timer = StageTimer()
+            with timer.stage(name) as record:
+                result = func(*args, **kwargs)
+                record['rows'] = result.get('rows')
+            result['timings'] = timer.records
+            result['computed_at'] = time.time()
+            return result
+        return wrapper
+    return decorator
+
+
+@_timed_stage('load')
+def run_load(files: List) -> dict:
+    """
+    Tahap 1: load dan merge file.
+    
+    Args:
+        files: Path atau objek file
+        
+    Returns:
+        Dictionary berisi data dan load_stats
+    """
+    loader = DataLoader()
+    data = loader.load_multiple_files(files)
+    return {'data': data, 'load_stats': loader.get_stats(), 'rows': len(data)}
+
+
+@_timed_stage('clean')
+def run_clean(merged_data: pd.DataFrame) -> dict:
+    """
+    Tahap 2: cleaning data.
+    
+    Args:
+        merged_data: Data hasil run_load
+        
+    Returns:
+        Dictionary berisi data, clean_stats, dan token_cache
+    """
+    cleaner = DataCleaner(merged_data)
+    data = cleaner.process_all()
+    return {
+        'data': data,
+        'clean_stats': cleaner.get_cleaning_stats(),
+        'token_cache': cleaner.get_token_cache(),
+        'rows': len(merged_data)
+    }
+
+
+@_timed_stage('features')
+def run_features(cleaned: dict) -> dict:
+    """
+    Tahap 3: ekstraksi fitur dan matrix teks.
+    
+    Args:
+        cleaned: Hasil run_clean
+        
+    Returns:
+        Dictionary berisi data, matrix teks, embedding, feature_memory, dan
+        vectorizer (untuk transform komentar baru)
+    """
+    extractor = FeatureExtractor(cleaned['data'], cleaned['token_cache'])
+    data = extractor.extract_all()
+    return {
+        'data': data,
+        'tfidf_matrix': extractor.get_tfidf_matrix(),
+        'char_matrix': extractor.get_char_matrix(),
+        'comment_embeddings': extractor.get_comment_embeddings(),
+        'author_embeddings': extractor.get_author_embeddings(),
+        'feature_memory': extractor.get_memory_report(),
+        'vectorizer': extractor.get_vectorizer(),
+        'rows': len(data)
+    }
+
+
+@_timed_stage('network')
+def run_network(features: dict, threshold: Optional[float] = None) -> dict:
+    """
+    Tahap 4: Social Network Analysis.
+    
+    Args:
+        features: Hasil run_features
+        threshold: Threshold similarity, default NETWORK_CONFIG
+        
+    Returns:
+        Dictionary berisi centrality_df, network_stats, dan graph
+    """
+    if threshold is None:
+        threshold = NETWORK_CONFIG['similarity_threshold']
+    
+    network = NetworkAnalyzer(
+        features['data'], features['tfidf_matrix'], features['char_matrix'],
+        embedding_matrix=features['comment_embeddings']
+    )
+    centrality_df = network.analyze(threshold=threshold)
+    return {
+        'centrality_df': centrality_df,
+        'network_stats': network.get_network_stats(),
+        'graph': network.get_graph(),
+        'rows': len(features['data'])
+    }
+
+
+@_timed_stage('detect')
+def run_detect(features: dict, network: dict) -> dict:
+    """
+    Tahap 5: deteksi buzzer (rule-based + Isolation Forest).
+    
+    Args:
+        features: Hasil run_features
+        network: Hasil run_network
+        
+    Returns:
+        Dictionary berisi user_activity, summary, shift_matches, dan model
+        ML yang sudah di-fit (scaler, iso_forest)
+    """
+    similarity_matrix = (
+        features['comment_embeddings']
+        if EMBEDDING_CONFIG['enabled'] else features['tfidf_matrix']
+    )
+    detector = BuzzerDetector(
+        features['data'], network['centrality_df'], similarity_matrix
+    )
+    user_activity = detector.detect()
+    return {
+        'user_activity': user_activity,
+        'summary': detector.get_summary(),
+        'shift_matches': detector.get_shift_matches(),
+        'scaler': detector.scaler,
+        'iso_forest': detector.iso_forest,
+        'rows': len(features['data'])
+    }
+
+
+def run_index(features: dict) -> AuthorIndex:
+    """
+    Index author mirip dari hasil ekstraksi fitur.
+    
+    Args:
+        features: Hasil run_features
+        
+    Returns:
+        AuthorIndex
+    """
+    return AuthorIndex.build(
+        features['data'], features['tfidf_matrix'], features['author_embeddings']
+    )
+
+
+def build_summary(loaded: dict, cleaned: dict, features: dict, network: dict,
+                  detected: dict, author_index: AuthorIndex = None,
+                  run_started: Optional[float] = None) -> dict:
+    """
+    Gabungkan statistik semua tahap ke summary hasil deteksi.
+    
+    Args:
+        loaded, cleaned, features, network, detected: Hasil setiap tahap
+        author_index: Index author mirip
+        run_started: time.time() saat run dimulai; tahap yang dihitung
+            sebelum waktu ini berasal dari cache
+            
+    Returns:
+        Dictionary summary (salinan, aman diubah)
+    """
+    stages = {
+        'load': loaded, 'clean': cleaned, 'features': features,
+        'network': network, 'detect': detected
+    }
+    summary = dict(detected['summary'])
+    summary['stage_timings'] = [
+        dict(record) for result in stages.values()
+        for record in result.get('timings', [])
+    ]
+    summary['cached_stages'] = [
+        name for name, result in stages.items()
+        if run_started is not None and result.get('computed_at', run_started) < run_started
+    ]
+    summary['load_stats'] = loaded['load_stats']
+    summary['clean_stats'] = cleaned['clean_stats']
+    summary['network_stats'] = network['network_stats']
+    summary['feature_memory'] = features['feature_memory']
+    summary['author_index'] = author_index
+    summary['graph'] = network['graph']
+    return summary
+
+
+def run_pipeline(files: List, threshold: Optional[float] = None,
+                 on_stage: Optional[Callable[[str], None]] = None):
+    """
+    Jalankan semua tahap berurutan tanpa cache.
+    
+    Args:
+        files: Path atau objek file
+        threshold: Threshold similarity network
+        on_stage: Callback dipanggil dengan nama tahap sebelum tahap dimulai
+        
+    Returns:
+        Tuple (user_activity DataFrame, summary dict)
+    """
+    notify = on_stage or (lambda stage: None)
+    run_started = time.time()
+    
+    notify('load')
+    loaded = run_load(files)
+    notify('clean')
+    cleaned = run_clean(loaded['data'])
+    notify('features')
+    features = run_features(cleaned)
+    notify('network')
+    network = run_network(features, threshold)
+    notify('detect')
+    detected = run_detect(features, network)
+    notify('index')
+    author_index = run_index(features)
+    
+    summary = build_summary(
+        loaded, cleaned, features, network, detected, author_index, run_started
+    )
+    return detected['user_activity'], summary
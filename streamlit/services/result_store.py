@@ -0,0 +1,268 @@
+"""
+Store hasil deteksi bersama antar sesi (satu per proses), LRU berbatas memory
+dengan spill ke disk
+"""
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from config import RESULT_STORE_CONFIG
+
+
+def estimate_bytes(value, _seen: Optional[set] = None) -> int:
+    """
+    Perkiraan memory sebuah hasil (DataFrame, array, graph, dict, objek).
+    
+    Objek yang dipakai bersama (mis. DataFrame yang sama di dua tempat)
+    hanya dihitung sekali. Ukuran graph networkx diperkirakan dari jumlah
+    node/edge (RESULT_STORE_CONFIG).
+    
+    Args:
+        value: Objek yang diukur
+        
+    Returns:
+        Perkiraan ukuran dalam byte
+    """
+    seen = set() if _seen is None else _seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, 'sum') else usage)
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if hasattr(value, 'indptr') and hasattr(value, 'data'):
+        return int(value.data.nbytes + value.indices.nbytes + value.indptr.nbytes)
+    if hasattr(value, 'number_of_edges') and hasattr(value, 'number_of_nodes'):
+        return (
+            value.number_of_nodes() * RESULT_STORE_CONFIG['graph_node_bytes']
+            + value.number_of_edges() * RESULT_STORE_CONFIG['graph_edge_bytes']
+        )
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_bytes(k, seen) + estimate_bytes(v, seen) for k, v in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_bytes(v, seen) for v in value)
+    if hasattr(value, '__dict__') and not isinstance(value, type):
+        return sys.getsizeof(value) + estimate_bytes(vars(value), seen)
+    return sys.getsizeof(value)
+
+
+class ResultStore:
+    """
+    Hasil deteksi (user_activity, summary) per result id, dipakai bersama
+    oleh semua sesi Streamlit di proses yang sama.
+    
+    Sesi hanya menyimpan result id; beberapa analis yang membuka kampanye
+    yang sama memakai satu salinan. Jika total memory melewati max_memory_mb,
+    entri yang paling lama tidak dipakai di-pickle ke disk dan dimuat lagi
+    saat diminta. File spill juga dibatasi max_disk_mb (yang paling lama
+    dihapus). Hasil yang dikembalikan dipakai bersama: jangan diubah.
+    
+    Objek summary yang dimiliki cache lain (mis. graph dan author index dari
+    st.cache_resource) bisa ditandai `shared` saat put(): store hanya
+    memegang weak reference ke objek tersebut, jadi objek tidak dihitung ke
+    batas memory, tidak ikut di-pickle saat spill, dan tetap bisa dibebaskan
+    saat cache pemiliknya membuangnya. Selama objek masih hidup, get()
+    memasangnya kembali apa adanya (tanpa salinan ganda); jika sudah
+    dibebaskan, kuncinya bernilai None (stats['shared_lost']) dan pemanggil
+    bisa membangun ulang dari cache atau arsip run.
+    """
+    
+    def __init__(self, max_memory_mb: Optional[float] = None,
+                 max_disk_mb: Optional[float] = None,
+                 spill_dir: Optional[str] = None):
+        self.max_memory = (
+            max_memory_mb or RESULT_STORE_CONFIG['max_memory_mb']
+        ) * 1024 ** 2
+        self.max_disk = (
+            max_disk_mb or RESULT_STORE_CONFIG['max_disk_mb']
+        ) * 1024 ** 2
+        self.spill_dir = spill_dir or RESULT_STORE_CONFIG['spill_dir']
+        self._lock = threading.RLock()
+        # result id -> (user_activity, summary), urutan LRU
+        self._memory: 'OrderedDict[str, Tuple]' = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        # result id -> (path, ukuran file), urutan spill
+        self._disk: 'OrderedDict[str, Tuple[str, int]]' = OrderedDict()
+        # result id -> {kunci summary: weak reference ke objek milik cache lain}
+        self._shared: Dict[str, Dict[str, weakref.ref]] = {}
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+        self.stats = {
+            'hits': 0, 'disk_hits': 0, 'misses': 0, 'spills': 0, 'dropped': 0,
+            'shared_lost': 0
+        }
+    
+    def _spill_path(self, result_id: str) -> str:
+        """Path file spill untuk result id (direktori dibuat saat pertama)."""
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.mkdtemp(prefix='buzzer-results-')
+        os.makedirs(self.spill_dir, exist_ok=True)
+        return os.path.join(self.spill_dir, f"{result_id}.pkl")
+    
+    def _remove_disk(self, result_id: str):
+        """Hapus file spill result id."""
+        path, size = self._disk.pop(result_id)
+        self.disk_bytes -= size
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    
+    def _evict(self):
+        """Spill entri LRU sampai memory di bawah batas (entri terbaru tetap)."""
+        while self.memory_bytes > self.max_memory and len(self._memory) > 1:
+            result_id, (user_activity, summary) = self._memory.popitem(last=False)
+            self.memory_bytes -= self._sizes.pop(result_id)
+            
+            path = self._spill_path(result_id)
+            with open(path, 'wb') as f:
+                pickle.dump(
+                    (user_activity, summary), f, protocol=pickle.HIGHEST_PROTOCOL
+                )
+            self._disk[result_id] = (path, os.path.getsize(path))
+            self.disk_bytes += self._disk[result_id][1]
+            self.stats['spills'] += 1
+            
+            while self.disk_bytes > self.max_disk and self._disk:
+                dropped = next(iter(self._disk))
+                self._remove_disk(dropped)
+                self._shared.pop(dropped, None)
+                self.stats['dropped'] += 1
+    
+    def _attach_shared(self, result_id: str, summary: dict) -> dict:
+        """Summary dengan objek shared yang masih hidup (None jika sudah dibebaskan)."""
+        refs = self._shared.get(result_id)
+        if not refs:
+            return summary
+        attached = dict(summary)
+        for key, ref in refs.items():
+            attached[key] = ref()
+            if attached[key] is None:
+                self.stats['shared_lost'] += 1
+        return attached
+    
+    def put(self, result_id: str, user_activity: pd.DataFrame, summary: dict,
+            shared: Tuple[str, ...] = ()) -> str:
+        """
+        Simpan hasil deteksi.
+        
+        Args:
+            result_id: Kunci hasil (hash isi upload + config, stage_keys()['result'])
+            user_activity: DataFrame hasil per author
+            summary: Dictionary summary
+            shared: Kunci summary yang objeknya dimiliki cache lain
+                (hanya dipegang lewat weak reference)
+                
+        Returns:
+            result_id
+        """
+        with self._lock:
+            if result_id in self._memory:
+                self.memory_bytes -= self._sizes.pop(result_id)
+                del self._memory[result_id]
+            if result_id in self._disk:
+                self._remove_disk(result_id)
+            
+            self._shared[result_id] = {
+                k: weakref.ref(summary[k]) for k in shared if summary.get(k) is not None
+            }
+            owned = {
+                k: v for k, v in summary.items() if k not in self._shared[result_id]
+            }
+            self._memory[result_id] = (user_activity, owned)
+            self._sizes[result_id] = estimate_bytes((user_activity, owned))
+            self.memory_bytes += self._sizes[result_id]
+            self._evict()
+        return result_id
+    
+    def get(self, result_id: Optional[str]) -> Optional[Tuple[pd.DataFrame, dict]]:
+        """
+        Ambil hasil deteksi (dari memory, atau dimuat ulang dari disk).
+        
+        Args:
+            result_id: Kunci hasil
+            
+        Returns:
+            Tuple (user_activity, summary), atau None jika tidak ada
+            (belum pernah disimpan atau sudah dibuang dari disk)
+        """
+        with self._lock:
+            if result_id in self._memory:
+                self._memory.move_to_end(result_id)
+                self.stats['hits'] += 1
+                user_activity, summary = self._memory[result_id]
+                return user_activity, self._attach_shared(result_id, summary)
+            if result_id not in self._disk:
+                self.stats['misses'] += 1
+                return None
+            
+            path = self._disk[result_id][0]
+            with open(path, 'rb') as f:
+                user_activity, summary = pickle.load(f)
+            self._remove_disk(result_id)
+            self.stats['disk_hits'] += 1
+            # Weak reference shared tetap di self._shared sejak put()
+            self._memory[result_id] = (user_activity, summary)
+            self._sizes[result_id] = estimate_bytes((user_activity, summary))
+            self.memory_bytes += self._sizes[result_id]
+            self._evict()
+            return user_activity, self._attach_shared(result_id, summary)
+    
+    def __contains__(self, result_id: str) -> bool:
+        with self._lock:
+            return result_id in self._memory or result_id in self._disk
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._memory) + len(self._disk)
+    
+    def clear(self):
+        """Kosongkan memory dan hapus semua file spill."""
+        with self._lock:
+            for result_id in list(self._disk):
+                self._remove_disk(result_id)
+            self._memory.clear()
+            self._sizes.clear()
+            self._shared.clear()
+            self.memory_bytes = 0
+    
+    def get_info(self) -> dict:
+        """Ringkasan isi store untuk ditampilkan."""
+        with self._lock:
+            return {
+                'in_memory': len(self._memory),
+                'on_disk': len(self._disk),
+                'memory_mb': self.memory_bytes / 1024 ** 2,
+                'disk_mb': self.disk_bytes / 1024 ** 2,
+                **self.stats
+            }
+
+
+_default_store: Optional[ResultStore] = None
+_default_lock = threading.Lock()
+
+
+def get_result_store() -> ResultStore:
+    """
+    Mendapatkan result store bersama (satu per proses).
+    
+    Returns:
+        ResultStore default
+    """
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = ResultStore()
+    return _default_store
@@ -0,0 +1,288 @@
+"""
+Arsip hasil run (Parquet + graph biner) yang bisa dimuat ulang per run id
+"""
+import importlib.util
+import json
+import os
+import re
+import shutil
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from config import NETWORK_CONFIG, RUN_ARCHIVE_CONFIG
+
+MANIFEST_FILE = 'manifest.json'
+USER_ACTIVITY_FILE = 'user_activity.parquet'
+SUMMARY_FILE = 'summary.json'
+GRAPH_FILE = 'graph.npz'
+AUTHOR_INDEX_FILE = 'author_index.npz'
+
+# Objek di summary yang disimpan ke file sendiri, bukan ke summary.json
+SUMMARY_OBJECTS = ('graph', 'author_index', 'run_id')
+
+RUN_ID_PATTERN = re.compile(r'^[\w-]+$')
+
+
+def _json_default(value):
+    """Konversi nilai numpy/pandas yang tidak dikenal json."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    return str(value)
+
+
+def save_graph(graph, centrality: pd.Series, path: Union[str, Path]):
+    """
+    Simpan graph similarity sebagai edge list biner (.npz).
+    
+    Args:
+        graph: networkx Graph (node = author, atribut edge weight)
+        centrality: Degree centrality per author (index = author)
+        path: Path file graph
+    """
+    nodes = list(graph.nodes())
+    position = {node: i for i, node in enumerate(nodes)}
+    edges = list(graph.edges(data='weight', default=1.0))
+    with open(path, 'wb') as f:
+        np.savez_compressed(
+            f,
+            nodes=np.array([str(node) for node in nodes]),
+            degree_centrality=centrality.reindex(nodes).fillna(0.0).to_numpy(np.float64),
+            source=np.fromiter((position[u] for u, _, _ in edges), np.int32, len(edges)),
+            target=np.fromiter((position[v] for _, v, _ in edges), np.int32, len(edges)),
+            weight=np.fromiter((w for _, _, w in edges), np.float64, len(edges))
+        )
+
+
+def load_graph(path: Union[str, Path], max_nodes: Optional[int] = None):
+    """
+    Bangun ulang networkx Graph dari file hasil save_graph().
+    
+    Membangun graph networkx ratusan ribu edge butuh hampir satu detik,
+    padahal halaman hasil hanya menggambar node dengan degree tertinggi.
+    Dengan max_nodes, node dipilih dari degree graph penuh (dihitung dari
+    edge list) dan hanya subgraph node tersebut yang dibangun; jumlah node
+    dan edge asli disimpan di graph.graph['total_nodes'/'total_edges'].
+    
+    Args:
+        path: Path file graph
+        max_nodes: Batas node (degree tertinggi), None = graph penuh
+        
+    Returns:
+        networkx Graph
+    """
+    import networkx as nx
+    
+    with np.load(path, allow_pickle=False) as stored:
+        nodes = stored['nodes']
+        source = stored['source']
+        target = stored['target']
+        weight = stored['weight']
+    
+    graph = nx.Graph(total_nodes=len(nodes), total_edges=len(source))
+    if max_nodes is not None and len(nodes) > max_nodes:
+        degree = (
+            np.bincount(source, minlength=len(nodes))
+            + np.bincount(target, minlength=len(nodes))
+        )
+        # Stable: degree sama diurutkan sesuai urutan node (seperti sorted())
+        keep = np.zeros(len(nodes), dtype=bool)
+        keep[np.argsort(-degree, kind='stable')[:max_nodes]] = True
+        edge_mask = keep[source] & keep[target]
+        graph.add_nodes_from(nodes[keep].tolist())
+        source, target, weight = source[edge_mask], target[edge_mask], weight[edge_mask]
+    else:
+        graph.add_nodes_from(nodes.tolist())
+    
+    graph.add_weighted_edges_from(
+        zip(nodes[source].tolist(), nodes[target].tolist(), weight.tolist())
+    )
+    return graph
+
+
+class RunArchive:
+    """
+    Arsip hasil deteksi di disk, satu direktori per run id:
+    
+    - manifest.json: metadata run (waktu, file sumber, jumlah user)
+    - user_activity.parquet: hasil per author
+    - summary.json: statistik summary (tanpa objek graph/index)
+    - graph.npz: edge list (indeks node + weight) dan degree centrality
+    - author_index.npz: vektor index author mirip
+    
+    Memuat run hanya membaca file tersebut, tanpa menjalankan tahap pipeline.
+    """
+    
+    def __init__(self, root: Optional[Union[str, Path]] = None):
+        self.root = Path(root or RUN_ARCHIVE_CONFIG['dir'])
+    
+    @staticmethod
+    def check_engine():
+        """
+        Pastikan engine Parquet tersedia.
+        
+        Raises:
+            ImportError: Jika pyarrow/fastparquet belum terinstall
+        """
+        if not any(
+            importlib.util.find_spec(engine) for engine in ('pyarrow', 'fastparquet')
+        ):
+            raise ImportError("Arsip run membutuhkan pyarrow (pip install pyarrow)")
+    
+    def _run_dir(self, run_id: str) -> Path:
+        """Direktori run; menolak run id yang bukan nama direktori biasa."""
+        if not RUN_ID_PATTERN.match(run_id or ''):
+            raise ValueError(f"Run id tidak valid: {run_id!r}")
+        return self.root / run_id
+    
+    def save(self, result_id: str, user_activity: pd.DataFrame, summary: dict,
+             sources: Optional[List[str]] = None) -> str:
+        """
+        Simpan hasil deteksi sebagai run baru.
+        
+        Ditulis ke direktori sementara lalu di-rename, sehingga run yang
+        terlihat di list_runs() selalu lengkap.
+        
+        Args:
+            result_id: Kunci hasil (stage_keys()['result'])
+            user_activity: DataFrame hasil per author
+            summary: Dictionary summary (boleh berisi graph dan author_index)
+            sources: Nama file input
+            
+        Returns:
+            Run id
+        """
+        self.check_engine()
+        created_at = time.time()
+        run_id = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(created_at))}-{result_id[:8]}"
+        run_dir = self._run_dir(run_id)
+        tmp_dir = self.root / f".{run_id}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        tmp_dir.mkdir(parents=True)
+        
+        user_activity.to_parquet(
+            tmp_dir / USER_ACTIVITY_FILE, index=False,
+            compression=RUN_ARCHIVE_CONFIG['parquet_compression']
+        )
+        stats = {k: v for k, v in summary.items() if k not in SUMMARY_OBJECTS}
+        with open(tmp_dir / SUMMARY_FILE, 'w', encoding='utf-8') as f:
+            json.dump(stats, f, default=_json_default)
+        
+        if summary.get('graph') is not None:
+            save_graph(
+                summary['graph'],
+                user_activity.set_index('author')['degree_centrality'],
+                tmp_dir / GRAPH_FILE
+            )
+        if summary.get('author_index') is not None:
+            summary['author_index'].save(tmp_dir / AUTHOR_INDEX_FILE)
+        
+        manifest = {
+            'run_id': run_id,
+            'result_id': result_id,
+            'created_at': created_at,
+            'sources': list(sources or []),
+            'total_users': int(summary.get('total_users', len(user_activity))),
+            'high_suspicion': int(summary.get('high_suspicion', 0)),
+            'rows': int(summary.get('load_stats', {}).get('total_rows', 0))
+        }
+        with open(tmp_dir / MANIFEST_FILE, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2)
+        
+        shutil.rmtree(run_dir, ignore_errors=True)
+        os.replace(tmp_dir, run_dir)
+        self.prune()
+        return run_id
+    
+    def load(self, run_id: str, full_graph: bool = False) -> Tuple[pd.DataFrame, dict]:
+        """
+        Muat hasil run tanpa menjalankan ulang pipeline.
+        
+        Args:
+            run_id: Id run (lihat list_runs())
+            full_graph: Bangun graph penuh; default hanya node yang
+                ditampilkan (NETWORK_CONFIG['display_max_nodes'])
+                
+        Returns:
+            Tuple (user_activity DataFrame, summary dict) seperti hasil
+            pipeline, dengan summary['run_id'] terisi
+            
+        Raises:
+            FileNotFoundError: Jika run tidak ada
+        """
+        from services.author_index import AuthorIndex
+        
+        self.check_engine()
+        run_dir = self._run_dir(run_id)
+        if not (run_dir / MANIFEST_FILE).exists():
+            raise FileNotFoundError(f"Run {run_id} tidak ditemukan di {self.root}")
+        
+        user_activity = pd.read_parquet(run_dir / USER_ACTIVITY_FILE)
+        with open(run_dir / SUMMARY_FILE, encoding='utf-8') as f:
+            summary = json.load(f)
+        summary['graph'] = (
+            load_graph(
+                run_dir / GRAPH_FILE,
+                None if full_graph else NETWORK_CONFIG['display_max_nodes']
+            )
+            if (run_dir / GRAPH_FILE).exists() else None
+        )
+        summary['author_index'] = (
+            AuthorIndex.load(run_dir / AUTHOR_INDEX_FILE)
+            if (run_dir / AUTHOR_INDEX_FILE).exists() else None
+        )
+        summary['run_id'] = run_id
+        return user_activity, summary
+    
+    def manifest(self, run_id: str) -> Dict:
+        """
+        Metadata satu run.
+        
+        Args:
+            run_id: Id run
+            
+        Returns:
+            Dictionary manifest
+        """
+        with open(self._run_dir(run_id) / MANIFEST_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    
+    def list_runs(self) -> List[Dict]:
+        """
+        Daftar run tersimpan, terbaru lebih dulu.
+        
+        Returns:
+            List manifest run
+        """
+        if not self.root.exists():
+            return []
+        runs = []
+        for run_dir in self.root.iterdir():
+            if run_dir.name.startswith('.') or not (run_dir / MANIFEST_FILE).exists():
+                continue
+            try:
+                runs.append(self.manifest(run_dir.name))
+            except (OSError, ValueError):
+                continue
+        return sorted(runs, key=lambda run: run['created_at'], reverse=True)
+    
+    def delete(self, run_id: str):
+        """Hapus satu run."""
+        shutil.rmtree(self._run_dir(run_id), ignore_errors=True)
+    
+    def prune(self, max_runs: Optional[int] = None):
+        """
+        Hapus run tertua di atas batas jumlah run.
+        
+        Args:
+            max_runs: Batas jumlah run, default RUN_ARCHIVE_CONFIG['max_runs']
+        """
+        max_runs = max_runs or RUN_ARCHIVE_CONFIG['max_runs']
+        for run in self.list_runs()[max_runs:]:
+            self.delete(run['run_id'])
@@ -0,0 +1,330 @@
+"""
+Scoring buzzer untuk batch komentar baru dengan state hangat (tanpa UI)
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from config import NETWORK_CONFIG, REQUIRED_COLUMNS, SCORING_CONFIG
+from services.buzzer_detector import BuzzerDetector
+from services.data_cleaner import DataCleaner
+from services.feature_extractor import FeatureExtractor
+from services.network_analyzer import NetworkAnalyzer
+from services.pipeline import run_clean, run_detect, run_features, run_load, run_network
+
+# Kolom hasil per author yang dikirim ke client
+AUTHOR_COLUMNS = [
+    'author', 'comment_count', 'posting_rate', 'avg_text_similarity',
+    'std_text_length', 'duplicate_ratio', 'degree_centrality', 'hour_entropy',
+    'night_ratio', 'buzzer_score', 'buzzer_category', 'isolation_forest_score',
+    'ml_buzzer_label'
+]
+
+
+class ScoringModel:
+    """
+    State hangat untuk scoring: vectorizer teks, scaler, dan Isolation Forest
+    di-fit sekali dari korpus referensi lalu dipakai ulang untuk setiap batch
+    komentar (transform/predict saja, tanpa training ulang).
+    
+    Satu micro-batch boleh berisi beberapa request: semua tahap dijalankan
+    sekali untuk gabungan request, dengan author dibedakan per request dan
+    network, jadwal mirip, serta quantile centrality dipartisi per request,
+    sehingga hasil tidak bergantung pada request lain yang satu batch.
+    """
+    
+    def __init__(self, threshold: float = None):
+        self.threshold = (
+            NETWORK_CONFIG['similarity_threshold'] if threshold is None else threshold
+        )
+        self.vectorizer = None
+        self.scaler = None
+        self.iso_forest = None
+        self.reference_rows = 0
+        self.fitted_at = None
+    
+    def fit(self, files: List) -> 'ScoringModel':
+        """
+        Fit state dari korpus referensi dengan pipeline yang sama seperti UI.
+        
+        Args:
+            files: Path atau objek file korpus referensi
+            
+        Returns:
+            Self untuk method chaining
+        """
+        features = run_features(run_clean(run_load(files)['data']))
+        detected = run_detect(features, run_network(features, self.threshold))
+        self.vectorizer = features['vectorizer']
+        self.scaler = detected['scaler']
+        self.iso_forest = detected['iso_forest']
+        self.reference_rows = features['rows']
+        self.fitted_at = time.time()
+        return self
+    
+    @staticmethod
+    def validate(frame: pd.DataFrame):
+        """
+        Pastikan batch komentar memiliki kolom wajib, minimal satu baris,
+        serta likeCount numerik dan publishedAt berupa tanggal.
+        
+        likeCount dan publishedAt dikonversi in-place (nilai kosong tetap
+        diizinkan, ditangani DataCleaner), sehingga satu request yang rusak
+        ditolak di sini dan tidak menggagalkan micro-batch request lain.
+        
+        Args:
+            frame: DataFrame komentar satu request
+            
+        Raises:
+            ValueError: Jika ada kolom wajib yang tidak ada, batch kosong,
+                atau nilai likeCount/publishedAt tidak bisa dikonversi
+        """
+        missing = [col for col in REQUIRED_COLUMNS if col not in frame.columns]
+        if missing:
+            raise ValueError(f"Kolom wajib tidak ada: {missing}")
+        if frame.empty:
+            raise ValueError("Tidak ada komentar untuk di-score")
+        
+        converted = {
+            'likeCount': pd.to_numeric(frame['likeCount'], errors='coerce'),
+            'publishedAt': (
+                frame['publishedAt']
+                if pd.api.types.is_datetime64_any_dtype(frame['publishedAt'])
+                else pd.to_datetime(
+                    frame['publishedAt'].astype(object), format='mixed',
+                    errors='coerce', utc=True
+                )
+            )
+        }
+        for column, values in converted.items():
+            invalid = values.isna() & frame[column].notna()
+            if invalid.any():
+                rows = np.flatnonzero(invalid.to_numpy())[:5].tolist()
+                raise ValueError(f"Nilai {column} tidak valid pada baris {rows}")
+            frame[column] = values
+    
+    def _prepare(self, frames: List[pd.DataFrame]) -> FeatureExtractor:
+        """Cleaning dan fitur teks sekali untuk gabungan semua request."""
+        combined = pd.concat(
+            [frame[REQUIRED_COLUMNS] for frame in frames], ignore_index=True
+        )
+        combined['_request'] = np.repeat(
+            np.arange(len(frames)), [len(frame) for frame in frames]
+        )
+        # Author dibedakan per request supaya duplikat/agregasi tidak
+        # tercampur antar request
+        combined['_author'] = combined['authorDisplayName']
+        combined['authorDisplayName'] = (
+            combined['_request'].astype(str) + '\x1f'
+            + combined['authorDisplayName'].astype(str)
+        )
+        
+        # Collapse near-duplicate dibatasi per author, sehingga aman dipakai
+        # di sini dan fitur ML sama dengan data referensi
+        cleaner = DataCleaner(combined)
+        data = cleaner.process_all()
+        
+        extractor = FeatureExtractor(data, cleaner.get_token_cache())
+        if data.empty:
+            return extractor
+        (extractor
+         .extract_time_features()
+         .extract_text_features()
+         .create_author_labels()
+         .transform_text_matrix(self.vectorizer))
+        return extractor
+    
+    def score_batch(self, frames: List[pd.DataFrame]) -> List[Dict]:
+        """
+        Score beberapa request komentar sekaligus.
+        
+        Args:
+            frames: DataFrame komentar per request (kolom REQUIRED_COLUMNS)
+            
+        Returns:
+            List hasil per request: dictionary berisi authors (hasil per
+            author) dan comments (kategori author untuk setiap komentar input)
+        """
+        if self.iso_forest is None:
+            raise RuntimeError("ScoringModel belum di-fit")
+        for frame in frames:
+            self.validate(frame)
+        
+        extractor = self._prepare(frames)
+        if extractor.data.empty:
+            # Semua komentar terbuang saat cleaning (mis. teks/tanggal kosong)
+            authors_by_request, verdicts = {}, {}
+        else:
+            authors_by_request, verdicts = self._score(extractor)
+        
+        results = []
+        for request, frame in enumerate(frames):
+            comments = []
+            for i, author in enumerate(frame['authorDisplayName'].tolist()):
+                category, label = verdicts.get((request, author), (None, None))
+                comments.append({
+                    'index': i, 'author': author,
+                    'buzzer_category': category, 'ml_buzzer_label': label
+                })
+            results.append({
+                'authors': authors_by_request.get(request, []),
+                'comments': comments
+            })
+        return results
+    
+    def _score(self, extractor: FeatureExtractor) -> Tuple[Dict, Dict]:
+        """
+        Network dan deteksi untuk gabungan request yang sudah di-prepare.
+        
+        Args:
+            extractor: Hasil _prepare() dengan data tidak kosong
+            
+        Returns:
+            Tuple (hasil per author per request, verdict per
+            (request, author) berisi (buzzer_category, ml_buzzer_label))
+        """
+        data = extractor.data
+        matrix = extractor.get_tfidf_matrix()
+        
+        # Network, jadwal mirip, dan quantile centrality dipartisi per
+        # request; fitur lain sudah per author (kunci author per request)
+        network = NetworkAnalyzer(data, matrix, group_column='_request')
+        detector = BuzzerDetector(
+            data, network.analyze(self.threshold), matrix,
+            scaler=self.scaler, iso_forest=self.iso_forest, group_column='_request'
+        )
+        scored = detector.detect()
+        original_names = data.drop_duplicates('authorDisplayName').set_index(
+            'authorDisplayName'
+        )['_author']
+        scored['author'] = scored['author'].map(original_names)
+        
+        authors_by_request = {
+            request: group[AUTHOR_COLUMNS].astype(object).where(
+                group[AUTHOR_COLUMNS].notna(), None
+            ).to_dict('records')
+            for request, group in scored.groupby('_request', sort=False)
+        }
+        verdicts = dict(zip(
+            zip(scored['_request'], scored['author']),
+            zip(scored['buzzer_category'].astype(str), scored['ml_buzzer_label'])
+        ))
+        return authors_by_request, verdicts
+    
+    def get_info(self) -> dict:
+        """Informasi state model untuk endpoint health."""
+        return {
+            'fitted': self.iso_forest is not None,
+            'reference_rows': self.reference_rows,
+            'vectorizer': type(self.vectorizer).__name__,
+            'threshold': self.threshold,
+            'fitted_at': self.fitted_at
+        }
+
+
+class MicroBatcher:
+    """
+    Gabungkan request yang datang bersamaan menjadi satu micro-batch.
+    
+    Thread worker menunggu request pertama, lalu mengumpulkan request
+    berikutnya sampai max_wait_ms lewat atau jumlah baris mencapai
+    max_batch_rows, dan memanggil handler sekali untuk semuanya. Setiap
+    pemanggil menunggu Future miliknya sendiri.
+    """
+    
+    def __init__(self, handler: Callable[[List], List], max_batch_rows: int = None,
+                 max_wait_ms: float = None):
+        self.handler = handler
+        self.max_batch_rows = max_batch_rows or SCORING_CONFIG['max_batch_rows']
+        self.max_wait = (
+            SCORING_CONFIG['max_wait_ms'] if max_wait_ms is None else max_wait_ms
+        ) / 1000
+        self._queue: queue.Queue = queue.Queue()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self.stats = {'requests': 0, 'batches': 0, 'rows': 0, 'max_batch_requests': 0}
+    
+    def start(self) -> 'MicroBatcher':
+        """
+        Mulai thread worker.
+        
+        Returns:
+            Self untuk method chaining
+        """
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        """Hentikan worker setelah batch yang sedang berjalan."""
+        self._stopped.set()
+        self._queue.put(None)
+        self._thread.join()
+    
+    def submit(self, frame: pd.DataFrame) -> Future:
+        """
+        Antrekan satu request.
+        
+        Args:
+            frame: DataFrame komentar
+            
+        Returns:
+            Future berisi hasil handler untuk request ini
+        """
+        future = Future()
+        self._queue.put((frame, future))
+        return future
+    
+    def _collect(self, first) -> List:
+        """Kumpulkan request sampai batas waktu/baris tercapai."""
+        batch = [first]
+        rows = len(first[0])
+        deadline = time.perf_counter() + self.max_wait
+        while rows < self.max_batch_rows:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)
+                break
+            batch.append(item)
+            rows += len(item[0])
+        return batch
+    
+    def _run(self):
+        """Loop worker: ambil, gabungkan, proses, kembalikan hasil."""
+        while not self._stopped.is_set():
+            first = self._queue.get()
+            if first is None:
+                break
+            batch = self._collect(first)
+            futures = [future for _, future in batch]
+            try:
+                results = self.handler([frame for frame, _ in batch])
+                for future, result in zip(futures, results):
+                    future.set_result(result)
+            except Exception as e:
+                # Satu request rusak tidak boleh menggagalkan request lain
+                # di batch yang sama: ulangi satu per satu
+                if len(batch) == 1:
+                    futures[0].set_exception(e)
+                else:
+                    for frame, future in batch:
+                        try:
+                            future.set_result(self.handler([frame])[0])
+                        except Exception as single_error:
+                            future.set_exception(single_error)
+            
+            self.stats['requests'] += len(batch)
+            self.stats['batches'] += 1
+            self.stats['rows'] += sum(len(frame) for frame, _ in batch)
+            self.stats['max_batch_requests'] = max(
+                self.stats['max_batch_requests'], len(batch)
+            )
@@ -0,0 +1,255 @@
+"""
+Service untuk streaming ingest file komentar (CSV/JSONL, plain/gzip/zstd)
+"""
+import gzip
+import io
+import json
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import pandas as pd
+from config import REQUIRED_COLUMNS, STREAM_CONFIG
+
+try:
+    import zstandard
+except ImportError:  # zstd opsional, hanya dibutuhkan untuk file .zst
+    zstandard = None
+
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+JSONL_SUFFIXES = ('.jsonl', '.ndjson')
+
+
+class StreamReader:
+    """Handler untuk membaca file komentar secara bertahap (per batch)."""
+    
+    def __init__(self, batch_size: Optional[int] = None,
+                 include_replies: Optional[bool] = None):
+        self.batch_size = batch_size or STREAM_CONFIG['batch_size']
+        self.include_replies = (
+            STREAM_CONFIG['include_replies']
+            if include_replies is None else include_replies
+        )
+        self.rows_read = 0
+    
+    @staticmethod
+    def source_name(source) -> str:
+        """Nama file dari path atau objek file (UploadedFile punya .name)."""
+        if isinstance(source, (str, Path)):
+            return str(source).lower()
+        return str(getattr(source, 'name', '')).lower()
+    
+    @staticmethod
+    def _peek(stream, size: int) -> bytes:
+        """Intip beberapa byte awal stream tanpa mengonsumsinya."""
+        if hasattr(stream, 'peek'):
+            return stream.peek(size)[:size]
+        head = stream.read(size)
+        stream.seek(-len(head), io.SEEK_CUR)
+        return head
+    
+    def _open_decompressed(self, source):
+        """
+        Buka source sebagai stream biner yang sudah didekompresi on-the-fly.
+        
+        Args:
+            source: Path file atau objek file biner
+            
+        Returns:
+            Tuple (file mentah, stream biner yang mendukung peek); keduanya
+            objek yang sama jika source tidak terkompresi. Menutup stream
+            dekompresi tidak menutup file mentah.
+        """
+        if isinstance(source, (str, Path)):
+            raw = open(source, 'rb')
+        else:
+            raw = source
+            if hasattr(raw, 'seek'):
+                raw.seek(0)
+        
+        magic = self._peek(raw, 4)
+        if magic.startswith(GZIP_MAGIC):
+            return raw, gzip.GzipFile(fileobj=raw, mode='rb')
+        if magic.startswith(ZSTD_MAGIC):
+            if zstandard is None:
+                if raw is not source:
+                    raw.close()
+                raise ImportError(
+                    "File zstd membutuhkan package 'zstandard' "
+                    "(pip install zstandard)"
+                )
+            reader = zstandard.ZstdDecompressor().stream_reader(
+                raw, closefd=False
+            )
+            return raw, io.BufferedReader(reader)
+        return raw, raw
+    
+    def is_plain_csv(self, source) -> bool:
+        """
+        Cek apakah source berupa CSV biasa (tidak terkompresi, bukan JSONL).
+        
+        Args:
+            source: Path file atau objek file biner
+            
+        Returns:
+            True jika bisa langsung dibaca dengan pd.read_csv
+        """
+        if isinstance(source, (str, Path)):
+            with open(source, 'rb') as fh:
+                head = fh.read(64)
+        else:
+            source.seek(0)
+            head = source.read(64)
+            source.seek(0)
+        
+        if head.startswith(GZIP_MAGIC) or head.startswith(ZSTD_MAGIC):
+            return False
+        if self.source_name(source).endswith(JSONL_SUFFIXES):
+            return False
+        return head.lstrip()[:1] != b'{'
+    
+    def _is_jsonl(self, source, stream) -> bool:
+        """Deteksi format JSONL dari nama file atau byte pertama."""
+        name = self.source_name(source)
+        for suffix in ('.gz', '.zst', '.zstd'):
+            if name.endswith(suffix):
+                name = name[:-len(suffix)]
+        if name.endswith(JSONL_SUFFIXES):
+            return True
+        return self._peek(stream, 64).lstrip()[:1] == b'{'
+    
+    @staticmethod
+    def _coerce_batch(df: pd.DataFrame) -> pd.DataFrame:
+        """Samakan tipe kolom wajib untuk setiap batch."""
+        for col in ('publishedAt', 'authorDisplayName', 'textDisplay'):
+            if col in df.columns:
+                df[col] = df[col].astype(object)
+        if 'likeCount' in df.columns:
+            df['likeCount'] = pd.to_numeric(df['likeCount'], errors='coerce')
+        return df
+    
+    def iter_csv(self, stream) -> Iterator[pd.DataFrame]:
+        """
+        Baca CSV per batch dari stream biner.
+        
+        Args:
+            stream: Stream biner (sudah didekompresi)
+            
+        Yields:
+            DataFrame per batch
+        """
+        reader = pd.read_csv(
+            stream,
+            chunksize=self.batch_size,
+            dtype={
+                'publishedAt': str,
+                'authorDisplayName': str,
+                'textDisplay': str
+            }
+        )
+        for chunk in reader:
+            self.rows_read += len(chunk)
+            yield self._coerce_batch(chunk)
+    
+    @staticmethod
+    def _snippet_row(snippet: dict) -> dict:
+        """Petakan field snippet YouTube API ke kolom REQUIRED_COLUMNS."""
+        return {
+            'publishedAt': snippet.get('publishedAt'),
+            'authorDisplayName': snippet.get('authorDisplayName'),
+            'textDisplay': snippet.get('textDisplay'),
+            'likeCount': snippet.get('likeCount', 0)
+        }
+    
+    def _thread_rows(self, thread: dict) -> Iterator[dict]:
+        """Ambil komentar utama (dan balasan) dari satu commentThread."""
+        snippet = thread.get('snippet', {})
+        top_level = snippet.get('topLevelComment', {}).get('snippet')
+        if top_level is not None:
+            yield self._snippet_row(top_level)
+        elif 'textDisplay' in snippet:
+            # Resource comment biasa (bukan thread)
+            yield self._snippet_row(snippet)
+        
+        if self.include_replies:
+            for reply in thread.get('replies', {}).get('comments', []):
+                yield self._snippet_row(reply.get('snippet', {}))
+    
+    def iter_jsonl(self, stream) -> Iterator[pd.DataFrame]:
+        """
+        Baca JSONL commentThreads per baris dan kumpulkan per batch.
+        
+        Setiap baris boleh berupa satu resource commentThread atau satu
+        halaman response API (dengan key 'items').
+        
+        Args:
+            stream: Stream biner (sudah didekompresi)
+            
+        Yields:
+            DataFrame per batch dengan kolom REQUIRED_COLUMNS
+        """
+        text_stream = io.TextIOWrapper(stream, encoding='utf-8')
+        rows: List[dict] = []
+        
+        try:
+            for line in text_stream:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                for thread in record.get('items', [record]):
+                    rows.extend(self._thread_rows(thread))
+                
+                if len(rows) >= self.batch_size:
+                    yield self._rows_to_frame(rows)
+                    rows = []
+            
+            if rows:
+                yield self._rows_to_frame(rows)
+        finally:
+            # Lepas wrapper supaya file asli (mis. UploadedFile) tidak ikut ditutup
+            text_stream.detach()
+    
+    def _rows_to_frame(self, rows: List[dict]) -> pd.DataFrame:
+        """Konversi list baris ke DataFrame bertipe."""
+        self.rows_read += len(rows)
+        return self._coerce_batch(pd.DataFrame(rows, columns=REQUIRED_COLUMNS))
+    
+    def iter_batches(self, source) -> Iterator[pd.DataFrame]:
+        """
+        Baca source per batch, otomatis deteksi kompresi dan format.
+        
+        Args:
+            source: Path file atau objek file (CSV/JSONL, plain/gzip/zstd)
+            
+        Yields:
+            DataFrame per batch
+        """
+        raw, stream = self._open_decompressed(source)
+        try:
+            if self._is_jsonl(source, stream):
+                yield from self.iter_jsonl(stream)
+            else:
+                yield from self.iter_csv(stream)
+        finally:
+            # File yang dibuka dari path ditutup di sini; objek file milik
+            # pemanggil (mis. UploadedFile) dibiarkan terbuka
+            if isinstance(source, (str, Path)):
+                stream.close()
+                raw.close()
+    
+    def read_all(self, source) -> pd.DataFrame:
+        """
+        Baca seluruh source lalu gabungkan semua batch.
+        
+        Args:
+            source: Path file atau objek file
+            
+        Returns:
+            DataFrame gabungan
+        """
+        batches = list(self.iter_batches(source))
+        if not batches:
+            return pd.DataFrame(columns=REQUIRED_COLUMNS)
+        return pd.concat(batches, ignore_index=True)
@@ -0,0 +1,350 @@
+"""
+State TF-IDF yang dipersist ke disk dengan update IDF bertahap
+"""
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix, diags
+from sklearn.preprocessing import normalize
+from config import TFIDF_STATE_CONFIG
+from utils.bloom import BloomFilter
+from utils.file_lock import file_lock
+from utils.lexicon import get_lexicon
+from utils.token_cache import TokenCache
+
+KEY_COLUMNS = ['publishedAt', 'authorDisplayName', 'textDisplay']
+
+
+class TfidfState:
+    """
+    Vocabulary, document frequency, dan jumlah dokumen TF-IDF.
+    
+    State ini di-update per batch (hanya komentar yang belum pernah dihitung,
+    dikenali lewat hash baris) dan dipakai untuk transform tanpa refit,
+    sehingga skor antar run tetap sebanding dan run harian hanya membayar
+    biaya komentar baru. Kolom matrix mengikuti urutan term di state.
+    
+    Hash baris yang sudah dihitung disimpan di Bloom filter berukuran tetap
+    (TFIDF_STATE_CONFIG['seen_filter_bits']), sehingga memory dan biaya
+    update tidak tumbuh dengan riwayat; false positive hanya membuat
+    sebagian kecil komentar baru tidak ikut dihitung ke DF.
+    
+    Setiap save() menaikkan `version` yang ikut tersimpan di file. Jika
+    proses lain sudah menyimpan sejak state ini di-load, save() membaca
+    ulang file (di bawah file_lock) dan memutar ulang batch yang belum
+    disimpan di atasnya, sehingga update DF dari worker lain tidak hilang.
+    """
+    
+    def __init__(self, ngram_range: tuple = None, max_terms: Optional[int] = None):
+        self.ngram_range = tuple(ngram_range or TFIDF_STATE_CONFIG['ngram_range'])
+        self.max_terms = (
+            TFIDF_STATE_CONFIG['max_terms'] if max_terms is None else max_terms
+        )
+        self.terms: List[str] = []
+        self.term_index = {}
+        self.doc_freq = np.zeros(0, dtype=np.int64)
+        self.doc_count = 0
+        self.version = 0
+        # Batch (counts, names, keys) yang belum disimpan, untuk merge
+        self._pending: List[Tuple[csr_matrix, List[str], Optional[np.ndarray]]] = []
+        self.seen = BloomFilter(
+            TFIDF_STATE_CONFIG['seen_filter_bits'],
+            TFIDF_STATE_CONFIG['seen_filter_hashes']
+        )
+    
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'TfidfState':
+        """
+        Load state dari file .npz hasil save().
+        
+        Args:
+            path: Path file state
+            
+        Returns:
+            TfidfState
+        """
+        with np.load(path, allow_pickle=False) as stored:
+            state = cls(
+                ngram_range=tuple(int(n) for n in stored['ngram_range']),
+                max_terms=int(stored['max_terms']) or None
+            )
+            joined = stored['terms'].tobytes().decode('utf-8')
+            state.terms = joined.split('\n') if joined else []
+            state.term_index = {term: i for i, term in enumerate(state.terms)}
+            state.doc_freq = stored['doc_freq'].astype(np.int64)
+            state.doc_count = int(stored['doc_count'])
+            state.version = int(stored['version']) if 'version' in stored else 0
+            if 'seen_bits' in stored:
+                state.seen = BloomFilter(
+                    len(stored['seen_bits']) * 8, int(stored['seen_hashes']),
+                    bits=stored['seen_bits']
+                )
+            else:
+                # Format lama: daftar hash baris
+                state.seen.add(stored['seen_keys'].astype(np.uint64))
+        return state
+    
+    @staticmethod
+    def read_version(path: Optional[Union[str, Path]] = None) -> int:
+        """
+        Versi state yang tersimpan di file (tanpa memuat seluruh state).
+        
+        Args:
+            path: Path file state, default TFIDF_STATE_CONFIG['path']
+            
+        Returns:
+            Versi state, 0 jika file belum ada atau berformat lama
+        """
+        path = path or TFIDF_STATE_CONFIG['path']
+        if not path or not Path(path).exists():
+            return 0
+        with np.load(path, allow_pickle=False) as stored:
+            return int(stored['version']) if 'version' in stored else 0
+    
+    @classmethod
+    def load_or_create(cls, path: Optional[Union[str, Path]] = None) -> 'TfidfState':
+        """
+        Load state jika file ada, selain itu buat state kosong.
+        
+        Args:
+            path: Path file state, default TFIDF_STATE_CONFIG['path']
+            
+        Returns:
+            TfidfState
+        """
+        path = path or TFIDF_STATE_CONFIG['path']
+        if path and Path(path).exists():
+            return cls.load(path)
+        return cls()
+    
+    def _merge_into(self, stored: 'TfidfState') -> 'TfidfState':
+        """Putar ulang batch yang belum disimpan di atas state dari file."""
+        for counts, names, keys in self._pending:
+            stored.update(counts, names, keys=keys)
+        self.terms = stored.terms
+        self.term_index = stored.term_index
+        self.doc_freq = stored.doc_freq
+        self.doc_count = stored.doc_count
+        self.seen = stored.seen
+        self.version = stored.version
+        return self
+    
+    def save(self, path: Optional[Union[str, Path]] = None) -> 'TfidfState':
+        """
+        Simpan state ke file .npz.
+        
+        Dijalankan di bawah file_lock: jika versi di file sudah berbeda
+        (proses lain menyimpan sejak state ini di-load), file dibaca ulang
+        dan batch yang belum disimpan di-merge lebih dulu. Tanpa batch baru
+        file tidak ditulis (versi tetap). File ditulis ke file sementara
+        unik lalu di-rename atomik.
+        
+        Args:
+            path: Path file state, default TFIDF_STATE_CONFIG['path']
+            
+        Returns:
+            Self untuk method chaining
+        """
+        path = Path(path or TFIDF_STATE_CONFIG['path'])
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        with file_lock(path):
+            stored_version = self.read_version(path) if path.exists() else None
+            if stored_version == self.version and not self._pending:
+                return self  # Tidak ada perubahan: versi tetap
+            if stored_version is not None and stored_version != self.version:
+                self._merge_into(self.load(path))
+            self.version += 1
+            self._write(path)
+            self._pending = []
+        return self
+    
+    def _write(self, path: Path):
+        """Tulis state ke file sementara lalu rename ke path."""
+        # Term tidak mengandung newline (token hasil split spasi)
+        terms = np.frombuffer('\n'.join(self.terms).encode('utf-8'), dtype=np.uint8)
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=f".{path.name}.", suffix='.tmp', delete=False
+        ) as f:
+            tmp_path = f.name
+            try:
+                np.savez_compressed(
+                    f,
+                    terms=terms,
+                    doc_freq=self.doc_freq,
+                    doc_count=np.int64(self.doc_count),
+                    seen_bits=self.seen.bits,
+                    seen_hashes=np.int64(self.seen.n_hashes),
+                    ngram_range=np.asarray(self.ngram_range, dtype=np.int64),
+                    max_terms=np.int64(self.max_terms or 0),
+                    version=np.int64(self.version)
+                )
+            except BaseException:
+                f.close()
+                os.remove(tmp_path)
+                raise
+        os.replace(tmp_path, path)
+    
+    @staticmethod
+    def row_keys(data: pd.DataFrame) -> np.ndarray:
+        """
+        Hash per baris dari publishedAt, author, dan teks.
+        
+        Args:
+            data: DataFrame komentar (sudah dibersihkan)
+            
+        Returns:
+            Array uint64 hash per baris
+        """
+        return pd.util.hash_pandas_object(
+            data[KEY_COLUMNS], index=False
+        ).to_numpy(dtype=np.uint64)
+    
+    def new_rows(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Mask baris yang belum pernah dihitung ke document frequency.
+        
+        Args:
+            keys: Hash baris dari row_keys()
+            
+        Returns:
+            Array boolean (True = baris baru)
+        """
+        return ~self.seen.contains(keys)
+    
+    def count_texts(self, texts: Union[TokenCache, Iterable[str]]):
+        """
+        Hitung count n-gram sesuai ngram_range state.
+        
+        Args:
+            texts: TokenCache atau teks yang sudah dibersihkan
+            
+        Returns:
+            Tuple (matrix count CSR, daftar nama fitur)
+        """
+        token_cache = texts if isinstance(texts, TokenCache) else TokenCache.build(texts)
+        return token_cache.ngram_counts(
+            self.ngram_range, stop_words=get_lexicon().stop_words()
+        )
+    
+    def _columns(self, names: List[str], add: bool) -> np.ndarray:
+        """Kolom state untuk setiap nama fitur (-1 jika tidak dikenal)."""
+        if add:
+            start = len(self.terms)
+            for name in names:
+                if name not in self.term_index:
+                    self.term_index[name] = len(self.terms)
+                    self.terms.append(name)
+            if len(self.terms) > start:
+                self.doc_freq = np.concatenate([
+                    self.doc_freq,
+                    np.zeros(len(self.terms) - start, dtype=np.int64)
+                ])
+        return np.fromiter(
+            (self.term_index.get(name, -1) for name in names),
+            dtype=np.int64, count=len(names)
+        )
+    
+    def update(self, counts: csr_matrix, names: List[str],
+               keys: Optional[np.ndarray] = None) -> 'TfidfState':
+        """
+        Tambahkan batch ke vocabulary dan document frequency.
+        
+        Args:
+            counts: Matrix count n-gram (dokumen x fitur lokal)
+            names: Nama fitur untuk kolom counts
+            keys: Hash baris; baris yang sudah pernah dihitung dilewati
+            
+        Returns:
+            Self untuk method chaining
+        """
+        counts = csr_matrix(counts)
+        if keys is not None:
+            is_new = self.new_rows(keys)
+            # Duplikat hash di batch yang sama hanya dihitung sekali
+            _, first = np.unique(keys, return_index=True)
+            is_new &= np.isin(np.arange(len(keys)), first)
+            counts = counts[is_new]
+            keys = keys[is_new]
+            self.seen.add(keys)
+        
+        if counts.shape[0] == 0:
+            return self
+        self._pending.append((counts, names, keys))
+        
+        local_df = np.bincount(counts.indices, minlength=counts.shape[1])
+        present = np.flatnonzero(local_df)
+        columns = self._columns([names[i] for i in present], add=True)
+        np.add.at(self.doc_freq, columns, local_df[present])
+        self.doc_count += counts.shape[0]
+        
+        if self.max_terms and len(self.terms) > self.max_terms:
+            self.prune(self.max_terms)
+        return self
+    
+    def prune(self, max_terms: int) -> 'TfidfState':
+        """
+        Buang term dengan document frequency terendah.
+        
+        Args:
+            max_terms: Jumlah term yang dipertahankan
+            
+        Returns:
+            Self untuk method chaining
+        """
+        keep = np.sort((-self.doc_freq).argsort(kind='stable')[:max_terms])
+        self.terms = [self.terms[i] for i in keep]
+        self.term_index = {term: i for i, term in enumerate(self.terms)}
+        self.doc_freq = self.doc_freq[keep]
+        return self
+    
+    def idf(self) -> np.ndarray:
+        """
+        IDF (smooth, sama seperti sklearn) dari state saat ini.
+        
+        Returns:
+            Array IDF float32 per term
+        """
+        idf = np.log((1 + self.doc_count) / (1 + self.doc_freq)) + 1
+        return idf.astype(np.float32)
+    
+    def transform(self, counts: csr_matrix, names: List[str]) -> csr_matrix:
+        """
+        Transform count ke TF-IDF berdasarkan state (tanpa refit).
+        
+        Fitur yang tidak ada di vocabulary state diabaikan.
+        
+        Args:
+            counts: Matrix count n-gram (dokumen x fitur lokal)
+            names: Nama fitur untuk kolom counts
+            
+        Returns:
+            CSR matrix float32 ter-normalisasi (dokumen x jumlah term)
+        """
+        counts = csr_matrix(counts)
+        columns = self._columns(names, add=False)
+        mapped = columns[counts.indices]
+        known = mapped >= 0
+        
+        rows = np.repeat(np.arange(counts.shape[0]), np.diff(counts.indptr))
+        tf = csr_matrix(
+            (counts.data[known].astype(np.float32), (rows[known], mapped[known])),
+            shape=(counts.shape[0], len(self.terms))
+        )
+        return normalize(tf @ diags(self.idf()))
+    
+    def transform_texts(self, texts: Union[TokenCache, Iterable[str]]) -> csr_matrix:
+        """
+        Transform teks ke TF-IDF berdasarkan state (tanpa refit).
+        
+        Args:
+            texts: TokenCache atau teks yang sudah dibersihkan
+            
+        Returns:
+            CSR matrix float32 (dokumen x jumlah term)
+        """
+        return self.transform(*self.count_texts(texts))
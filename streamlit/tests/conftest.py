@@ -0,0 +1,19 @@
+"""
+Konfigurasi pytest: root aplikasi (folder streamlit/) masuk sys.path
+seperti saat `streamlit run main.py` atau `python cli.py`
+"""
+import sys
+from pathlib import Path
+
+import pytest
+
+APP_ROOT = Path(__file__).resolve().parents[1]
+DATASET_DIR = APP_ROOT.parent / 'dataset'
+
+sys.path.insert(0, str(APP_ROOT))
+
+
+@pytest.fixture
+def sample_csv() -> Path:
+    """Dataset contoh terkecil yang ikut di repo."""
+    return DATASET_DIR / 'youtube-comments-399.csv'
@@ -0,0 +1,14 @@
+"""
+Test DataCleaner: teks unik dikenali dengan benar sebelum dibersihkan
+"""
+import pandas as pd
+
+from services.data_cleaner import DataCleaner
+
+
+def test_clean_text_column_keeps_texts_differing_after_nul():
+    data = pd.DataFrame({
+        'textDisplay': pd.Series(['a\x00b', 'a\x00c', 'a', None], dtype=object)
+    })
+    cleaned = DataCleaner(data, use_cache=False).clean_text_column().data
+    assert cleaned['textDisplay'].tolist() == ['ab', 'ac', 'a', 'none']
@@ -0,0 +1,14 @@
+"""
+Test clean_text_batch: hasil sama dengan clean_text per baris
+"""
+from utils.helpers import clean_text, clean_text_batch
+
+
+def test_clean_text_batch_matches_clean_text():
+    texts = [
+        'Mantap GAN!!! 100%', 'mantap gan!!! 100%', 'a\x00b', 'a\x00c',
+        'gk  ada\tapa²', 'kerén 😂😂 banget…', '\xa0spasi lebar ', '',
+        None, 3.5, 'Mantap GAN!!! 100%'
+    ]
+    assert clean_text_batch(texts) == [clean_text(t) for t in texts]
+    assert clean_text_batch([]) == []
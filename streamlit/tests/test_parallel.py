@@ -0,0 +1,32 @@
+"""
+Test cleaning paralel: tokenisasi di worker sama dengan jalur single-process
+"""
+import pandas as pd
+import pytest
+
+from config import PARALLEL_CLEANING_CONFIG
+from services.data_cleaner import DataCleaner
+from utils.text_cache import get_text_cache
+
+
+@pytest.mark.parametrize('use_cache', [False, True])
+def test_parallel_cleaning_matches_single_process(monkeypatch, sample_csv, use_cache):
+    monkeypatch.setitem(PARALLEL_CLEANING_CONFIG, 'min_texts', 0)
+    data = pd.read_csv(sample_csv)
+    get_text_cache().clear()
+    if use_cache:
+        # Sebagian teks sudah ada di cache, sisanya dikirim ke worker
+        get_text_cache().clean_many(data['textDisplay'].iloc[::3])
+    
+    serial = DataCleaner(data, use_cache=False, parallel=False)
+    serial_data = serial.process_all()
+    parallel = DataCleaner(data, use_cache=use_cache, parallel=True,
+                           n_workers=2, chunk_size=50)
+    parallel_data = parallel.process_all()
+    
+    assert parallel._unique_tokens is not None
+    pd.testing.assert_frame_equal(parallel_data, serial_data)
+    serial_counts, serial_names = serial.get_token_cache().ngram_counts((1, 2))
+    parallel_counts, parallel_names = parallel.get_token_cache().ngram_counts((1, 2))
+    assert parallel_names == serial_names
+    assert (parallel_counts != serial_counts).nnz == 0
@@ -0,0 +1,38 @@
+"""
+Test StageTimer: lokasi alokasi saat peak (termasuk buffer sementara)
+"""
+import time
+
+import numpy as np
+
+from utils.profiling import StageTimer, timed
+
+
+class _Service:
+    data = None
+    
+    @timed()
+    def transient(self):
+        buffer = np.empty(8 * 1024 ** 2 // 8)  # 8 MB, dibebaskan saat return
+        buffer.fill(1)
+        time.sleep(0.2)
+        return float(buffer[0])
+    
+    @timed()
+    def small(self):
+        return sum(range(1000))
+
+
+def test_top_allocations_name_transient_peak_buffer():
+    timer = StageTimer(memory_profile=True)
+    service = _Service()
+    with timer.stage('features'):
+        service.transient()
+        service.small()
+    
+    record = timer.records[0]
+    assert record['peak_step'] == 'transient'
+    assert record['peak_snapshot_mb'] >= 8
+    top = record['top_allocations'][0]
+    assert top['site'].startswith('test_profiling.py:')
+    assert top['size_mb'] >= 8
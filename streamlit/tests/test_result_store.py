@@ -0,0 +1,36 @@
+"""
+Test ResultStore: objek shared hanya dipegang lewat weak reference
+"""
+import gc
+
+import networkx as nx
+import pandas as pd
+
+from services.result_store import ResultStore
+
+
+def test_shared_objects_survive_spill_while_owner_holds_them(tmp_path):
+    store = ResultStore(max_memory_mb=1e-6, spill_dir=str(tmp_path))
+    graph = nx.Graph([(1, 2)])
+    frame = pd.DataFrame({'author': ['a']})
+    
+    store.put('first', frame, {'graph': graph, 'total': 1}, shared=('graph',))
+    store.put('second', frame, {'graph': None, 'total': 2}, shared=('graph',))
+    assert store.get_info()['on_disk'] == 1
+    
+    _, summary = store.get('first')
+    assert summary['graph'] is graph
+    assert summary['total'] == 1
+
+
+def test_store_does_not_keep_evicted_shared_objects_alive(tmp_path):
+    store = ResultStore(max_memory_mb=1e-6, spill_dir=str(tmp_path))
+    frame = pd.DataFrame({'author': ['a']})
+    
+    store.put('first', frame, {'graph': nx.Graph([(1, 2)])}, shared=('graph',))
+    store.put('second', frame, {'graph': None}, shared=('graph',))
+    gc.collect()
+    
+    _, summary = store.get('first')
+    assert summary['graph'] is None
+    assert store.stats['shared_lost'] == 1
@@ -0,0 +1,42 @@
+"""
+Test ScoringModel.validate: nilai rusak ditolak sebelum masuk micro-batch
+"""
+import pandas as pd
+import pytest
+
+from services.scoring import ScoringModel
+
+
+def _frame(**overrides):
+    frame = pd.DataFrame({
+        'publishedAt': ['2024-01-01T10:00:00Z', '2024-01-01T11:00:00+07:00'],
+        'authorDisplayName': ['a', 'b'],
+        'textDisplay': ['mantap', 'setuju'],
+        'likeCount': ['3', None]
+    })
+    return frame.assign(**overrides)
+
+
+def test_validate_coerces_numeric_and_datetime_columns():
+    frame = _frame()
+    ScoringModel.validate(frame)
+    assert frame['likeCount'].tolist()[0] == 3
+    assert pd.api.types.is_datetime64_any_dtype(frame['publishedAt'])
+
+
+@pytest.mark.parametrize('column, value', [
+    ('likeCount', ['banyak', 1]),
+    ('publishedAt', ['kemarin', '2024-01-01T10:00:00Z'])
+])
+def test_validate_rejects_unparseable_values(column, value):
+    with pytest.raises(ValueError, match=column):
+        ScoringModel.validate(_frame(**{column: value}))
+
+
+def test_scoring_accepts_validated_frame(monkeypatch, tmp_path, sample_csv):
+    monkeypatch.chdir(tmp_path)
+    model = ScoringModel().fit([sample_csv])
+    frame = _frame()
+    model.validate(frame)
+    result, = model.score_batch([frame])
+    assert len(result['comments']) == len(frame)
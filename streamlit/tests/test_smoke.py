@@ -0,0 +1,37 @@
+"""
+Smoke test alur deteksi: kunci cache per tahap dan job deteksi UI
+"""
+import pytest
+
+from services.pipeline import stage_keys
+
+STAGES = ['load', 'clean', 'features', 'network', 'detect', 'index', 'result']
+
+
+def test_stage_keys_has_every_stage():
+    keys = stage_keys('abc')
+    assert sorted(keys) == sorted(STAGES)
+    assert keys == stage_keys('abc')
+    assert stage_keys('abc', 0.5)['network'] != keys['network']
+    assert stage_keys('abd')['load'] != keys['load']
+
+
+def test_detection_job_stores_result(sample_csv, tmp_path, monkeypatch):
+    pytest.importorskip('streamlit')
+    import main
+    from services.result_store import get_result_store
+    from utils.progress import ProgressTracker
+    
+    # Arsip run (RUN_ARCHIVE_CONFIG['dir']) relatif terhadap working directory
+    monkeypatch.chdir(tmp_path)
+    result_id = main.detection_job(ProgressTracker(), [sample_csv], 0.3)
+    
+    stored = get_result_store().get(result_id)
+    assert stored is not None
+    user_activity, summary = stored
+    assert len(user_activity) > 0
+    assert {'buzzer_score', 'buzzer_category', 'ml_buzzer_label'} <= set(user_activity.columns)
+    assert summary['total_users'] == len(user_activity)
+    
+    # Upload + config yang sama diambil dari store tanpa menjalankan tahap
+    assert main.detection_job(ProgressTracker(), [sample_csv], 0.3) == result_id
@@ -0,0 +1,30 @@
+"""
+Test CleanTextCache: cache mengikuti isi kamus, bukan identitas objek
+"""
+import pytest
+
+from utils.lexicon import SlangLexicon, get_lexicon, set_lexicon
+from utils.text_cache import CleanTextCache
+
+
+@pytest.fixture
+def restore_lexicon():
+    original = get_lexicon()
+    yield
+    set_lexicon(original)
+
+
+def test_cache_follows_lexicon_content(restore_lexicon):
+    cache = CleanTextCache(max_size=10)
+    set_lexicon(SlangLexicon({'gk': 'tidak'}))
+    assert cache.clean_many(['gk tau']) == ['tidak tau']
+    
+    # Objek baru dengan isi sama: cache tetap dipakai
+    set_lexicon(SlangLexicon({'gk': 'tidak'}))
+    assert cache.clean_many(['gk tau']) == ['tidak tau']
+    assert cache.hits == 1
+    
+    # Isi berbeda (meski id objek bisa dipakai ulang): cache dikosongkan
+    set_lexicon(SlangLexicon({'gk': 'enggak'}))
+    assert cache.clean_many(['gk tau']) == ['enggak tau']
+
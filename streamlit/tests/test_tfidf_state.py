@@ -0,0 +1,46 @@
+"""
+Test TfidfState: save bersamaan dari dua worker tidak kehilangan DF
+"""
+import pandas as pd
+
+from services.tfidf_state import TfidfState
+
+
+def _batch(texts):
+    data = pd.DataFrame({
+        'publishedAt': range(len(texts)),
+        'authorDisplayName': [f'a{i}' for i in range(len(texts))],
+        'textDisplay': texts
+    })
+    return TfidfState.row_keys(data)
+
+
+def _update(state, texts, keys):
+    counts, names = state.count_texts(texts)
+    return state.update(counts, names, keys=keys)
+
+
+def test_concurrent_saves_merge_doc_freq(tmp_path):
+    path = tmp_path / 'state.npz'
+    first = TfidfState.load_or_create(path)
+    second = TfidfState.load_or_create(path)
+    
+    _update(first, ['kopi enak sekali'], _batch(['kopi enak sekali'])).save(path)
+    second_texts = ['teh manis', 'teh hangat']
+    _update(second, second_texts, _batch(second_texts)).save(path)
+    
+    merged = TfidfState.load(path)
+    assert merged.doc_count == 3
+    assert merged.doc_freq[merged.term_index['kopi']] == 1
+    assert merged.doc_freq[merged.term_index['teh']] == 2
+    assert merged.version == TfidfState.read_version(path) == 2
+
+
+def test_save_without_new_rows_keeps_version(tmp_path):
+    path = tmp_path / 'state.npz'
+    keys = _batch(['kopi enak'])
+    _update(TfidfState(), ['kopi enak'], keys).save(path)
+    
+    state = TfidfState.load(path)
+    _update(state, ['kopi enak'], keys).save(path)
+    assert TfidfState.read_version(path) == 1
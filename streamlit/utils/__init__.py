@@ -1 +1,26 @@
-from .helpers import clean_text, format_number, get_color_by_category
+from .lazy import lazy_exports
+
+# Submodule di-import saat nama pertama kali diakses (similarity/token_cache
+# memuat scipy dan sklearn)
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'clean_text': '.helpers',
+    'clean_text_batch': '.helpers',
+    'format_duration': '.helpers',
+    'format_number': '.helpers',
+    'get_color_by_category': '.helpers',
+    'matrix_memory': '.helpers',
+    'SlangLexicon': '.lexicon',
+    'get_lexicon': '.lexicon',
+    'set_lexicon': '.lexicon',
+    'CleanTextCache': '.text_cache',
+    'get_text_cache': '.text_cache',
+    'clean_text_parallel': '.parallel',
+    'TokenCache': '.token_cache',
+    'group_indicator': '.similarity',
+    'group_mean_pairwise_cosine': '.similarity',
+    'top_k_cosine': '.similarity',
+    'BackgroundJob': '.progress',
+    'JobCancelled': '.progress',
+    'ProgressTracker': '.progress',
+    'report_progress': '.progress',
+})
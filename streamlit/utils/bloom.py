@@ -0,0 +1,83 @@
+"""
+Bloom filter untuk hash uint64 (ukuran tetap, operasi vectorized numpy)
+"""
+import numpy as np
+
+# Konstanta splitmix64 untuk hash kedua (double hashing)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+
+
+def _mix(keys: np.ndarray) -> np.ndarray:
+    """Finalizer splitmix64: sebar bit hash sebelum diambil indeksnya."""
+    with np.errstate(over='ignore'):
+        z = keys ^ (keys >> np.uint64(30))
+        z = z * _MIX_1
+        z = z ^ (z >> np.uint64(27))
+        z = z * _MIX_2
+        return z ^ (z >> np.uint64(31))
+
+
+class BloomFilter:
+    """
+    Himpunan hash uint64 dengan memory tetap (n_bits / 8 byte).
+    
+    contains() tidak pernah salah untuk key yang sudah di-add; key baru
+    bisa dianggap sudah ada dengan peluang kecil (false positive), kira-kira
+    (1 - e^(-k*n/m))^k untuk n key, m bit, dan k hash. Biaya add/contains
+    sebanding dengan jumlah key di batch, bukan jumlah key yang tersimpan.
+    """
+    
+    def __init__(self, n_bits: int, n_hashes: int, bits: np.ndarray = None):
+        if n_bits <= 0 or n_bits & (n_bits - 1):
+            raise ValueError("n_bits harus pangkat dua")
+        self.n_bits = int(n_bits)
+        self.n_hashes = int(n_hashes)
+        self.bits = (
+            np.zeros(self.n_bits // 8, dtype=np.uint8) if bits is None
+            else np.asarray(bits, dtype=np.uint8)
+        )
+        if len(self.bits) != self.n_bits // 8:
+            raise ValueError("Ukuran bits tidak sesuai n_bits")
+    
+    def _positions(self, keys: np.ndarray) -> np.ndarray:
+        """Posisi bit (key x n_hashes) dengan double hashing."""
+        keys = np.asarray(keys, dtype=np.uint64)
+        h1 = keys[:, None]
+        h2 = (_mix(keys) | np.uint64(1))[:, None]
+        steps = np.arange(self.n_hashes, dtype=np.uint64)[None, :]
+        with np.errstate(over='ignore'):
+            return (h1 + steps * h2) & np.uint64(self.n_bits - 1)
+    
+    def add(self, keys: np.ndarray) -> 'BloomFilter':
+        """
+        Tambahkan key.
+        
+        Args:
+            keys: Array hash uint64
+            
+        Returns:
+            Self untuk method chaining
+        """
+        positions = self._positions(keys).ravel()
+        np.bitwise_or.at(
+            self.bits,
+            (positions >> np.uint64(3)).astype(np.int64),
+            (np.uint8(1) << (positions & np.uint64(7)).astype(np.uint8))
+        )
+        return self
+    
+    def contains(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Cek keanggotaan key.
+        
+        Args:
+            keys: Array hash uint64
+            
+        Returns:
+            Array boolean (True = kemungkinan sudah pernah di-add)
+        """
+        positions = self._positions(keys)
+        bytes_ = self.bits[(positions >> np.uint64(3)).astype(np.int64)]
+        is_set = (bytes_ >> (positions & np.uint64(7)).astype(np.uint8)) & 1
+        return is_set.all(axis=1)
@@ -0,0 +1,74 @@
+"""
+Helper kunci cache: hash isi file upload dan potongan konfigurasi
+"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Iterable
+
+from utils.lexicon import get_lexicon
+
+HASH_CHUNK_SIZE = 1 << 20
+
+
+def _json_default(value):
+    """Serialisasi nilai konfigurasi yang bukan tipe JSON dasar."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    if isinstance(value, (range, tuple)):
+        return list(value)
+    return str(value)
+
+
+def config_key(*parts) -> str:
+    """
+    Hash stabil dari beberapa potongan konfigurasi / kunci lain.
+    
+    Args:
+        *parts: Nilai yang bisa diserialisasi ke JSON (dict, list, angka, str)
+        
+    Returns:
+        Hex digest (16 karakter)
+    """
+    payload = json.dumps(parts, sort_keys=True, default=_json_default)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def content_hash(files: Iterable) -> str:
+    """
+    Hash isi semua file sesuai urutannya (urutan menentukan video_id).
+    
+    File dibaca per chunk; posisi baca objek file dikembalikan seperti semula.
+    
+    Args:
+        files: Path atau objek file (mis. UploadedFile Streamlit)
+        
+    Returns:
+        Hex digest SHA-256
+    """
+    digest = hashlib.sha256()
+    for file in files:
+        if isinstance(file, (str, Path)):
+            with open(file, 'rb') as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+        else:
+            position = file.tell()
+            file.seek(0)
+            for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+            file.seek(position)
+        # Pemisah antar file agar [ab, c] != [a, bc]
+        digest.update(b'\x00file\x00')
+    return digest.hexdigest()
+
+
+def lexicon_key() -> str:
+    """
+    Kunci isi kamus slang dan stopwords yang sedang aktif.
+    
+    Returns:
+        Hex digest (16 karakter)
+    """
+    lexicon = get_lexicon()
+    return config_key(lexicon.mapping, sorted(lexicon.stopwords))
@@ -0,0 +1,44 @@
+"""
+Advisory lock antar proses berbasis file (fcntl di POSIX, msvcrt di Windows)
+"""
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(path: Union[str, Path]):
+    """
+    Pegang lock eksklusif untuk path selama blok with.
+    
+    Lock dipasang pada file pendamping `<path>.lock` (bukan file data),
+    sehingga file data tetap bisa diganti atomik dengan os.replace. Lock
+    bersifat advisory: hanya proses yang juga memakai file_lock yang
+    saling menunggu.
+    
+    Args:
+        path: Path file data yang dilindungi
+    """
+    lock_path = Path(f"{path}.lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        yield
+    finally:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        os.close(fd)
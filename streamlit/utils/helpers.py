@@ -2,7 +2,27 @@
 Helper functions untuk aplikasi Deteksi Buzzer
 """
 import re
+from typing import Dict, Iterable, List
 from config import COLORS
+from utils.lexicon import get_lexicon
+
+# Pola regex dikompilasi sekali di level modul
+WHITESPACE_PATTERN = re.compile(r'\s+')
+# Tanda baca dan angka dihapus dalam satu pass (dua kelas karakter disjoint)
+PUNCT_DIGIT_PATTERN = re.compile(r'(?:[^\w\s]|\d)+')
+
+# Konstanta untuk clean_text_batch (diproses sebagai bytes UTF-8)
+BATCH_SEPARATOR = '\x00'
+NON_ASCII_RUN_PATTERN = re.compile(rb'([\x80-\xff]+)')
+SPACE_RUN_PATTERN = re.compile(rb'  +')
+ASCII_WHITESPACE_TABLE = bytes.maketrans(
+    b'\t\n\r\x0b\x0c\x1c\x1d\x1e\x1f', b' ' * 9
+)
+# Semua ASCII selain huruf, underscore, spasi, dan separator dihapus
+ASCII_DELETE_CHARS = bytes(
+    c for c in range(128) if not (chr(c).isalpha() or c in b'_ \x00')
+)
+DELETE_PLACEHOLDER = '\x01'
 
 
 def clean_text(text: str) -> str:
@@ -16,16 +36,79 @@ def clean_text(text: str) -> str:
         Teks yang sudah dibersihkan
     """
     text = str(text).lower()
-    text = re.sub(r'\s+', ' ', text)  # Hapus spasi ganda
-    text = re.sub(r'[^\w\s]', '', text)  # Hapus tanda baca
-    text = re.sub(r'\d+', '', text)  # Hapus angka
-    # Normalisasi kata
-    text = text.replace('dapet', 'dapat')
-    text = text.replace('gak', 'tidak')
-    text = text.replace('ga', 'tidak')
+    text = WHITESPACE_PATTERN.sub(' ', text)  # Hapus spasi ganda
+    text = PUNCT_DIGIT_PATTERN.sub('', text)  # Hapus tanda baca dan angka
+    text = get_lexicon().normalize_text(text)  # Normalisasi kata
     return text.strip()
 
 
+def _clean_non_ascii_run(run: bytes) -> bytes:
+    """
+    Petakan satu deret karakter non-ASCII: spasi jadi ' ', huruf tetap,
+    sisanya jadi placeholder yang nanti ikut dihapus bersama tanda baca.
+    """
+    out = []
+    for ch in run.decode('utf-8'):
+        if ch.isspace():
+            out.append(' ')
+        elif ch.isalnum() and not ch.isdecimal():
+            out.append(ch)
+        elif not out or out[-1] != DELETE_PLACEHOLDER:
+            out.append(DELETE_PLACEHOLDER)
+    return ''.join(out).encode('utf-8')
+
+
+def clean_text_batch(texts: Iterable) -> List[str]:
+    """
+    Bersihkan banyak teks sekaligus dengan hasil sama seperti clean_text.
+    
+    Hanya teks unik yang dibersihkan (komentar buzzer banyak yang
+    copy-paste), lalu hasilnya dipetakan kembali ke setiap baris. Teks unik
+    digabung menjadi satu bytes UTF-8 dengan separator \\x00, lalu
+    dibersihkan dengan bytes.translate dan regex terkompilasi sekali untuk
+    seluruh kolom. Hanya deret karakter non-ASCII (emoji, huruf beraksen)
+    yang diklasifikasi per karakter, sekali per deret unik di batch.
+    
+    Args:
+        texts: Kumpulan teks (mis. kolom textDisplay)
+        
+    Returns:
+        List teks yang sudah dibersihkan, urutan sama dengan input
+    """
+    texts = [str(t) for t in texts]
+    uniques = list(dict.fromkeys(texts))
+    if not uniques:
+        return []
+    
+    joined = BATCH_SEPARATOR.join(uniques)
+    if joined.count(BATCH_SEPARATOR) != len(uniques) - 1:
+        # Ada teks yang mengandung separator: ganti dengan placeholder yang
+        # dihapus bersama tanda baca, sehingga urutan langkahnya sama dengan
+        # clean_text (\x00 bukan huruf/spasi, dihapus setelah spasi ganda)
+        joined = BATCH_SEPARATOR.join(
+            t.replace(BATCH_SEPARATOR, DELETE_PLACEHOLDER) for t in uniques
+        )
+    data = joined.lower().encode('utf-8')
+    
+    # Karakter non-ASCII diklasifikasi dulu supaya sisanya cukup diproses
+    # sebagai ASCII
+    if not joined.isascii():
+        parts = NON_ASCII_RUN_PATTERN.split(data)
+        runs = {run: _clean_non_ascii_run(run) for run in set(parts[1::2])}
+        parts[1::2] = map(runs.__getitem__, parts[1::2])
+        data = b''.join(parts)
+    
+    data = data.translate(ASCII_WHITESPACE_TABLE)
+    data = SPACE_RUN_PATTERN.sub(b' ', data)  # Hapus spasi ganda
+    data = data.translate(None, ASCII_DELETE_CHARS)  # Hapus tanda baca dan angka
+    data = get_lexicon().normalize_bytes(data)  # Normalisasi kata
+    
+    cleaned = dict(zip(
+        uniques, (t.strip() for t in data.decode('utf-8').split(BATCH_SEPARATOR))
+    ))
+    return [cleaned[t] for t in texts]
+
+
 def format_number(num: float) -> str:
     """
     Format angka untuk tampilan yang lebih readable.
@@ -44,6 +127,26 @@ def format_number(num: float) -> str:
         return str(int(num))
 
 
+def format_duration(seconds: float) -> str:
+    """
+    Format durasi detik menjadi 'Xj Ym', 'Ym Zd', atau 'Zd'.
+    
+    Args:
+        seconds: Durasi dalam detik
+        
+    Returns:
+        String durasi
+    """
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}j {minutes}m"
+    if minutes:
+        return f"{minutes}m {secs}d"
+    return f"{secs}d"
+
+
 def get_color_by_category(category: str) -> str:
     """
     Mendapatkan warna berdasarkan kategori buzzer.
@@ -64,6 +167,30 @@ def get_color_by_category(category: str) -> str:
     return color_map.get(category, COLORS['primary'])
 
 
+def matrix_memory(matrix) -> Dict[str, object]:
+    """
+    Ringkasan ukuran memory matrix (sparse CSR atau dense numpy).
+    
+    Args:
+        matrix: Matrix fitur
+        
+    Returns:
+        Dictionary berisi shape, nnz, dtype, dan bytes
+    """
+    if hasattr(matrix, 'indptr'):
+        nbytes = matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+        nnz = matrix.nnz
+    else:
+        nbytes = matrix.nbytes
+        nnz = matrix.size
+    return {
+        'shape': matrix.shape,
+        'nnz': int(nnz),
+        'dtype': str(matrix.dtype),
+        'bytes': int(nbytes)
+    }
+
+
 def calculate_percentage(part: int, total: int) -> float:
     """
     Hitung persentase dengan aman (avoid division by zero).
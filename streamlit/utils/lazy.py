@@ -0,0 +1,36 @@
+"""
+Re-export lazy untuk __init__ package (PEP 562)
+"""
+import sys
+from importlib import import_module
+from typing import Callable, Dict, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable, Callable]:
+    """
+    Buat __getattr__ dan __dir__ package yang baru meng-import submodule saat
+    nama publiknya pertama kali diakses.
+    
+    `from services import DataLoader` tetap berfungsi, tetapi
+    `import services.data_loader` tidak lagi ikut memuat sklearn/networkx
+    dari submodule lain di package yang sama.
+    
+    Args:
+        package: __name__ package
+        exports: Nama publik -> submodule relatif (mis. '.pipeline')
+        
+    Returns:
+        Tuple (__getattr__, __dir__) untuk dipasang di __init__ package
+    """
+    def __getattr__(name: str):
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(exports[name], package), name)
+        # Simpan di namespace package supaya akses berikutnya tidak lewat sini
+        setattr(sys.modules[package], name, value)
+        return value
+    
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+    
+    return __getattr__, __dir__
@@ -0,0 +1,198 @@
+"""
+Kamus normalisasi slang dan stopwords Bahasa Indonesia
+"""
+import csv
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from config import INDONESIAN_STOPWORDS, SLANG_LEXICON_PATH, SLANG_NORMALIZATION
+
+# Nama kolom header file CSV/TSV kamus (opsional, hanya di baris pertama)
+CSV_HEADER = ('slang', 'baku')
+
+
+class SlangLexicon:
+    """
+    Kamus normalisasi token dengan satu lookup hash-map per token.
+    
+    Normalisasi slang dan filter stopwords memakai tabel yang sama, sehingga
+    biaya tetap linear terhadap panjang teks berapa pun ukuran kamusnya.
+    """
+    
+    def __init__(self, mapping: Optional[Dict[str, str]] = None,
+                 stopwords: Optional[Iterable[str]] = None):
+        self.mapping: Dict[str, str] = {}
+        self.stopwords = set(stopwords or [])
+        # Stopwords + bentuk baku stopwords slang (teks sudah dinormalisasi
+        # sebelum masuk vectorizer, mis. 'aja' -> 'saja')
+        self._all_stopwords = set(self.stopwords)
+        self._bytes_mapping: Dict[bytes, bytes] = {}
+        self._filter_table: Dict[str, Optional[str]] = {}
+        self.version = 0
+        self.update(mapping or {})
+    
+    @classmethod
+    def from_file(cls, path, stopwords: Optional[Iterable[str]] = None
+                  ) -> 'SlangLexicon':
+        """
+        Buat kamus dari file CSV/TSV ("slang,baku") atau JSON ({slang: baku}).
+        
+        Args:
+            path: Path file kamus
+            stopwords: Daftar stopwords
+            
+        Returns:
+            SlangLexicon baru
+        """
+        lexicon = cls(stopwords=stopwords)
+        lexicon.load_file(path)
+        return lexicon
+    
+    def load_file(self, path) -> 'SlangLexicon':
+        """
+        Tambahkan entri dari file kamus.
+        
+        Args:
+            path: Path file CSV/TSV/JSON
+            
+        Returns:
+            Self untuk method chaining
+        """
+        path = Path(path)
+        with open(path, encoding='utf-8') as fh:
+            if path.suffix.lower() == '.json':
+                return self.update(json.load(fh))
+            
+            delimiter = '\t' if path.suffix.lower() == '.tsv' else ','
+            mapping = {}
+            first_row = True
+            for row in csv.reader(fh, delimiter=delimiter):
+                if len(row) < 2 or row[0].startswith('#'):
+                    continue
+                # Lewati baris header ("slang,baku") jika ada
+                is_header = first_row and tuple(
+                    cell.strip().lower() for cell in row[:2]
+                ) == CSV_HEADER
+                first_row = False
+                if not is_header:
+                    mapping[row[0]] = row[1]
+        return self.update(mapping)
+    
+    def update(self, mapping: Dict[str, str]) -> 'SlangLexicon':
+        """
+        Tambah atau timpa entri normalisasi.
+        
+        Args:
+            mapping: Dictionary {slang: bentuk baku}
+            
+        Returns:
+            Self untuk method chaining
+        """
+        for slang, formal in mapping.items():
+            slang = str(slang).strip().lower()
+            formal = str(formal).strip().lower()
+            # Hanya token tunggal: teks sudah dipisah per spasi saat lookup
+            if slang and formal and slang != formal and ' ' not in slang:
+                self.mapping[slang] = formal
+        self._rebuild()
+        return self
+    
+    def _rebuild(self):
+        """Bangun ulang tabel lookup turunan."""
+        self.version += 1
+        self._bytes_mapping = {
+            k.encode('utf-8'): v.encode('utf-8')
+            for k, v in self.mapping.items()
+        }
+        self._all_stopwords = self.stopwords | {
+            self.mapping[word] for word in self.stopwords if word in self.mapping
+        }
+        table: Dict[str, Optional[str]] = dict.fromkeys(self._all_stopwords)
+        for slang, formal in self.mapping.items():
+            table[slang] = None if formal in self._all_stopwords else formal
+        self._filter_table = table
+    
+    def normalize_text(self, text: str) -> str:
+        """
+        Normalisasi teks yang tokennya dipisah spasi.
+        
+        Args:
+            text: Teks yang sudah dibersihkan
+            
+        Returns:
+            Teks dengan token slang diganti bentuk baku
+        """
+        tokens = text.split(' ')
+        return ' '.join(map(self.mapping.get, tokens, tokens))
+    
+    def normalize_bytes(self, data: bytes) -> bytes:
+        """
+        Normalisasi bytes UTF-8 gabungan banyak teks (separator \\x00).
+        
+        Args:
+            data: Bytes teks yang sudah dibersihkan
+            
+        Returns:
+            Bytes dengan token slang diganti bentuk baku
+        """
+        tokens = data.replace(b'\x00', b' \x00 ').split(b' ')
+        data = b' '.join(map(self._bytes_mapping.get, tokens, tokens))
+        return data.replace(b' \x00 ', b'\x00')
+    
+    def filter_tokens(self, tokens: Iterable[str]) -> List[str]:
+        """
+        Normalisasi token sekaligus buang stopwords (satu lookup per token).
+        
+        Args:
+            tokens: Token hasil split
+            
+        Returns:
+            Token yang sudah dinormalisasi tanpa stopwords
+        """
+        table = self._filter_table
+        return [t for t in map(table.get, tokens, tokens) if t]
+    
+    def stop_words(self) -> List[str]:
+        """
+        Daftar stopwords untuk parameter stop_words sklearn.
+        
+        Termasuk bentuk baku dari stopwords slang, karena teks sudah
+        dinormalisasi sebelum masuk vectorizer (sama dengan filter_tokens).
+        
+        Returns:
+            List stopwords terurut
+        """
+        return sorted(self._all_stopwords)
+    
+    def __len__(self) -> int:
+        return len(self.mapping)
+
+
+_default_lexicon: Optional[SlangLexicon] = None
+
+
+def get_lexicon() -> SlangLexicon:
+    """
+    Mendapatkan kamus default (bawaan config + SLANG_LEXICON_PATH).
+    
+    Returns:
+        SlangLexicon yang dipakai bersama oleh seluruh pipeline
+    """
+    global _default_lexicon
+    if _default_lexicon is None:
+        lexicon = SlangLexicon(SLANG_NORMALIZATION, INDONESIAN_STOPWORDS)
+        if SLANG_LEXICON_PATH:
+            lexicon.load_file(SLANG_LEXICON_PATH)
+        _default_lexicon = lexicon
+    return _default_lexicon
+
+
+def set_lexicon(lexicon: SlangLexicon):
+    """
+    Ganti kamus default (mis. kamus ribuan entri dari file).
+    
+    Args:
+        lexicon: SlangLexicon pengganti
+    """
+    global _default_lexicon
+    _default_lexicon = lexicon
@@ -0,0 +1,82 @@
+"""
+Pembersihan teks paralel dengan process pool
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Iterable, List, Optional, Tuple, Union
+from config import PARALLEL_CLEANING_CONFIG
+from utils.helpers import clean_text_batch
+from utils.lexicon import get_lexicon, set_lexicon
+from utils.token_cache import TokenCache
+
+
+def _clean_chunk(texts: List[str], tokenize: bool = False
+                 ) -> Union[List[str], Tuple[List[str], TokenCache]]:
+    """
+    Worker: bersihkan satu chunk teks, dan jika diminta sekaligus
+    tokenisasi hasilnya (fungsi top-level agar picklable).
+    """
+    cleaned = clean_text_batch(texts)
+    if tokenize:
+        return cleaned, TokenCache.build(cleaned)
+    return cleaned
+
+
+def _pool_context():
+    """Context multiprocessing sesuai config (spawn jika tidak tersedia)."""
+    method = PARALLEL_CLEANING_CONFIG['start_method']
+    if method not in multiprocessing.get_all_start_methods():
+        method = 'spawn'
+    return multiprocessing.get_context(method)
+
+
+def clean_text_parallel(texts: Iterable[str], n_workers: Optional[int] = None,
+                        chunk_size: Optional[int] = None, tokenize: bool = False
+                        ) -> Union[List[str], Tuple[List[str], TokenCache]]:
+    """
+    Bersihkan teks di beberapa proses, hasil disusun ulang sesuai urutan input.
+    
+    Teks dibagi per chunk baris, setiap chunk dibersihkan oleh worker dengan
+    clean_text_batch (dan ditokenisasi jika tokenize=True; TokenCache per
+    chunk digabung dengan TokenCache.concat). Kamus normalisasi aktif
+    dikirim sekali ke setiap worker lewat initializer. Worker dibuat dengan
+    start method PARALLEL_CLEANING_CONFIG['start_method'] (bukan fork),
+    karena proses Streamlit menjalankan banyak thread.
+    
+    Args:
+        texts: Kumpulan teks mentah (sebaiknya sudah unik)
+        n_workers: Jumlah proses (default: PARALLEL_CLEANING_CONFIG / CPU)
+        chunk_size: Jumlah teks per chunk
+        tokenize: Kembalikan juga TokenCache teks bersih
+        
+    Returns:
+        List teks bersih dengan urutan sama seperti input, atau tuple
+        (teks bersih, TokenCache sejajar input) jika tokenize=True
+    """
+    texts = [str(t) for t in texts]
+    n_workers = (
+        n_workers or PARALLEL_CLEANING_CONFIG['n_workers'] or os.cpu_count() or 1
+    )
+    chunk_size = chunk_size or PARALLEL_CLEANING_CONFIG['chunk_size']
+    
+    if n_workers <= 1 or len(texts) <= chunk_size:
+        return _clean_chunk(texts, tokenize)
+    
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    with ProcessPoolExecutor(
+        max_workers=min(n_workers, len(chunks)),
+        mp_context=_pool_context(),
+        initializer=set_lexicon,
+        initargs=(get_lexicon(),)
+    ) as pool:
+        # pool.map mengembalikan hasil sesuai urutan chunk
+        parts = list(pool.map(partial(_clean_chunk, tokenize=tokenize), chunks))
+    
+    if not tokenize:
+        return [text for cleaned in parts for text in cleaned]
+    return (
+        [text for cleaned, _ in parts for text in cleaned],
+        TokenCache.concat(tokens for _, tokens in parts)
+    )
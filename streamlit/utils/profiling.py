@@ -0,0 +1,324 @@
+"""
+Instrumentasi waktu, throughput, dan peak memory per tahap pipeline
+"""
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from config import PROFILING_CONFIG
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_active_timer: ContextVar = ContextVar('stage_timer', default=None)
+
+# tracemalloc bersifat global per proses (start/stop/reset_peak berlaku untuk
+# semua thread), jadi hanya satu timer yang boleh memakainya dalam satu waktu
+_tracing_lock = threading.Lock()
+
+MB = 1024 ** 2
+
+
+def peak_memory_mb() -> Optional[float]:
+    """
+    High-water mark RSS proses sejak proses mulai (MB), bukan per tahap.
+    
+    Returns:
+        Peak RSS dalam MB, atau None jika tidak tersedia (Windows)
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KB, macOS: bytes
+    divisor = 1024 ** 2 if sys.platform == 'darwin' else 1024
+    return peak / divisor
+
+
+def current_rss_mb() -> Optional[float]:
+    """
+    RSS proses saat ini (MB), dari /proc/self/statm.
+    
+    Returns:
+        RSS dalam MB, atau None jika tidak tersedia (selain Linux)
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / MB
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class _PeakSampler(threading.Thread):
+    """
+    Thread yang memantau memory traced selama satu tahap teratas dan
+    mengambil snapshot tracemalloc setiap kali memory naik ke puncak baru
+    (lebih dari peak_snapshot_growth di atas snapshot sebelumnya).
+    
+    Snapshot terakhir adalah kondisi heap paling dekat dengan peak tahap,
+    termasuk buffer sementara yang sudah dibebaskan sebelum tahap selesai.
+    Peak di dalam satu pemanggilan C yang memegang GIL bisa terlewat.
+    """
+    
+    def __init__(self, timer: 'StageTimer'):
+        super().__init__(name='stage-peak-sampler', daemon=True)
+        self.timer = timer
+        self.interval = PROFILING_CONFIG['peak_sample_ms'] / 1000
+        self.growth = PROFILING_CONFIG['peak_snapshot_growth']
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.snapshot_bytes = tracemalloc.get_traced_memory()[0]
+        self.step: Optional[str] = None
+        self._stopped = threading.Event()
+    
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            self.sample()
+    
+    def sample(self):
+        """Ambil snapshot jika memory traced saat ini melewati puncak sebelumnya."""
+        try:
+            current = tracemalloc.get_traced_memory()[0]
+            if current > self.snapshot_bytes * (1 + self.growth):
+                step = '.'.join(self.timer._stack[1:]) or None
+                self.snapshot = tracemalloc.take_snapshot()
+                self.snapshot_bytes = current
+                self.step = step
+        except Exception:  # tracing sudah dihentikan
+            self._stopped.set()
+    
+    def stop(self):
+        """Hentikan thread (dipanggil sebelum tracemalloc.stop)."""
+        self._stopped.set()
+        self.join()
+
+
+class StageTimer:
+    """
+    Pencatat waktu per tahap dan sub-tahap (bersarang).
+    
+    Setiap record berisi wall time, jumlah baris, rows/sec, RSS saat tahap
+    selesai (rss_mb), dan kenaikan high-water mark RSS proses selama tahap
+    (peak_growth_mb; 0 jika tahap tidak melewati peak proses sebelumnya).
+    peak_rss_mb adalah high-water mark sejak proses mulai, bukan milik
+    tahap. Method service yang diberi decorator @timed otomatis tercatat
+    sebagai sub-tahap selama timer ini aktif.
+    
+    Dengan memory_profile aktif, tracemalloc dijalankan selama tahap
+    teratas: setiap (sub-)tahap mendapat peak memory Python/numpy miliknya
+    sendiri, dan tahap teratas mendapat top-N lokasi alokasi yang hidup saat
+    peak tahap (snapshot _PeakSampler) beserta sub-tahap yang sedang
+    berjalan saat itu ('peak_step'). Tanpa memory_profile, tracemalloc
+    tidak disentuh.
+    
+    Karena tracemalloc global per proses, tahap teratas hanya diprofile jika
+    tracing belum aktif dan tidak sedang dipakai timer lain (sesi lain);
+    jika tidak, record diberi 'memory_skipped' dan tahap tetap berjalan.
+    Kegagalan profiling memory tidak pernah menggagalkan tahap.
+    """
+    
+    def __init__(self, memory_profile: Optional[bool] = None, top_n: Optional[int] = None):
+        self.records: List[Dict] = []
+        self._stack: List[str] = []
+        self.memory_profile = (
+            PROFILING_CONFIG['memory'] if memory_profile is None else memory_profile
+        )
+        self.top_n = top_n or PROFILING_CONFIG['top_n']
+        self._peaks: List[int] = []
+        self._owns_tracing = False
+        self._sampler: Optional[_PeakSampler] = None
+    
+    def _acquire_tracing(self) -> bool:
+        """
+        Mulai tracemalloc untuk satu tahap teratas.
+        
+        Returns:
+            False jika tracemalloc sedang dipakai timer lain atau sudah
+            dijalankan kode lain (peak miliknya tidak boleh di-reset)
+        """
+        if not _tracing_lock.acquire(blocking=False):
+            return False
+        try:
+            if tracemalloc.is_tracing():
+                raise RuntimeError("tracemalloc sudah aktif")
+            tracemalloc.start(PROFILING_CONFIG['traceback_frames'])
+        except Exception:
+            _tracing_lock.release()
+            return False
+        self._owns_tracing = True
+        self._peaks = []
+        return True
+    
+    def _release_tracing(self):
+        """Hentikan tracemalloc milik timer ini."""
+        if not self._owns_tracing:
+            return
+        self._owns_tracing = False
+        try:
+            if self._sampler is not None:
+                self._sampler.stop()
+                self._sampler = None
+            tracemalloc.stop()
+        except Exception:
+            pass
+        finally:
+            _tracing_lock.release()
+    
+    def _fold_peak(self):
+        """Masukkan peak tracemalloc saat ini ke semua tahap yang terbuka."""
+        peak = tracemalloc.get_traced_memory()[1]
+        self._peaks = [max(p, peak) for p in self._peaks]
+        if hasattr(tracemalloc, 'reset_peak'):  # Python >= 3.9
+            tracemalloc.reset_peak()
+    
+    def _start_memory(self, record: Dict):
+        """Mulai pengukuran memory untuk satu (sub-)tahap."""
+        self._fold_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        self._peaks.append(current)
+        record['_traced_start'] = current
+        if record['depth'] == 0:
+            record['_snapshot'] = tracemalloc.take_snapshot()
+            self._sampler = _PeakSampler(self)
+            self._sampler.start()
+    
+    def _stop_memory(self, record: Dict):
+        """Selesaikan pengukuran memory satu (sub-)tahap."""
+        if '_traced_start' not in record:  # _start_memory gagal
+            return
+        start = record.pop('_traced_start')
+        self._fold_peak()
+        peak = self._peaks.pop()
+        record['traced_peak_mb'] = peak / MB
+        record['traced_peak_growth_mb'] = (peak - start) / MB
+        
+        start_snapshot = record.pop('_snapshot', None)
+        if start_snapshot is not None:
+            sampler, self._sampler = self._sampler, None
+            sampler.stop()
+            sampler.sample()  # Kondisi akhir tahap, jika itu puncaknya
+            record['peak_step'] = sampler.step or record['step']
+            record['peak_snapshot_mb'] = sampler.snapshot_bytes / MB
+            record['top_allocations'] = top_allocations(
+                start_snapshot, sampler.snapshot or tracemalloc.take_snapshot(),
+                self.top_n
+            )
+    
+    def _profile_memory(self, method, record: Dict):
+        """Jalankan _start_memory/_stop_memory tanpa menggagalkan tahap."""
+        try:
+            method(record)
+        except Exception as e:
+            record.pop('_snapshot', None)
+            record['memory_error'] = str(e)
+    
+    @contextmanager
+    def stage(self, name: str, rows: Optional[int] = None):
+        """
+        Catat satu tahap. Record yang di-yield boleh diisi 'rows' di dalam blok.
+        
+        Args:
+            name: Nama tahap
+            rows: Jumlah baris yang diproses (bisa diisi belakangan)
+        """
+        self._stack.append(name)
+        record = {
+            'stage': self._stack[0],
+            'step': '.'.join(self._stack[1:]) or name,
+            'depth': len(self._stack) - 1,
+            'rows': rows
+        }
+        self.records.append(record)
+        token = _active_timer.set(self)
+        if self.memory_profile and record['depth'] == 0:
+            if not self._acquire_tracing():
+                record['memory_skipped'] = True
+        track_memory = self.memory_profile and self._owns_tracing
+        if track_memory:
+            self._profile_memory(self._start_memory, record)
+        peak_before = peak_memory_mb()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            seconds = time.perf_counter() - start
+            if track_memory:
+                self._profile_memory(self._stop_memory, record)
+            if record['depth'] == 0:
+                self._release_tracing()
+            peak_after = peak_memory_mb()
+            record['seconds'] = seconds
+            record['rows_per_sec'] = (
+                record['rows'] / seconds if record['rows'] and seconds > 0 else None
+            )
+            record['rss_mb'] = current_rss_mb()
+            record['peak_rss_mb'] = peak_after
+            record['peak_growth_mb'] = (
+                peak_after - peak_before if peak_after is not None else None
+            )
+            _active_timer.reset(token)
+            self._stack.pop()
+
+
+def top_allocations(before: tracemalloc.Snapshot, after: tracemalloc.Snapshot,
+                    top_n: int) -> List[Dict]:
+    """
+    Top-N lokasi alokasi (file:baris) dengan pertambahan memory terbesar.
+    
+    Args:
+        before: Snapshot awal tahap
+        after: Snapshot pembanding (saat peak atau akhir tahap)
+        top_n: Jumlah lokasi
+        
+    Returns:
+        List dictionary berisi site, size_mb, dan count
+    """
+    ignore = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__)
+    ]
+    stats = after.filter_traces(ignore).compare_to(
+        before.filter_traces(ignore), 'lineno'
+    )
+    stats = sorted(stats, key=lambda stat: stat.size_diff, reverse=True)[:top_n]
+    return [
+        {
+            'site': f"{Path(stat.traceback[0].filename).name}:{stat.traceback[0].lineno}",
+            'file': stat.traceback[0].filename,
+            'size_mb': stat.size_diff / MB,
+            'count': stat.count_diff
+        }
+        for stat in stats if stat.size_diff > 0
+    ]
+
+
+def timed(rows_attr: str = 'data'):
+    """
+    Decorator method service: catat sebagai sub-tahap jika ada StageTimer aktif.
+    
+    Tanpa timer aktif, method dipanggil langsung (overhead satu lookup).
+    
+    Args:
+        rows_attr: Atribut DataFrame di self untuk menghitung jumlah baris
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            timer = _active_timer.get()
+            if timer is None:
+                return func(self, *args, **kwargs)
+            with timer.stage(func.__name__) as record:
+                result = func(self, *args, **kwargs)
+                data = getattr(self, rows_attr, None)
+                record['rows'] = len(data) if data is not None else None
+                return result
+        return wrapper
+    return decorator
@@ -0,0 +1,254 @@
+"""
+Progress berbobot per tahap, ETA, dan pembatalan untuk job di background
+"""
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Optional
+
+from config import PROGRESS_CONFIG
+
+_active_progress: ContextVar = ContextVar('progress_tracker', default=None)
+_active_span: ContextVar = ContextVar('progress_span', default=(0.0, 1.0))
+
+
+class JobCancelled(Exception):
+    """Dilempar dari dalam loop panjang saat job dibatalkan."""
+
+
+class ProgressTracker:
+    """
+    Progress job sebagai pecahan 0..1 dari bobot tahap (PROGRESS_CONFIG).
+    
+    Tahap dimulai dengan start_stage(); loop panjang di service memanggil
+    report_progress(done, total) sehingga progress bergerak di dalam tahap,
+    bukan hanya di batas tahap. Semua method aman dipanggil dari thread
+    berbeda (worker menulis, UI membaca snapshot).
+    """
+    
+    def __init__(self, stage_weights: Optional[Dict[str, float]] = None):
+        weights = stage_weights or PROGRESS_CONFIG['stage_weights']
+        total = sum(weights.values())
+        self.weights = {name: weight / total for name, weight in weights.items()}
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self.started_at = time.time()
+        self.stage = None
+        self.step = None
+        self._completed = 0.0
+        self._stage_fraction = 0.0
+    
+    def start_stage(self, name: str) -> 'ProgressTracker':
+        """
+        Tandai tahap sebelumnya selesai dan mulai tahap baru.
+        
+        Args:
+            name: Nama tahap (kunci stage_weights)
+            
+        Returns:
+            Self untuk method chaining
+        """
+        self.check_cancelled()
+        with self._lock:
+            if self.stage is not None:
+                self._completed += self.weights.get(self.stage, 0.0)
+            self.stage = name
+            self.step = None
+            self._stage_fraction = 0.0
+        return self
+    
+    def update(self, fraction: float, step: Optional[str] = None):
+        """
+        Perbarui progress di dalam tahap aktif.
+        
+        Args:
+            fraction: Pecahan tahap aktif yang sudah selesai (0..1)
+            step: Nama loop (mis. 'similarity', 'isolation_forest')
+        """
+        with self._lock:
+            self._stage_fraction = min(max(fraction, 0.0), 1.0)
+            if step is not None:
+                self.step = step
+        self.check_cancelled()
+    
+    def finish(self):
+        """Tandai semua tahap selesai."""
+        with self._lock:
+            self._completed = 1.0
+            self._stage_fraction = 0.0
+            self.stage = None
+            self.step = None
+    
+    def fraction(self) -> float:
+        """Pecahan progress total (0..1)."""
+        with self._lock:
+            current = self.weights.get(self.stage, 0.0) * self._stage_fraction
+            return min(self._completed + current, 1.0)
+    
+    def snapshot(self) -> dict:
+        """
+        Keadaan progress untuk ditampilkan UI.
+        
+        Returns:
+            Dictionary berisi fraction, stage, step, elapsed_seconds,
+            dan eta_seconds (None jika belum bisa diperkirakan)
+        """
+        fraction = self.fraction()
+        elapsed = time.time() - self.started_at
+        eta = (
+            elapsed * (1 - fraction) / fraction
+            if fraction >= PROGRESS_CONFIG['min_fraction_for_eta'] else None
+        )
+        return {
+            'fraction': fraction,
+            'stage': self.stage,
+            'step': self.step,
+            'elapsed_seconds': elapsed,
+            'eta_seconds': eta
+        }
+    
+    def cancel(self):
+        """Minta job berhenti pada pemanggilan progress berikutnya."""
+        self._cancel.set()
+    
+    @property
+    def cancelled(self) -> bool:
+        """True jika pembatalan sudah diminta."""
+        return self._cancel.is_set()
+    
+    def check_cancelled(self):
+        """Lempar JobCancelled jika pembatalan sudah diminta."""
+        if self._cancel.is_set():
+            raise JobCancelled(f"Dibatalkan pada tahap {self.stage}")
+
+
+@contextmanager
+def track_progress(tracker: ProgressTracker):
+    """
+    Aktifkan tracker untuk report_progress() di konteks (thread) saat ini.
+    
+    Args:
+        tracker: ProgressTracker job
+    """
+    token = _active_progress.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _active_progress.reset(token)
+
+
+@contextmanager
+def progress_span(index: int, count: int):
+    """
+    Petakan report_progress() di dalam blok ke potongan ke-index dari count
+    bagian span aktif, untuk loop di dalam langkah yang juga dilaporkan
+    (mis. pohon Isolation Forest di dalam langkah deteksi).
+    
+    Args:
+        index: Posisi langkah (0..count-1)
+        count: Jumlah langkah
+    """
+    low, high = _active_span.get()
+    width = (high - low) / count
+    token = _active_span.set((low + index * width, low + (index + 1) * width))
+    try:
+        yield
+    finally:
+        _active_span.reset(token)
+
+
+def report_progress(done: int, total: int, step: Optional[str] = None):
+    """
+    Laporkan progress loop panjang ke tracker aktif (jika ada).
+    
+    Tanpa tracker aktif (CLI, benchmark), fungsi ini tidak melakukan apa pun.
+    Dengan tracker yang sudah dibatalkan, JobCancelled dilempar sehingga
+    loop berhenti di iterasi berikutnya.
+    
+    Args:
+        done: Unit kerja yang sudah selesai
+        total: Total unit kerja
+        step: Nama loop
+    """
+    tracker = _active_progress.get()
+    if tracker is not None:
+        low, high = _active_span.get()
+        done_fraction = min(done / total, 1.0) if total else 1.0
+        tracker.update(low + (high - low) * done_fraction, step)
+
+
+class BackgroundJob:
+    """
+    Jalankan fungsi di thread daemon dengan ProgressTracker sendiri.
+    
+    Fungsi target menerima tracker sebagai argumen pertama. Status job:
+    'pending', 'running', 'done', 'cancelled', atau 'error'.
+    """
+    
+    def __init__(self, target: Callable, *args,
+                 stage_weights: Optional[Dict[str, float]] = None, **kwargs):
+        self.target = target
+        self.args = args
+        self.kwargs = kwargs
+        self.tracker = ProgressTracker(stage_weights)
+        self.status = 'pending'
+        self.result = None
+        self.error = None
+        self.finished_at = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+    
+    def _run(self):
+        """Body thread worker."""
+        self.status = 'running'
+        try:
+            with track_progress(self.tracker):
+                self.result = self.target(self.tracker, *self.args, **self.kwargs)
+            self.tracker.finish()
+            self.status = 'done'
+        except JobCancelled:
+            self.status = 'cancelled'
+        except Exception as e:
+            self.error = e
+            self.status = 'error'
+        finally:
+            self.finished_at = time.time()
+    
+    def start(self) -> 'BackgroundJob':
+        """
+        Mulai thread worker.
+        
+        Returns:
+            Self untuk method chaining
+        """
+        self.tracker.started_at = time.time()
+        self._thread.start()
+        return self
+    
+    def cancel(self):
+        """Minta worker berhenti (berhenti di report_progress berikutnya)."""
+        self.tracker.cancel()
+    
+    @property
+    def running(self) -> bool:
+        """True selama worker belum selesai."""
+        return self.status in ('pending', 'running')
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Tunggu worker selesai.
+        
+        Args:
+            timeout: Batas waktu tunggu (detik)
+            
+        Returns:
+            True jika worker sudah selesai
+        """
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+    
+    def progress(self) -> dict:
+        """Snapshot progress beserta status job."""
+        snapshot = self.tracker.snapshot()
+        snapshot['status'] = self.status
+        return snapshot
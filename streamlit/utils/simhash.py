@@ -0,0 +1,164 @@
+"""
+SimHash 64-bit untuk deteksi komentar near-duplicate
+"""
+import hashlib
+from typing import Iterable
+
+import numpy as np
+from scipy.sparse import coo_matrix
+from sklearn.feature_extraction.text import CountVectorizer
+
+FINGERPRINT_BITS = 64
+_BIT_SHIFTS = np.arange(FINGERPRINT_BITS, dtype=np.uint64)
+# Tabel popcount per byte untuk menghitung Hamming distance
+_POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def _token_hash(token: str) -> int:
+    """Hash 64-bit deterministik (tidak bergantung PYTHONHASHSEED)."""
+    return int.from_bytes(
+        hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'little'
+    )
+
+
+def hamming_distance(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Hitung Hamming distance antar fingerprint uint64 (elementwise).
+    
+    Args:
+        a: Array fingerprint uint64
+        b: Array fingerprint uint64 (ukuran sama dengan a)
+        
+    Returns:
+        Array jumlah bit yang berbeda
+    """
+    xor = np.ascontiguousarray(np.bitwise_xor(a, b), dtype=np.uint64)
+    return _POPCOUNT_TABLE[xor.view(np.uint8)].reshape(-1, 8).sum(axis=1)
+
+
+def simhash_fingerprints(texts: Iterable[str]) -> np.ndarray:
+    """
+    Hitung fingerprint SimHash 64-bit untuk setiap teks.
+    
+    Fitur berupa character 3-gram (lebih stabil untuk komentar pendek
+    daripada kata). Setiap fitur di-hash sekali per vocabulary, lalu
+    fingerprint seluruh dokumen dihitung dengan satu perkalian matriks
+    (count x bobot bit).
+    
+    Args:
+        texts: Teks yang sudah dibersihkan
+        
+    Returns:
+        Array uint64 berisi fingerprint (0 untuk teks tanpa token)
+    """
+    # Teks identik cukup di-fingerprint sekali
+    unique_index = {}
+    codes = np.fromiter(
+        (unique_index.setdefault(t, len(unique_index)) for t in texts),
+        dtype=np.int64
+    )
+    texts = list(unique_index)
+    
+    vectorizer = CountVectorizer(
+        analyzer='char_wb', ngram_range=(3, 3), lowercase=False
+    )
+    try:
+        counts = vectorizer.fit_transform(texts)
+    except ValueError:
+        # Semua teks kosong
+        return np.zeros(len(codes), dtype=np.uint64)
+    
+    hashes = np.array(
+        [_token_hash(t) for t in vectorizer.get_feature_names_out()],
+        dtype=np.uint64
+    )
+    # Bobot +1/-1 per bit untuk setiap token di vocabulary
+    bits = (hashes[:, None] >> _BIT_SHIFTS) & np.uint64(1)
+    weights = bits.astype(np.float32) * 2 - 1
+    
+    scores = counts.astype(np.float32) @ weights
+    fingerprint_bits = (scores > 0).astype(np.uint64)
+    fingerprints = (fingerprint_bits << _BIT_SHIFTS).sum(axis=1, dtype=np.uint64)
+    return fingerprints[codes]
+
+
+def near_duplicate_groups(fingerprints: np.ndarray, max_distance: int = 6,
+                          max_bucket: int = 128) -> np.ndarray:
+    """
+    Kelompokkan fingerprint yang Hamming distance-nya <= max_distance.
+    
+    Fingerprint dipecah menjadi (max_distance + 1) blok bit. Berdasarkan
+    pigeonhole, dua fingerprint yang mirip pasti identik di minimal satu
+    blok, sehingga kandidat cukup dicari di antara fingerprint dengan blok
+    yang sama (tabel terurut per blok, setara tabel permutasi bit).
+    
+    Grup dibentuk secara greedy sesuai urutan kemunculan: fingerprint
+    pertama menjadi leader dan menyerap semua tetangganya yang belum punya
+    grup. Setiap anggota dijamin dekat dengan leader-nya (tidak berantai).
+    
+    Args:
+        fingerprints: Array fingerprint uint64
+        max_distance: Hamming distance maksimum untuk dianggap near-duplicate
+        max_bucket: Jumlah tetangga maksimum yang dibandingkan per bucket
+            (batas biaya untuk data sangat besar)
+        
+    Returns:
+        Array label grup (int) untuk setiap fingerprint
+    """
+    fingerprints = np.asarray(fingerprints, dtype=np.uint64)
+    if len(fingerprints) == 0:
+        return np.zeros(0, dtype=np.int64)
+    
+    # Fingerprint identik (distance 0) digabung dulu
+    unique_fp, first_index, inverse = np.unique(
+        fingerprints, return_index=True, return_inverse=True
+    )
+    n_unique = len(unique_fp)
+    
+    # Batas blok dibagi rata (mis. 7 blok -> 9/10 bit per blok)
+    num_blocks = min(max_distance + 1, FINGERPRINT_BITS)
+    bounds = [round(i * FINGERPRINT_BITS / num_blocks) for i in range(num_blocks + 1)]
+    
+    rows, cols = [], []
+    for start, end in zip(bounds[:-1], bounds[1:]):
+        mask = np.uint64((1 << (end - start)) - 1)
+        keys = (unique_fp >> np.uint64(start)) & mask
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        
+        # Bandingkan setiap fingerprint dengan tetangganya di bucket yang sama
+        for offset in range(1, min(max_bucket, n_unique - 1) + 1):
+            same = sorted_keys[offset:] == sorted_keys[:-offset]
+            if not same.any():
+                break
+            left = order[:-offset][same]
+            right = order[offset:][same]
+            close = hamming_distance(unique_fp[left], unique_fp[right]) <= max_distance
+            rows.append(left[close])
+            cols.append(right[close])
+    
+    if rows:
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+    else:
+        rows = cols = np.zeros(0, dtype=np.int64)
+    
+    adjacency = coo_matrix(
+        (np.ones(len(rows), dtype=np.int8), (rows, cols)),
+        shape=(n_unique, n_unique)
+    )
+    adjacency = (adjacency + adjacency.T).tocsr()
+    
+    labels = np.arange(n_unique)
+    assigned = np.zeros(n_unique, dtype=bool)
+    indptr, indices = adjacency.indptr, adjacency.indices
+    for node in np.argsort(first_index, kind='stable'):
+        if assigned[node]:
+            continue
+        assigned[node] = True
+        neighbors = indices[indptr[node]:indptr[node + 1]]
+        free = neighbors[~assigned[neighbors]]
+        labels[free] = node
+        assigned[free] = True
+    
+    return labels[inverse]
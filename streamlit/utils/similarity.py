@@ -0,0 +1,130 @@
+"""
+Helper similarity berbasis matrix TF-IDF global
+"""
+import numpy as np
+from scipy.sparse import csr_matrix, issparse
+from config import TOP_K_CONFIG
+
+# Byte per sel blok: skor float32 + indeks int64 hasil argpartition
+BLOCK_CELL_BYTES = 4 + 8
+
+
+def group_indicator(group_codes: np.ndarray, n_groups: int) -> csr_matrix:
+    """
+    Matrix indikator grup x baris (1 jika baris milik grup).
+    
+    Args:
+        group_codes: Kode grup per baris (0..n_groups-1)
+        n_groups: Jumlah grup
+        
+    Returns:
+        CSR matrix berukuran (n_groups, n_rows)
+    """
+    n_rows = len(group_codes)
+    return csr_matrix(
+        (np.ones(n_rows), (group_codes, np.arange(n_rows))),
+        shape=(n_groups, n_rows)
+    )
+
+
+def group_mean_pairwise_cosine(matrix, group_codes: np.ndarray,
+                               n_groups: int) -> np.ndarray:
+    """
+    Rata-rata cosine similarity antar baris dalam grup yang sama (tanpa
+    diagonal), untuk semua grup sekaligus.
+    
+    Untuk baris ter-normalisasi, jumlah similarity antar pasangan di satu
+    grup = ||sum baris||^2 - sum ||baris||^2, sehingga cukup satu perkalian
+    sparse tanpa membentuk matrix similarity per grup.
+    
+    Args:
+        matrix: Matrix fitur (baris = komentar), mis. TF-IDF global (sparse)
+            atau embedding (dense numpy)
+        group_codes: Kode grup (author) per baris
+        n_groups: Jumlah grup
+        
+    Returns:
+        Array rata-rata similarity per grup (0 untuk grup < 2 baris)
+    """
+    from sklearn.preprocessing import normalize
+    
+    group_codes = np.asarray(group_codes)
+    indicator = group_indicator(group_codes, n_groups)
+    
+    if issparse(matrix):
+        matrix = normalize(csr_matrix(matrix))
+        sums = indicator @ matrix
+        total = np.asarray(sums.multiply(sums).sum(axis=1)).ravel()
+        row_norms = np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel()
+    else:
+        matrix = normalize(np.asarray(matrix))
+        sums = indicator @ matrix
+        total = np.einsum('ij,ij->i', sums, sums)
+        row_norms = np.einsum('ij,ij->i', matrix, matrix)
+    self_similarity = indicator @ row_norms
+    
+    sizes = np.bincount(group_codes, minlength=n_groups)
+    pairs = sizes * (sizes - 1)
+    result = np.zeros(n_groups)
+    valid = pairs > 0
+    result[valid] = (total - self_similarity)[valid] / pairs[valid]
+    return np.clip(result, 0.0, 1.0)
+
+
+def top_k_cosine(queries, matrix, k: int, block_size: int = None,
+                 exclude: np.ndarray = None):
+    """
+    Top-k dot product (cosine untuk baris ter-normalisasi) secara exact,
+    diproses per blok query agar memory tetap.
+    
+    Tinggi blok dibatasi TOP_K_CONFIG['max_block_mb'] terhadap jumlah
+    kandidat, sehingga memory per blok tidak tumbuh dengan n_baris.
+    
+    Args:
+        queries: Matrix query (sparse atau dense), baris ter-normalisasi
+        matrix: Matrix kandidat dengan kolom yang sama, baris ter-normalisasi
+        k: Jumlah tetangga per query
+        block_size: Jumlah query maksimum per blok (default: dari batas memory)
+        exclude: Indeks kandidat yang dilewati per query (mis. dirinya
+            sendiri), -1 jika tidak ada
+            
+    Returns:
+        Tuple (indeks n_query x k, skor n_query x k), urut skor menurun
+    """
+    n_queries, n_candidates = queries.shape[0], matrix.shape[0]
+    k = min(k, n_candidates)
+    indices = np.zeros((n_queries, k), dtype=np.int64)
+    scores = np.zeros((n_queries, k), dtype=np.float32)
+    if k == 0:
+        return indices, scores
+    
+    max_rows = max(
+        1, int(TOP_K_CONFIG['max_block_mb'] * 1024 ** 2)
+        // (BLOCK_CELL_BYTES * n_candidates)
+    )
+    block_size = min(block_size or max_rows, max_rows)
+    
+    matrix_t = matrix.T.tocsr() if issparse(matrix) else np.asarray(matrix).T
+    for start in range(0, n_queries, block_size):
+        end = min(start + block_size, n_queries)
+        block = queries[start:end] @ matrix_t
+        block = block.toarray() if issparse(block) else np.asarray(block)
+        block = block.astype(np.float32, copy=False)
+        
+        if exclude is not None:
+            rows = np.arange(end - start)
+            skip = np.asarray(exclude[start:end])
+            valid = skip >= 0
+            block[rows[valid], skip[valid]] = -np.inf
+        
+        # Negasi in-place (tanpa salinan -block) agar argpartition memilih
+        # skor terbesar
+        np.negative(block, out=block)
+        top = np.argpartition(block, k - 1, axis=1)[:, :k]
+        top_scores = -np.take_along_axis(block, top, axis=1)
+        del block
+        order = np.argsort(-top_scores, axis=1, kind='stable')
+        indices[start:end] = np.take_along_axis(top, order, axis=1)
+        scores[start:end] = np.take_along_axis(top_scores, order, axis=1)
+    
+    return indices, scores
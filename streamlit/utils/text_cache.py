@@ -0,0 +1,109 @@
+"""
+Cache LRU untuk hasil pembersihan teks komentar
+"""
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterable, List, Optional
+from config import CLEAN_CACHE_CONFIG
+from utils.helpers import clean_text_batch
+from utils.cache_keys import lexicon_key
+
+
+class CleanTextCache:
+    """
+    Cache LRU teks mentah -> teks bersih, bertahan antar run dalam satu proses.
+    
+    Cache otomatis dikosongkan jika kamus normalisasi berubah. Aman dipakai
+    beberapa sesi sekaligus: lookup, insert, dan eviction dijaga lock,
+    sedangkan pembersihan teks yang belum di-cache berjalan di luar lock.
+    """
+    
+    def __init__(self, max_size: Optional[int] = None):
+        self.max_size = max_size or CLEAN_CACHE_CONFIG['max_size']
+        self._entries: 'OrderedDict[str, str]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._lexicon_key = None
+        self.hits = 0
+        self.misses = 0
+    
+    def _check_lexicon(self):
+        """
+        Kosongkan cache jika isi kamus aktif berubah.
+        
+        Kuncinya hash isi kamus (lexicon_key), bukan id objek: id bisa
+        dipakai ulang objek kamus baru setelah kamus lama dibebaskan.
+        """
+        key = lexicon_key()
+        if key != self._lexicon_key:
+            self._entries.clear()
+            self._lexicon_key = key
+    
+    def clean_many(self, texts: Iterable[str],
+                   clean_func: Callable[[List[str]], List[str]] = clean_text_batch
+                   ) -> List[str]:
+        """
+        Bersihkan teks (sebaiknya sudah unik), pakai cache bila tersedia.
+        
+        Args:
+            texts: Kumpulan teks mentah
+            clean_func: Fungsi pembersih untuk teks yang belum ada di cache
+            
+        Returns:
+            List teks bersih dengan urutan sama seperti input
+        """
+        texts = [str(t) for t in texts]
+        with self._lock:
+            self._check_lexicon()
+            cache_key = self._lexicon_key
+            results: List[Optional[str]] = [self._entries.get(t) for t in texts]
+            missing = [i for i, r in enumerate(results) if r is None]
+            self.hits += len(texts) - len(missing)
+            self.misses += len(missing)
+        
+        cleaned = clean_func([texts[i] for i in missing]) if missing else []
+        for i, value in zip(missing, cleaned):
+            results[i] = value
+        
+        with self._lock:
+            entries = self._entries
+            # Hasil dari kamus lama tidak dimasukkan ke cache kamus baru
+            if self._lexicon_key == cache_key:
+                for i in missing:
+                    entries[texts[i]] = results[i]
+            # Tandai semua teks sebagai baru dipakai lalu buang yang paling lama
+            for t in texts:
+                if t in entries:
+                    entries.move_to_end(t)
+            while len(entries) > self.max_size:
+                entries.popitem(last=False)
+        
+        return results
+    
+    def clear(self):
+        """Kosongkan cache."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_default_cache: Optional[CleanTextCache] = None
+_default_lock = threading.Lock()
+
+
+def get_text_cache() -> CleanTextCache:
+    """
+    Mendapatkan cache teks bersama (satu per proses).
+    
+    Returns:
+        CleanTextCache default
+    """
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = CleanTextCache()
+    return _default_cache
@@ -0,0 +1,198 @@
+"""
+Cache token hasil tokenisasi sekali untuk seluruh pipeline
+"""
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+
+class TokenCache:
+    """
+    Token per komentar dalam bentuk CSR: offsets (n_docs + 1) dan ids token.
+    
+    Setiap teks unik hanya di-split sekali dan token di-intern ke vocabulary,
+    sehingga tahap berikutnya (panjang teks, TF-IDF, similarity per author)
+    cukup membaca array id tanpa menyentuh string mentah lagi.
+    """
+    
+    def __init__(self, offsets: np.ndarray, ids: np.ndarray,
+                 vocabulary: List[str]):
+        self.offsets = offsets
+        self.ids = ids
+        self.vocabulary = vocabulary
+    
+    @classmethod
+    def build(cls, texts: Iterable) -> 'TokenCache':
+        """
+        Tokenisasi (split spasi) semua teks sekali.
+        
+        Args:
+            texts: Teks yang sudah dibersihkan (urutan = urutan baris)
+            
+        Returns:
+            TokenCache baru
+        """
+        unique_index = {}
+        codes = np.fromiter(
+            (unique_index.setdefault(t, len(unique_index)) for t in texts),
+            dtype=np.int64
+        )
+        
+        # Tokenisasi per teks unik, token di-intern ke id
+        token_index = {}
+        unique_ids: List[int] = []
+        unique_lengths = np.zeros(len(unique_index), dtype=np.int64)
+        for i, text in enumerate(unique_index):
+            tokens = str(text).split()
+            unique_lengths[i] = len(tokens)
+            unique_ids.extend(
+                token_index.setdefault(t, len(token_index)) for t in tokens
+            )
+        unique_offsets = np.zeros(len(unique_index) + 1, dtype=np.int64)
+        np.cumsum(unique_lengths, out=unique_offsets[1:])
+        unique = cls(
+            unique_offsets, np.asarray(unique_ids, dtype=np.int32), list(token_index)
+        )
+        
+        # Sebar kembali ke setiap baris lewat codes
+        return unique.take(codes)
+    
+    @classmethod
+    def concat(cls, parts: Iterable['TokenCache']) -> 'TokenCache':
+        """
+        Gabungkan beberapa TokenCache (dokumen disambung sesuai urutan).
+        
+        Dipakai untuk menyatukan hasil tokenisasi per chunk dari worker:
+        id token setiap bagian dipetakan ke vocabulary gabungan.
+        
+        Args:
+            parts: TokenCache per chunk
+            
+        Returns:
+            TokenCache baru
+        """
+        token_index = {}
+        ids, lengths = [], []
+        for part in parts:
+            remap = np.fromiter(
+                (token_index.setdefault(t, len(token_index)) for t in part.vocabulary),
+                dtype=np.int32, count=len(part.vocabulary)
+            )
+            ids.append(remap[part.ids])
+            lengths.append(part.lengths())
+        
+        lengths = np.concatenate(lengths) if lengths else np.zeros(0, np.int64)
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        ids = np.concatenate(ids) if ids else np.zeros(0, np.int32)
+        return cls(offsets, ids, list(token_index))
+    
+    def take(self, rows: np.ndarray) -> 'TokenCache':
+        """
+        Pilih dokumen berdasarkan indeks (boleh berulang), vocabulary tetap.
+        
+        Args:
+            rows: Indeks dokumen untuk setiap dokumen hasil
+            
+        Returns:
+            TokenCache baru
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        lengths = self.lengths()[rows]
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        gather = (
+            np.repeat(self.offsets[:-1][rows] - offsets[:-1], lengths)
+            + np.arange(offsets[-1])
+        )
+        return TokenCache(offsets, self.ids[gather], self.vocabulary)
+    
+    @property
+    def n_docs(self) -> int:
+        """Jumlah dokumen (baris)."""
+        return len(self.offsets) - 1
+    
+    def lengths(self) -> np.ndarray:
+        """Jumlah token per dokumen."""
+        return np.diff(self.offsets)
+    
+    def ngram_counts(self, ngram_range: Tuple[int, int] = (1, 1),
+                     stop_words: Optional[Iterable[str]] = None,
+                     min_token_len: int = 2) -> Tuple[csr_matrix, List[str]]:
+        """
+        Bangun matrix count n-gram (dokumen x fitur) langsung dari id token.
+        
+        Hasilnya setara CountVectorizer dengan token_pattern default
+        (token minimal 2 karakter) pada teks yang sudah dibersihkan: stopwords
+        dibuang dulu, n-gram dibentuk dari token yang tersisa, dan kolom
+        diurutkan alfabetis.
+        
+        Args:
+            ngram_range: (min_n, max_n), hanya mendukung n <= 2
+            stop_words: Token yang dibuang sebelum membentuk n-gram
+            min_token_len: Panjang token minimum
+            
+        Returns:
+            Tuple (matrix count CSR int64, daftar nama fitur)
+        """
+        min_n, max_n = ngram_range
+        if max_n > 2:
+            raise ValueError("TokenCache hanya mendukung unigram dan bigram")
+        
+        stop_words = set(stop_words or [])
+        keep_vocab = np.fromiter(
+            (len(t) >= min_token_len and t not in stop_words
+             for t in self.vocabulary),
+            dtype=bool, count=len(self.vocabulary)
+        )
+        
+        doc_of_token = np.repeat(np.arange(self.n_docs), self.lengths())
+        kept = keep_vocab[self.ids] if len(self.ids) else np.zeros(0, dtype=bool)
+        ids = self.ids[kept].astype(np.int64)
+        docs = doc_of_token[kept]
+        
+        feature_docs, feature_keys, names = [], [], []
+        vocab_size = len(self.vocabulary)
+        
+        if min_n <= 1:
+            unigram_ids = np.unique(ids)
+            feature_docs.append(docs)
+            feature_keys.append(ids)
+            names.extend(self.vocabulary[i] for i in unigram_ids)
+            key_space = [unigram_ids]
+        else:
+            key_space = []
+        
+        if max_n >= 2:
+            # Pasangan token berurutan di dokumen yang sama
+            same_doc = docs[1:] == docs[:-1]
+            bigram_keys = (
+                ids[:-1][same_doc] * vocab_size + ids[1:][same_doc] + vocab_size
+            )
+            feature_docs.append(docs[:-1][same_doc])
+            feature_keys.append(bigram_keys)
+            unique_bigrams = np.unique(bigram_keys)
+            names.extend(
+                self.vocabulary[(k - vocab_size) // vocab_size] + ' '
+                + self.vocabulary[(k - vocab_size) % vocab_size]
+                for k in unique_bigrams
+            )
+            key_space.append(unique_bigrams)
+        
+        # Urutkan fitur secara alfabetis (sama seperti sklearn)
+        all_keys = np.concatenate(key_space) if key_space else np.zeros(0, np.int64)
+        order = sorted(range(len(names)), key=names.__getitem__)
+        column_of = np.empty(len(order), dtype=np.int64)
+        column_of[order] = np.arange(len(order))
+        
+        doc_index = np.concatenate(feature_docs) if feature_docs else np.zeros(0, np.int64)
+        keys = np.concatenate(feature_keys) if feature_keys else np.zeros(0, np.int64)
+        columns = column_of[np.searchsorted(all_keys, keys)]
+        
+        counts = csr_matrix(
+            (np.ones(len(keys), dtype=np.int64), (doc_index, columns)),
+            shape=(self.n_docs, len(names))
+        )
+        counts.sum_duplicates()
+        return counts, [names[i] for i in order]